@@ -0,0 +1,187 @@
+"""Micro-benchmarks of the extract path: `PipeIterator`, `ForkPipe`, `Incremental.transform` and `ExtractorStorage` writes.
+
+Each scenario extracts a synthetic source into a temporary `ExtractorStorage` in a separate process and reports items per second
+and the peak RSS of that process. Run from the repository root:
+
+    python -m benchmarks.extract
+    python -m benchmarks.extract --items 200000 --scenario flat_items --scenario flat_pages
+    python -m benchmarks.extract --profile
+
+With `--profile` the time spent in each pipe step is recorded with `PipeStepProfiler` and the slowest steps are printed.
+"""
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Callable, Dict, Iterator, List, NamedTuple, Sequence
+
+import dlt
+from dlt.common import pendulum
+from dlt.common.configuration.container import Container
+from dlt.common.configuration.resolve import inject_section
+from dlt.common.configuration.specs import known_sections
+from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
+from dlt.common.pipeline import StateInjectableContext
+from dlt.common.schema import Schema
+from dlt.common.storages import NormalizeStorageConfiguration
+from dlt.common.typing import TDataItem
+
+from dlt.extract.extract import ExtractorStorage, extract
+from dlt.extract.pipe import PipeIterator, PipeStepProfiler
+from dlt.extract.source import DltResource, DltSource
+
+PAGE_SIZE = 100
+
+
+class ScenarioResult(NamedTuple):
+    scenario: str
+    items: int
+    elapsed: float
+    peak_rss_mb: float
+    steps: Dict[str, float]
+
+
+def _flat_row(i: int) -> TDataItem:
+    return {"id": i, "name": f"name_{i}", "value": i * 0.5, "flag": i % 2 == 0, "created_at": pendulum.datetime(2023, 1, 1).add(seconds=i)}
+
+
+def _nested_row(i: int) -> TDataItem:
+    row = _flat_row(i)
+    row["address"] = {"street": f"street {i}", "city": {"name": "Berlin", "zip": "10115"}}
+    row["tags"] = [{"tag": f"tag_{t}", "weight": t} for t in range(5)]
+    return row
+
+
+def _pages(n: int, row_f: Callable[[int], TDataItem]) -> List[List[TDataItem]]:
+    # generate data upfront so it is not measured
+    rows = [row_f(i) for i in range(n)]
+    return [rows[start:start + PAGE_SIZE] for start in range(0, n, PAGE_SIZE)]
+
+
+def flat_items(n: int) -> Sequence[DltResource]:
+    return [dlt.resource([_flat_row(i) for i in range(n)], name="flat_items")]
+
+
+def flat_pages(n: int) -> Sequence[DltResource]:
+    return [dlt.resource(_pages(n, _flat_row), name="flat_pages")]
+
+
+def nested_pages(n: int) -> Sequence[DltResource]:
+    return [dlt.resource(_pages(n, _nested_row), name="nested_pages")]
+
+
+def transformer(n: int) -> Sequence[DltResource]:
+    parent = dlt.resource(_pages(n, _flat_row), name="parent_pages", selected=False)
+
+    @dlt.transformer(data_from=parent)
+    def enriched(rows: List[TDataItem]) -> Iterator[List[TDataItem]]:
+        yield [dict(row, enriched=True) for row in rows]
+
+    return [parent, enriched]
+
+
+def deferred(n: int) -> Sequence[DltResource]:
+    parent = dlt.resource(_pages(n, _flat_row), name="parent_pages", selected=False)
+
+    @dlt.transformer(data_from=parent)
+    @dlt.defer
+    def enriched_deferred(rows: List[TDataItem]) -> List[TDataItem]:
+        return [dict(row, enriched=True) for row in rows]
+
+    return [parent, enriched_deferred]
+
+
+def incremental_cursor(n: int) -> Sequence[DltResource]:
+
+    pages = _pages(n, _flat_row)
+
+    @dlt.resource(primary_key="id")
+    def incremental_pages(created_at: dlt.sources.incremental[pendulum.DateTime] = dlt.sources.incremental("created_at")) -> Iterator[List[TDataItem]]:
+        yield from pages
+
+    return [incremental_pages()]
+
+
+def dynamic_table(n: int) -> Sequence[DltResource]:
+    return [dlt.resource(_pages(n, _flat_row), name="dynamic_table", table_name=lambda row: "even" if row["flag"] else "odd")]
+
+
+SCENARIOS: Dict[str, Callable[[int], Sequence[DltResource]]] = {
+    "flat_items": flat_items,
+    "flat_pages": flat_pages,
+    "nested_pages": nested_pages,
+    "transformer": transformer,
+    "deferred": deferred,
+    "incremental_cursor": incremental_cursor,
+    "dynamic_table": dynamic_table,
+}
+
+
+def _peak_rss_mb() -> float:
+    import resource
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on mac os, kilobytes on linux
+    return max_rss / 1024 ** 2 if sys.platform == "darwin" else max_rss / 1024
+
+
+@contextlib.contextmanager
+def _source_context(source: DltSource) -> Iterator[None]:
+    # resources using state (ie. incremental) require a state and a source section to be injected, each run starts with empty state
+    with Container().injectable_context(StateInjectableContext(state={})):
+        with inject_section(ConfigSectionContext(sections=(known_sections.SOURCES, source.section, source.name), source_state_key=source.name)):
+            yield
+
+
+def run_scenario(scenario: str, items: int, profile: bool) -> ScenarioResult:
+    """Extracts `items` rows of `scenario` into a temporary storage and returns timing and memory stats"""
+    def _make_source() -> DltSource:
+        # resources are bound to generators so source must be recreated for each run
+        return DltSource(scenario, "benchmarks", Schema(scenario), SCENARIOS[scenario](items))
+
+    source = _make_source()
+    with tempfile.TemporaryDirectory() as storage_path, _source_context(source):
+        storage = ExtractorStorage(NormalizeStorageConfiguration(normalize_volume_path=storage_path))
+        extract_id = storage.create_extract_id()
+        started = time.perf_counter()
+        extract(extract_id, source, storage)
+        elapsed = time.perf_counter() - started
+    peak_rss_mb = _peak_rss_mb()
+
+    steps: Dict[str, float] = {}
+    if profile:
+        # profile pipe steps in a separate run, without writing to storage
+        source = _make_source()
+        with _source_context(source), PipeIterator.from_pipes(source.resources.selected_pipes) as pipes:
+            pipes.step_profiler = profiler = PipeStepProfiler()
+            for _ in pipes:
+                pass
+        steps = {f"{name}[{step}]": step_elapsed for (name, step), step_elapsed in profiler.elapsed.items()}
+    return ScenarioResult(scenario, items, elapsed, peak_rss_mb, steps)
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Runs extract micro-benchmarks, each scenario in a separate process")
+    parser.add_argument("--items", type=int, default=100000, help="Number of rows extracted in each scenario")
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="Scenario to run, may be repeated. Runs all by default")
+    parser.add_argument("--profile", action="store_true", help="Records and prints time spent in each pipe step")
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<20} {'items':>10} {'seconds':>10} {'items/s':>12} {'peak rss MB':>12}")
+    for scenario in args.scenario or SCENARIOS:
+        # separate process for each scenario so the peak rss is not shared
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            result = pool.submit(run_scenario, scenario, args.items, args.profile).result()
+        print(f"{result.scenario:<20} {result.items:>10} {result.elapsed:>10.2f} {result.items / result.elapsed:>12.0f} {result.peak_rss_mb:>12.1f}")
+        for step, elapsed in sorted(result.steps.items(), key=lambda s: s[1], reverse=True):
+            print(f"    {step:<40} {elapsed:>10.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    # do not send telemetry from benchmarks
+    os.environ.setdefault("RUNTIME__DLTHUB_TELEMETRY", "false")
+    sys.exit(main())
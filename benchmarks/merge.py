@@ -0,0 +1,92 @@
+"""Benchmark of the sql generated by `SqlMergeJob`: deletes with `IN` subqueries vs. deletes joining the delete temp table with `DELETE ... USING`.
+
+A nested resource is loaded twice with `merge` write disposition so the destination and staging datasets are populated. Then the merge sql of the
+root table chain is generated with each delete strategy and executed in a transaction that is rolled back, so every run sees the same data.
+Run from the repository root:
+
+    python -m benchmarks.merge
+    python -m benchmarks.merge --destination postgres --items 200000 --repeat 5
+
+Postgres credentials are taken from the usual config providers ie. `DESTINATION__POSTGRES__CREDENTIALS` env variable.
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Sequence
+
+import dlt
+from dlt.common.typing import TDataItem
+
+from dlt.destinations.sql_client import SqlClientBase
+from dlt.destinations.sql_jobs import SqlMergeJob
+
+STRATEGIES = {"in_subquery": False, "delete_using": True}
+
+
+class _RollbackMerge(Exception):
+    pass
+
+
+def _items(start: int, n: int) -> Iterator[TDataItem]:
+    for i in range(start, start + n):
+        yield {"id": i, "name": f"name_{i}", "tags": [{"tag": f"tag_{t}", "weight": t} for t in range(3)]}
+
+
+def _time_merge(sql_client: SqlClientBase[Any], sql: Sequence[str]) -> float:
+    try:
+        with sql_client.begin_transaction():
+            started = time.perf_counter()
+            sql_client.execute_sql("\n".join(sql))
+            elapsed = time.perf_counter() - started
+            raise _RollbackMerge()
+    except _RollbackMerge:
+        pass
+    return elapsed
+
+
+def run_benchmark(destination: str, items: int, repeat: int) -> Dict[str, List[float]]:
+    """Loads `items` rows twice with half of the keys overlapping and times the merge sql of each delete strategy"""
+    pipeline = dlt.pipeline("benchmark_merge", destination=destination, dataset_name="benchmark_merge", full_refresh=True)
+    resource = dlt.resource(_items(0, items), name="items", write_disposition="merge", primary_key="id")
+    pipeline.run(resource)
+    resource = dlt.resource(_items(items // 2, items), name="items", write_disposition="merge", primary_key="id")
+    pipeline.run(resource)
+
+    schema = pipeline.default_schema
+    table_chain = [schema.get_table("items"), schema.get_table("items__tags")]
+    timings: Dict[str, List[float]] = {}
+    with pipeline.sql_client() as sql_client:
+        capabilities = sql_client.capabilities
+        supports_delete_using = capabilities.supports_delete_using
+        try:
+            for strategy, delete_using in STRATEGIES.items():
+                capabilities.supports_delete_using = delete_using
+                sql = SqlMergeJob.generate_sql(table_chain, sql_client)
+                timings[strategy] = [_time_merge(sql_client, sql) for _ in range(repeat)]
+        finally:
+            capabilities.supports_delete_using = supports_delete_using
+        sql_client.drop_dataset()
+        with sql_client.with_staging_dataset(staging=True):
+            sql_client.drop_dataset()
+    return timings
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compares merge sql delete strategies on a local destination")
+    parser.add_argument("--destination", default="duckdb", choices=["duckdb", "postgres"], help="Destination to run the merge sql on")
+    parser.add_argument("--items", type=int, default=100000, help="Number of root table rows in each load")
+    parser.add_argument("--repeat", type=int, default=3, help="How many times the merge sql of each strategy is executed")
+    args = parser.parse_args(argv)
+
+    timings = run_benchmark(args.destination, args.items, args.repeat)
+    print(f"{'strategy':<20} {'min s':>10} {'mean s':>10}")
+    for strategy, elapsed in timings.items():
+        print(f"{strategy:<20} {min(elapsed):>10.3f} {sum(elapsed) / len(elapsed):>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    # do not send telemetry from benchmarks
+    os.environ.setdefault("RUNTIME__DLTHUB_TELEMETRY", "false")
+    sys.exit(main())
@@ -22,3 +22,10 @@ class DestinationCapabilitiesRequired(DataWriterException, ValueError):
     def __init__(self, file_format: TLoaderFileFormat):
         self.file_format = file_format
         super().__init__(f"Writer for {file_format} requires destination capabilities which were not provided.")
+
+
+class CannotCombineFiles(DataWriterException):
+    def __init__(self, file_format: TLoaderFileFormat, reason: str):
+        self.file_format = file_format
+        self.reason = reason
+        super().__init__(f"Cannot combine files in format {file_format}: {reason}")
@@ -1,4 +1,6 @@
 import abc
+import gzip
+import shutil
 
 from dataclasses import dataclass
 from typing import Any, Dict, Sequence, IO, Type, Optional, List, cast
@@ -9,6 +11,7 @@ from dlt.common.schema.typing import TTableSchemaColumns
 from dlt.common.destination import TLoaderFileFormat, DestinationCapabilitiesContext
 from dlt.common.configuration import with_config, known_sections, configspec
 from dlt.common.configuration.specs import BaseConfiguration
+from dlt.common.data_writers.exceptions import CannotCombineFiles
 
 @dataclass
 class TFileFormatSpec:
@@ -48,6 +51,23 @@ class DataWriter(abc.ABC):
     def data_format(cls) -> TFileFormatSpec:
         pass
 
+    @classmethod
+    def combine_files(cls, source_paths: Sequence[str], dest_path: str) -> None:
+        """Combines files at `source_paths` written by this writer into a single file at `dest_path`. Source files are not modified.
+
+        Raises `CannotCombineFiles` if the format does not support combining or the files are not compatible with each other.
+        """
+        raise CannotCombineFiles(cls.data_format().file_format, "format does not support combining files")
+
+    @staticmethod
+    def _is_gzipped(source_paths: Sequence[str], file_format: TLoaderFileFormat) -> bool:
+        from dlt.common.storages.file_storage import FileStorage
+
+        compressed = {FileStorage.is_gzipped(path) for path in source_paths}
+        if len(compressed) > 1:
+            raise CannotCombineFiles(file_format, "compressed and uncompressed files cannot be mixed")
+        return compressed.pop()
+
     @classmethod
     def from_file_format(cls, file_format: TLoaderFileFormat, f: IO[Any], caps: DestinationCapabilitiesContext = None) -> "DataWriter":
         return cls.class_factory(file_format)(f, caps)
@@ -88,6 +108,15 @@ class JsonlWriter(DataWriter):
     def write_footer(self) -> None:
         pass
 
+    @classmethod
+    def combine_files(cls, source_paths: Sequence[str], dest_path: str) -> None:
+        # each file ends with a new line and concatenated gzip members form a valid gzip file so bytes can be just copied
+        cls._is_gzipped(source_paths, cls.data_format().file_format)
+        with open(dest_path, "wb") as dest_f:
+            for path in source_paths:
+                with open(path, "rb") as f:
+                    shutil.copyfileobj(f, dest_f)
+
     @classmethod
     def data_format(cls) -> TFileFormatSpec:
         return TFileFormatSpec(
@@ -166,6 +195,36 @@ class InsertValuesWriter(DataWriter):
         if self._chunks_written > 0:
             self._f.write(";")
 
+    @classmethod
+    def combine_files(cls, source_paths: Sequence[str], dest_path: str) -> None:
+        from dlt.common.storages.file_storage import FileStorage
+
+        file_format = cls.data_format().file_format
+        is_gzipped = cls._is_gzipped(source_paths, file_format)
+        header: str = None
+        values: List[str] = []
+        for path in source_paths:
+            with FileStorage.open_zipsafe_ro(path, "r", encoding="utf-8") as f:
+                file_header = f.readline() + f.readline()
+                # files with different columns cannot share a single INSERT statement
+                if header is None:
+                    header = file_header
+                elif header != file_header:
+                    raise CannotCombineFiles(file_format, f"file {path} has different columns")
+                # strip the footer, files without rows have just a header
+                if content := f.read().rstrip(";"):
+                    values.append(content)
+        dest_f: IO[str]
+        if is_gzipped:
+            dest_f = gzip.open(dest_path, "wt", encoding="utf-8")
+        else:
+            dest_f = open(dest_path, "wt", encoding="utf-8")
+        with dest_f:
+            dest_f.write(header)
+            if values:
+                dest_f.write(",\n".join(values))
+                dest_f.write(";")
+
     @classmethod
     def data_format(cls) -> TFileFormatSpec:
         return TFileFormatSpec(
@@ -237,6 +296,35 @@ class ParquetDataWriter(DataWriter):
         self.writer.close()
         self.writer = None
 
+    @classmethod
+    @with_config(spec=ParquetDataWriterConfiguration)
+    def combine_files(
+        cls,
+        source_paths: Sequence[str],
+        dest_path: str,
+        *,
+        flavor: str = "spark",
+        version: str = "2.4",
+        data_page_size: int = 1024 * 1024
+    ) -> None:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        file_format = cls.data_format().file_format
+        parquet_files = [pyarrow.parquet.ParquetFile(path) for path in source_paths]
+        try:
+            schema = parquet_files[0].schema_arrow
+            for path, parquet_file in zip(source_paths, parquet_files):
+                if not parquet_file.schema_arrow.equals(schema):
+                    raise CannotCombineFiles(file_format, f"file {path} has different schema")
+            # copy row groups one by one with the same writer options as the source files
+            with pyarrow.parquet.ParquetWriter(dest_path, schema, flavor=flavor, version=version, data_page_size=data_page_size) as writer:
+                for parquet_file in parquet_files:
+                    for i in range(parquet_file.num_row_groups):
+                        writer.write_table(parquet_file.read_row_group(i))
+        finally:
+            for parquet_file in parquet_files:
+                parquet_file.close()
+
 
     @classmethod
     def data_format(cls) -> TFileFormatSpec:
@@ -42,6 +42,12 @@ class DestinationCapabilitiesContext(ContainerInjectableContext):
     naming_convention: str = "snake_case"
     alter_add_multi_column: bool = True
     supports_truncate_command: bool = True
+    supports_atomic_sql_jobs: bool = False
+    """All statements of a single sql job are executed in one implicit transaction"""
+    supports_delete_using: bool = False
+    """DELETE ... USING joins are supported and used instead of IN subqueries in merge jobs"""
+    max_files_per_copy_job: int = 1
+    """How many files of a single table may be started together ie. loaded with one COPY statement or uploaded concurrently"""
 
     # do not allow to create default value, destination caps must be always explicitly inserted into container
     can_create_default: ClassVar[bool] = False
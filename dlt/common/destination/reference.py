@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from importlib import import_module
 from types import TracebackType, ModuleType
-from typing import ClassVar, Final, Optional, Literal, Sequence, Iterable, Type, Protocol, Union, TYPE_CHECKING, cast, List, ContextManager
+from typing import ClassVar, Final, Optional, Literal, Sequence, Iterable, Type, Protocol, Union, TYPE_CHECKING, cast, List, ContextManager, Iterator
 from contextlib import contextmanager
 
 from dlt.common import logger
@@ -12,7 +12,7 @@ from dlt.common.schema.exceptions import InvalidDatasetName
 from dlt.common.configuration import configspec
 from dlt.common.configuration.specs import BaseConfiguration, CredentialsConfiguration
 from dlt.common.configuration.accessors import config
-from dlt.common.destination.capabilities import DestinationCapabilitiesContext
+from dlt.common.destination.capabilities import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.schema.utils import is_complete_column
 from dlt.common.storages import FileStorage
 from dlt.common.storages.load_storage import ParsedLoadJobFileName
@@ -50,6 +50,8 @@ class DestinationClientDwhConfiguration(DestinationClientConfiguration):
     staging_credentials: Optional[CredentialsConfiguration] = None
     """How to handle replace disposition for this destination, can be classic or staging"""
     replace_strategy: TLoaderReplaceStrategy = "truncate-and-insert"
+    merge_deduplicate: bool = True
+    """Deduplicates staging rows by primary key when merging. Disable only if primary keys are unique within each load package"""
 
     if TYPE_CHECKING:
         def __init__(
@@ -137,6 +139,14 @@ class FollowupJob:
         return []
 
 
+class PolledJob:
+    """Adds a trait that allows to refresh states of many remote jobs of the same type with a single request"""
+    @classmethod
+    def poll_states(cls, jobs: Sequence[LoadJob]) -> None:
+        """Refreshes states of `jobs` so the subsequent `state` calls do not need to poll the remote resource one by one"""
+        pass
+
+
 class JobClientBase(ABC):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = None
@@ -176,6 +186,19 @@ class JobClientBase(ABC):
         """Creates and starts a load job for a particular `table` with content in `file_path`"""
         pass
 
+    def get_max_files_per_copy_job(self, file_format: TLoaderFileFormat) -> int:
+        """How many files of `file_format` of a single table may be started together with `start_file_loads`. Defaults to `max_files_per_copy_job` capability"""
+        return self.capabilities.max_files_per_copy_job
+
+    def start_file_loads(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> Iterator[LoadJob]:
+        """Creates and starts load jobs for several files of the same `table`. Used when destination capabilities allow more than one file per copy job.
+
+        Jobs are yielded as soon as the files are started. If an exception is raised, the files without a job were not loaded and are started again one by one.
+        Destinations that load many files with a single statement override it. Default implementation starts a job for each file separately.
+        """
+        for file_path in file_paths:
+            yield self.start_file_load(table, file_path, load_id)
+
     @abstractmethod
     def restore_file_load(self, file_path: str) -> LoadJob:
         """Finds and restores already started loading job identified by `file_path` if destination supports it."""
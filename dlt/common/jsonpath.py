@@ -1,9 +1,9 @@
-from typing import Iterable, Union, List, Any
+from typing import Iterable, Optional, Union, List, Any
 from itertools import chain
 
 from dlt.common.typing import DictStrAny
 
-from jsonpath_ng import parse as _parse, JSONPath
+from jsonpath_ng import parse as _parse, JSONPath, Fields as JSONPathFields
 
 
 TJsonPath = Union[str, JSONPath]  # Jsonpath compiled or str
@@ -36,6 +36,14 @@ def find_values(path: TJsonPath, data: DictStrAny) -> List[Any]:
     return [m.value for m in path.find(data)]
 
 
+def single_field_name(path: TJsonPath) -> Optional[str]:
+    """Returns the field name if `path` selects a single top level field, ie. `created_at`. Returns None for all other paths"""
+    path = compile_path(path)
+    if isinstance(path, JSONPathFields) and len(path.fields) == 1 and path.fields[0] != "*":
+        return path.fields[0]  # type: ignore[no-any-return]
+    return None
+
+
 def resolve_paths(paths: TAnyJsonPath, data: DictStrAny) -> List[str]:
     """Return a list of paths resolved against `data`. The return value is a list of strings.
 
@@ -1,5 +1,6 @@
+from dlt.common import json
 from dlt.common.exceptions import MissingDependencyException
-from typing import Any, Tuple
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple
 
 from dlt.common.destination.capabilities import DestinationCapabilitiesContext
 
@@ -43,3 +44,47 @@ def get_py_arrow_numeric(precision: Tuple[int, int]) -> Any:
         return pyarrow.decimal256(*precision)
     # for higher precision use max precision and trim scale to leave the most significant part
     return pyarrow.decimal256(76, max(0, 76 - (precision[0] - precision[1])))
+
+
+def rows_to_arrow_table(rows: Sequence[Sequence[Any]], columns: Sequence[str], schema: Any = None) -> Any:
+    """Converts `rows` given as tuples into Arrow table with `columns`.
+
+    Column types are taken from `schema` if present, null typed columns and columns without `schema` are inferred from the values.
+    Dicts and lists that cannot be converted into a single Arrow type (ie. with different value types) are converted into json strings.
+    """
+    column_values = list(zip(*rows)) if rows else [()] * len(columns)
+    arrays = []
+    for idx, values in enumerate(column_values):
+        arrow_type = schema.field(idx).type if schema is not None else None
+        if arrow_type is not None and pyarrow.types.is_null(arrow_type):
+            arrow_type = None
+        try:
+            arrays.append(pyarrow.array(values, type=arrow_type))
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            values = [json.dumps(v) if isinstance(v, (dict, list)) else v for v in values]
+            arrays.append(pyarrow.array(values, type=arrow_type if arrow_type is not None and pyarrow.types.is_string(arrow_type) else None))
+    return pyarrow.Table.from_arrays(arrays, names=list(columns))
+
+
+def concat_tables_promoted(tables: Sequence[Any]) -> Any:
+    """Concatenates Arrow `tables` with different schemas, columns missing in some of the tables are null"""
+    if int(pyarrow.__version__.split(".")[0]) >= 14:
+        return pyarrow.concat_tables(tables, promote_options="default")
+    return pyarrow.concat_tables(tables, promote=True)
+
+
+def rechunk_arrow_tables(tables: Iterable[Any], chunk_size: int) -> Iterator[Any]:
+    """Yields Arrow tables with `chunk_size` rows taken from `tables`, the last table may be shorter. Tables are sliced without copying data"""
+    pending: List[Any] = []
+    pending_rows = 0
+    for table in tables:
+        while table.num_rows > 0:
+            take = min(chunk_size - pending_rows, table.num_rows)
+            pending.append(table.slice(0, take))
+            pending_rows += take
+            table = table.slice(take)
+            if pending_rows == chunk_size:
+                yield pending[0] if len(pending) == 1 else pyarrow.concat_tables(pending)
+                pending, pending_rows = [], 0
+    if pending_rows > 0:
+        yield pending[0] if len(pending) == 1 else pyarrow.concat_tables(pending)
@@ -255,6 +255,12 @@ class FileStorage:
             else:
                 os.remove(name)
 
+    @staticmethod
+    def is_gzipped(path: str) -> bool:
+        """Checks if file at `path` starts with gzip magic number"""
+        with open(path, "rb") as f:
+            return f.read(2) == b"\x1f\x8b"
+
     @staticmethod
     def open_zipsafe_ro(path: str, mode: str = "r", **kwargs: Any) -> IO[Any]:
         """Opens a file using gzip.open if it is a gzip file, otherwise uses open."""
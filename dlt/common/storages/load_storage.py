@@ -6,14 +6,15 @@ import humanize
 from os.path import join
 from pathlib import Path
 from pendulum.datetime import DateTime
-from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, get_args, cast
+from typing import Dict, Iterable, List, NamedTuple, Literal, Optional, Sequence, Set, Tuple, get_args, cast
 
-from dlt.common import json, pendulum
+from dlt.common import json, logger, pendulum
 from dlt.common.configuration import known_sections
 from dlt.common.configuration.inject import with_config
 from dlt.common.typing import DictStrAny, StrAny
 from dlt.common.storages.file_storage import FileStorage
 from dlt.common.data_writers import TLoaderFileFormat, DataWriter
+from dlt.common.data_writers.exceptions import CannotCombineFiles
 from dlt.common.configuration.accessors import config
 from dlt.common.exceptions import TerminalValueError
 from dlt.common.schema import Schema, TSchemaTables, TTableSchemaColumns
@@ -21,7 +22,7 @@ from dlt.common.storages.configuration import LoadStorageConfiguration
 from dlt.common.storages.versioned_storage import VersionedStorage
 from dlt.common.storages.data_item_storage import DataItemStorage
 from dlt.common.storages.exceptions import JobWithUnsupportedWriterException, LoadPackageNotFound
-from dlt.common.utils import flatten_list_or_items
+from dlt.common.utils import flatten_list_or_items, uniq_id
 
 
 # folders to manage load jobs in a single load package
@@ -190,6 +191,50 @@ class LoadStorage(DataItemStorage, VersionedStorage):
             writer.write_all(table, rows)
         return Path(file_name).name
 
+    def combine_temp_job_files(self, load_id: str, max_bytes: int) -> int:
+        """Combines job files of the same table and format in a temporary load package into files of up to `max_bytes` size.
+
+        Files that are already larger than `max_bytes` are left untouched. Files that cannot be combined (ie. because the table schema changed
+        between them) are kept as they are. Returns the number of job files removed from the package.
+        """
+        new_jobs_folder = join(load_id, LoadStorage.NEW_JOBS_FOLDER)
+        groups: Dict[Tuple[str, TLoaderFileFormat], List[Tuple[str, int]]] = {}
+        for file in self.storage.list_folder_files(new_jobs_folder):
+            job = LoadStorage.parse_job_file_name(file)
+            file_size = os.path.getsize(self.storage.make_full_path(file))
+            if file_size < max_bytes:
+                groups.setdefault((job.table_name, job.file_format), []).append((file, file_size))
+
+        removed_count = 0
+        for (table_name, file_format), files in groups.items():
+            # pack files greedily up to max_bytes
+            packs: List[List[str]] = [[]]
+            pack_size = 0
+            for file, file_size in sorted(files):
+                if packs[-1] and pack_size + file_size > max_bytes:
+                    packs.append([])
+                    pack_size = 0
+                packs[-1].append(file)
+                pack_size += file_size
+            for pack in packs:
+                if len(pack) > 1 and self._combine_job_files(new_jobs_folder, table_name, file_format, pack):
+                    removed_count += len(pack) - 1
+        return removed_count
+
+    def _combine_job_files(self, folder: str, table_name: str, file_format: TLoaderFileFormat, files: Sequence[str]) -> bool:
+        file_name = ParsedLoadJobFileName(table_name, uniq_id(), 0, file_format).job_id()
+        dest_path = self.storage.make_full_path(join(folder, file_name))
+        try:
+            DataWriter.class_factory(file_format).combine_files([self.storage.make_full_path(f) for f in files], dest_path)
+        except CannotCombineFiles as ex:
+            logger.info(f"Job files of table {table_name} will not be combined: {ex}")
+            if self.storage.has_file(join(folder, file_name)):
+                self.storage.delete(join(folder, file_name))
+            return False
+        for file in files:
+            self.storage.delete(file)
+        return True
+
     def load_package_schema(self, load_id: str) -> Schema:
         # load schema from a load package to be processed
         schema_path = join(self.get_package_path(load_id), LoadStorage.SCHEMA_FILE_NAME)
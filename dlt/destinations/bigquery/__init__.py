@@ -33,6 +33,8 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.max_text_data_type_length = 10 * 1024 * 1024
     caps.is_max_text_data_type_length_in_bytes = True
     caps.supports_ddl_transactions = False
+    # small local files of a table may be written together with Storage Write API, used only if `storage_write_max_bytes` is set
+    caps.max_files_per_copy_job = 100
 
     return caps
 
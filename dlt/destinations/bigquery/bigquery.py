@@ -1,26 +1,28 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import ClassVar, Dict, Optional, Sequence, Tuple, List, cast, Type, Any
+from typing import ClassVar, Dict, Iterable, Iterator, Optional, Sequence, Tuple, List, cast, Type, Any
 import google.cloud.bigquery as bigquery  # noqa: I250
 from google.cloud import exceptions as gcp_exceptions
 from google.api_core import exceptions as api_core_exceptions
 
 from dlt.common import json, logger
-from dlt.common.destination import DestinationCapabilitiesContext
-from dlt.common.destination.reference import FollowupJob, NewLoadJob, TLoadJobState, LoadJob
+from dlt.common.exceptions import MissingDependencyException
+from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
+from dlt.common.destination.reference import FollowupJob, NewLoadJob, PolledJob, TLoadJobState, LoadJob
 from dlt.common.data_types import TDataType
 from dlt.common.storages.file_storage import FileStorage
 from dlt.common.schema import TColumnSchema, Schema, TTableSchemaColumns
 from dlt.common.schema.typing import TTableSchema, TWriteDisposition
 
-from dlt.destinations.job_client_impl import SqlJobClientBase
-from dlt.destinations.exceptions import DestinationSchemaWillNotUpdate, DestinationTransientException, LoadJobNotExistsException, LoadJobTerminalException, LoadJobUnknownTableException
+from dlt.destinations.job_client_impl import SqlJobClientBase, SqlLoadJob
+from dlt.destinations.exceptions import DestinationSchemaWillNotUpdate, DestinationTransientException, LoadJobCommitUnknownException, LoadJobNotExistsException, LoadJobTerminalException, LoadJobUnknownTableException
 
 from dlt.destinations.bigquery import capabilities
 from dlt.destinations.bigquery.configuration import BigQueryClientConfiguration
 from dlt.destinations.bigquery.sql_client import BigQuerySqlClient, BQ_TERMINAL_REASONS
 from dlt.destinations.sql_jobs import SqlMergeJob, SqlStagingCopyJob
-from dlt.destinations.job_impl import NewReferenceJob
+from dlt.destinations.job_impl import EmptyLoadJob, NewReferenceJob
 from dlt.destinations.sql_client import SqlClientBase
 
 from dlt.common.schema.utils import table_schema_has_type
@@ -51,7 +53,7 @@ BQT_TO_SCT: Dict[str, TDataType] = {
     "JSON": "complex"
 }
 
-class BigQueryLoadJob(LoadJob, FollowupJob):
+class BigQueryLoadJob(LoadJob, FollowupJob, PolledJob):
     def __init__(
         self,
         file_name: str,
@@ -62,11 +64,37 @@ class BigQueryLoadJob(LoadJob, FollowupJob):
         self.bq_load_job = bq_load_job
         self.default_retry = bigquery.DEFAULT_RETRY.with_deadline(retry_deadline)
         self.http_timeout = http_timeout
+        # set when state was refreshed by poll_states
+        self._state_polled = False
         super().__init__(file_name)
 
+    @classmethod
+    def poll_states(cls, jobs: Sequence[LoadJob]) -> None:
+        # a single list request returns all jobs that finished since the oldest job was created, jobs not on the list are still running
+        bq_jobs: Dict[str, List["BigQueryLoadJob"]] = {}
+        for job in cast(Sequence[BigQueryLoadJob], jobs):
+            if job.bq_load_job.created is not None:
+                bq_jobs.setdefault(job.bq_load_job.project, []).append(job)
+        for project, project_jobs in bq_jobs.items():
+            first_job = project_jobs[0]
+            by_id = {job.bq_load_job.job_id: job for job in project_jobs}
+            done_jobs = first_job.bq_load_job._client.list_jobs(
+                project=project,
+                state_filter="done",
+                min_creation_time=min(job.bq_load_job.created for job in project_jobs),
+                retry=first_job.default_retry,
+                timeout=first_job.http_timeout
+            )
+            for done_job in done_jobs:
+                if job := by_id.get(done_job.job_id):
+                    job.bq_load_job = done_job
+            for job in project_jobs:
+                job._state_polled = True
+
     def state(self) -> TLoadJobState:
-        # check server if done
-        done = self.bq_load_job.done(retry=self.default_retry, timeout=self.http_timeout)
+        # check server if done, unless the state was just polled with other jobs
+        done = self.bq_load_job.done(retry=self.default_retry, timeout=self.http_timeout, reload=not self._state_polled)
+        self._state_polled = False
         if done:
             # rows processed
             if self.bq_load_job.output_rows is not None and self.bq_load_job.error_result is None:
@@ -114,6 +142,12 @@ class BigQueryMergeJob(SqlMergeJob):
             sql.append(f"FROM {root_table_name} AS d WHERE EXISTS (SELECT 1 FROM {staging_root_table_name} AS s WHERE {clause.format(d='d', s='s')})")
         return sql
 
+    @classmethod
+    def gen_delete_from_sql(cls, table_name: str, column_name: str, temp_table_name: str, temp_table_column: str, sql_client: SqlClientBase[Any]) -> str:
+        # BigQuery does not support DELETE ... USING, MERGE joins the delete temp table instead
+        qualified_table_name = sql_client.make_qualified_table_name(table_name)
+        return f"MERGE {qualified_table_name} AS d USING {temp_table_name} AS t ON d.{column_name} = t.{temp_table_column} WHEN MATCHED THEN DELETE;"
+
 class BigqueryStagingCopyJob(SqlStagingCopyJob):
 
     @classmethod
@@ -123,15 +157,15 @@ class BigqueryStagingCopyJob(SqlStagingCopyJob):
             with sql_client.with_staging_dataset(staging=True):
                 staging_table_name = sql_client.make_qualified_table_name(table["name"])
             table_name = sql_client.make_qualified_table_name(table["name"])
-            # drop destination table
-            sql.append(f"DROP TABLE IF EXISTS {table_name};")
-            # recreate destination table with data cloned from staging table
-            sql.append(f"CREATE TABLE {table_name} CLONE {staging_table_name};")
+            # replace destination table with a table copy of the staging table in a single statement
+            sql.append(f"CREATE OR REPLACE TABLE {table_name} COPY {staging_table_name};")
         return sql
 
 class BigQueryClient(SqlJobClientBase):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
+    STORAGE_TABLES_WORKERS: ClassVar[int] = 16
+    """How many tables are introspected concurrently"""
 
     def __init__(self, schema: Schema, config: BigQueryClientConfiguration) -> None:
         sql_client = BigQuerySqlClient(
@@ -146,7 +180,7 @@ class BigQueryClient(SqlJobClientBase):
         self.sql_client: BigQuerySqlClient = sql_client  # type: ignore
 
     def _create_merge_job(self, table_chain: Sequence[TTableSchema]) -> NewLoadJob:
-        return BigQueryMergeJob.from_table_chain(table_chain, self.sql_client)
+        return BigQueryMergeJob.from_table_chain(table_chain, self.sql_client, deduplicate=self.config.merge_deduplicate)
 
     def _create_optimized_replace_job(self, table_chain: Sequence[TTableSchema]) -> NewLoadJob:
         return BigqueryStagingCopyJob.from_table_chain(table_chain, self.sql_client)
@@ -182,8 +216,38 @@ class BigQueryClient(SqlJobClientBase):
         return job
 
     def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
-        job = super().start_file_load(table, file_path, load_id)
+        return next(self.start_file_loads(table, [file_path], load_id))
+
+    def start_file_loads(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> Iterator[LoadJob]:
+        """Writes small local files of `table` with Storage Write API, otherwise starts a load job for each file
 
+        Files are written when their total size is below `storage_write_max_bytes`. The rows of all files are committed together
+        so load jobs are started instead if writing fails before the commit. If the outcome of the commit is not known, the jobs fail
+        without loading the files again so the rows are not duplicated.
+        """
+        if self._use_storage_write_api(file_paths):
+            try:
+                # all the rows are written before the first job is yielded
+                yield from self._write_files(table, file_paths)
+                return
+            except LoadJobCommitUnknownException as commit_ex:
+                logger.error(str(commit_ex))
+                for file_path in file_paths:
+                    yield EmptyLoadJob.from_file_path(file_path, "failed", str(commit_ex))
+                return
+            except (api_core_exceptions.GoogleAPICallError, DestinationTransientException, MissingDependencyException) as ex:
+                logger.warning(f"Could not write {len(file_paths)} files of table {table['name']} with Storage Write API, will start load jobs instead: {ex}")
+        for file_path in file_paths:
+            yield self._start_load_job(table, file_path, load_id)
+
+    def get_max_files_per_copy_job(self, file_format: TLoaderFileFormat) -> int:
+        # files are started together only to be written with Storage Write API, otherwise each file gets its own load job
+        if self.config.storage_write_max_bytes:
+            return self.capabilities.max_files_per_copy_job
+        return 1
+
+    def _start_load_job(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        job = super().start_file_load(table, file_path, load_id)
         if not job:
             try:
                 job = BigQueryLoadJob(
@@ -255,6 +319,15 @@ class BigQueryClient(SqlJobClientBase):
         except gcp_exceptions.NotFound:
             return False, schema_table
 
+    def get_storage_tables(self, table_names: Iterable[str]) -> Dict[str, TTableSchemaColumns]:
+        # INFORMATION_SCHEMA queries are billed and slow to start on BigQuery, get table metadata concurrently instead
+        table_names = list(table_names)
+        if not table_names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(table_names), self.STORAGE_TABLES_WORKERS)) as pool:
+            storage_tables = pool.map(self.get_storage_table, table_names)
+            return {table_name: table for table_name, (exists, table) in zip(table_names, storage_tables) if exists}
+
     def _create_load_job(self, table: TTableSchema, file_path: str) -> bigquery.LoadJob:
         # append to table for merge loads (append to stage) and regular appends
         table_name = table["name"]
@@ -305,6 +378,34 @@ class BigQueryClient(SqlJobClientBase):
                     timeout=self.config.file_upload_timeout
                 )
 
+    def _use_storage_write_api(self, file_paths: Sequence[str]) -> bool:
+        if not self.config.storage_write_max_bytes:
+            return False
+        if any(NewReferenceJob.is_reference_job(file_path) or SqlLoadJob.is_sql_job(file_path) for file_path in file_paths):
+            return False
+        return sum(os.path.getsize(file_path) for file_path in file_paths) < self.config.storage_write_max_bytes
+
+    def _create_write_client(self) -> Any:
+        from dlt.destinations.bigquery import write_api
+
+        return write_api.create_write_client(self.config.credentials.to_native_credentials())
+
+    def _write_files(self, table: TTableSchema, file_paths: Sequence[str]) -> List[LoadJob]:
+        from dlt.destinations.bigquery import write_api
+
+        arrow_tables = [write_api.read_arrow_table(file_path, table, self.capabilities) for file_path in file_paths]
+        with self._create_write_client() as write_client:
+            row_count = write_api.write_arrow_tables(
+                write_client,
+                self.config.credentials.project_id,
+                self.sql_client.dataset_name,
+                table["name"],
+                arrow_tables,
+                [FileStorage.get_file_name_from_file_path(file_path) for file_path in file_paths]
+            )
+        logger.info(f"Wrote {row_count} rows from {len(file_paths)} files to table {table['name']} with Storage Write API")
+        return [EmptyLoadJob.from_file_path(file_path, "completed") for file_path in file_paths]
+
     def _retrieve_load_job(self, file_path: str) -> bigquery.LoadJob:
         job_id = BigQueryLoadJob.get_job_id_from_file_path(file_path)
         return cast(bigquery.LoadJob, self.sql_client.native_connection.get_job(job_id))
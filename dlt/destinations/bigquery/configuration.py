@@ -17,6 +17,8 @@ class BigQueryClientConfiguration(DestinationClientDwhConfiguration):
     http_timeout: float = 15.0  # connection timeout for http request to BigQuery api
     file_upload_timeout: float = 30 * 60.0  # a timeout for file upload when loading local files
     retry_deadline: float = 60.0  # how long to retry the operation in case of error, the backoff 60s
+    storage_write_max_bytes: int = 0
+    """Local files of a table smaller than that in total are written with Storage Write API instead of a load job per file, 0 disables"""
 
     __config_gen_annotations__: ClassVar[List[str]] = ["location"]
 
@@ -44,7 +46,8 @@ class BigQueryClientConfiguration(DestinationClientDwhConfiguration):
             location: str = "US",
             http_timeout: float = 15.0,
             file_upload_timeout: float = 30 * 60.0,
-            retry_deadline: float = 60.0
+            retry_deadline: float = 60.0,
+            storage_write_max_bytes: int = 0
         ) -> None:
             ...
 
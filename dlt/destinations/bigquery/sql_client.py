@@ -13,7 +13,7 @@ from dlt.common.configuration.specs import GcpServiceAccountCredentialsWithoutDe
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.typing import StrAny
 
-from dlt.destinations.typing import DBApi, DBApiCursor, DBTransaction, DataFrame
+from dlt.destinations.typing import ArrowTable, DBApi, DBApiCursor, DBTransaction
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 from dlt.destinations.sql_client import DBApiCursorImpl, SqlClientBase, raise_database_error, raise_open_connection_error
 
@@ -26,20 +26,26 @@ BQ_TERMINAL_REASONS = ["billingTierLimitExceeded", "duplicate", "invalid", "notF
 
 
 class BigQueryDBApiCursorImpl(DBApiCursorImpl):
-    """Use native BigQuery data frame support if available"""
-    native_cursor: BQDbApiCursor  # type: ignore
+    """Use native BigQuery Arrow support"""
+    native_arrow = True
 
-    def df(self, chunk_size: int = None, **kwargs: Any) -> DataFrame:
-        query_job: bigquery.QueryJob = self.native_cursor._query_job
+    native_cursor: BQDbApiCursor
 
-        if chunk_size is None:
-            try:
-                return query_job.to_dataframe(**kwargs)
-            except ValueError:
-                # no pyarrow/db-types, fallback to our implementation
-                return super().df()
-        else:
-            return super().df(chunk_size=chunk_size)
+    def iter_arrow(self, chunk_size: int, **kwargs: Any) -> Iterator[ArrowTable]:
+        from dlt.common.libs.pyarrow import pyarrow, rechunk_arrow_tables
+
+        # pages of the requested size are downloaded with the REST api
+        rows = self.native_cursor._query_job.result(page_size=chunk_size)
+        if not hasattr(rows, "to_arrow_iterable"):
+            # older client versions
+            yield from super().iter_arrow(chunk_size, **kwargs)
+            return
+        yield from rechunk_arrow_tables((pyarrow.Table.from_batches([batch]) for batch in rows.to_arrow_iterable(**kwargs)), chunk_size)
+
+    def _fetch_arrow_all(self, **kwargs: Any) -> ArrowTable:
+        # uses Storage Read API if google-cloud-bigquery-storage is installed
+        query_job: bigquery.QueryJob = self.native_cursor._query_job
+        return query_job.to_arrow(**kwargs)
 
 
 class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
@@ -85,7 +91,7 @@ class BigQuerySqlClient(SqlClientBase[bigquery.Client], DBTransaction):
         ) -> Any:
             return query_orig(query, retry=retry, timeout=timeout, **kwargs)
 
-        self._client.query = query_patch  # type: ignore
+        self._client.query = query_patch
         return self._client
 
     def close_connection(self) -> None:
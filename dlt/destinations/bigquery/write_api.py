@@ -0,0 +1,116 @@
+"""Loads small batches of files with BigQuery Storage Write API instead of load jobs.
+
+Rows of all files of a table are appended to a single pending stream as Arrow record batches. The stream is finalized and committed
+when all rows were appended, so the data of all files becomes visible atomically or not at all.
+"""
+import os
+from typing import Any, Dict, Iterator, List, Sequence
+
+from dlt.common import json
+from dlt.common.exceptions import MissingDependencyException
+from dlt.common.data_types import coerce_value, py_type_to_sc_type
+from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.libs.pyarrow import pyarrow, get_py_arrow_datatype
+from dlt.common.schema.typing import TTableSchema
+from dlt.common.storages.file_storage import FileStorage
+
+from dlt.destinations.exceptions import DestinationTransientException, LoadJobCommitUnknownException
+
+try:
+    from google.cloud.bigquery_storage_v1 import BigQueryWriteClient, types as write_types
+except ImportError:
+    raise MissingDependencyException("BigQuery Storage Write API", ["google-cloud-bigquery-storage>=2.25.0"], "Storage Write API client is needed to load small packages without load jobs.")
+
+# a single append request may not exceed 10MB, leave space for the schema and the request envelope
+MAX_REQUEST_BYTES = 8 * 1024 * 1024
+
+
+def create_write_client(credentials: Any) -> BigQueryWriteClient:
+    return BigQueryWriteClient(credentials=credentials)
+
+
+def get_arrow_schema(table: TTableSchema, caps: DestinationCapabilitiesContext) -> Any:
+    fields = []
+    for column in table["columns"].values():
+        data_type = column["data_type"]
+        # BigQuery keeps timestamps with microsecond precision
+        arrow_type = pyarrow.timestamp("us", tz="UTC") if data_type == "timestamp" else get_py_arrow_datatype(data_type, caps)
+        fields.append(pyarrow.field(column["name"], arrow_type, nullable=column.get("nullable", True)))
+    return pyarrow.schema(fields)
+
+
+def read_arrow_table(file_path: str, table: TTableSchema, caps: DestinationCapabilitiesContext) -> Any:
+    """Reads parquet or jsonl load file into Arrow table with columns of `table`"""
+    ext = os.path.splitext(file_path)[1][1:]
+    if ext == "parquet":
+        return pyarrow.parquet.read_table(file_path)
+    if ext != "jsonl":
+        raise ValueError(ext)
+    columns = table["columns"]
+    rows: List[Dict[str, Any]] = []
+    with FileStorage.open_zipsafe_ro(file_path, "rb") as f:
+        for line in f:
+            row = json.loadb(line)
+            for name, value in row.items():
+                if value is None:
+                    continue
+                data_type = columns[name]["data_type"]
+                if data_type == "complex":
+                    row[name] = json.dumps(value)
+                else:
+                    row[name] = coerce_value(data_type, py_type_to_sc_type(type(value)), value)
+            rows.append(row)
+    return pyarrow.Table.from_pylist(rows, schema=get_arrow_schema(table, caps))
+
+
+def _append_requests(stream_name: str, arrow_tables: Sequence[Any]) -> Iterator[Any]:
+    for arrow_table in arrow_tables:
+        if arrow_table.num_rows == 0:
+            continue
+        writer_schema = write_types.ArrowSchema(serialized_schema=arrow_table.schema.serialize().to_pybytes())
+        # split the table so each request stays below the request size limit
+        max_rows = max(1, arrow_table.num_rows * MAX_REQUEST_BYTES // max(arrow_table.nbytes, 1))
+        for batch in arrow_table.to_batches(max_chunksize=max_rows):
+            yield write_types.AppendRowsRequest(
+                write_stream=stream_name,
+                arrow_rows=write_types.AppendRowsRequest.ArrowData(
+                    writer_schema=writer_schema,
+                    rows=write_types.ArrowRecordBatch(serialized_record_batch=batch.serialize().to_pybytes())
+                )
+            )
+
+
+def write_arrow_tables(
+    write_client: BigQueryWriteClient,
+    project_id: str,
+    dataset_name: str,
+    table_name: str,
+    arrow_tables: Sequence[Any],
+    file_names: Sequence[str] = ()
+) -> int:
+    """Appends `arrow_tables` to a pending stream of `table_name` and commits it. Returns number of rows written.
+
+    Nothing is written if any of the steps before the commit fails or if the commit returns stream errors, so the files may be loaded again with load jobs.
+    If the commit request itself fails, the rows may be already committed and `LoadJobCommitUnknownException` with `file_names` is raised.
+    """
+    parent = write_client.table_path(project_id, dataset_name, table_name)
+    stream = write_client.create_write_stream(
+        parent=parent,
+        write_stream=write_types.WriteStream(type_=write_types.WriteStream.Type.PENDING)
+    )
+    for response in write_client.append_rows(_append_requests(stream.name, arrow_tables)):
+        if response.error.code:
+            raise DestinationTransientException(f"Appending rows to stream {stream.name} failed: {response.error.message}")
+        if response.row_errors:
+            raise DestinationTransientException(f"Rows rejected by stream {stream.name}: {[e.message for e in response.row_errors]}")
+    row_count: int = write_client.finalize_write_stream(name=stream.name).row_count
+    try:
+        commit = write_client.batch_commit_write_streams(
+            write_types.BatchCommitWriteStreamsRequest(parent=parent, write_streams=[stream.name])
+        )
+    except Exception as ex:
+        # the commit could be applied even if the response did not arrive
+        raise LoadJobCommitUnknownException(file_names, f"commit of stream {stream.name} failed with {ex}") from ex
+    if commit.stream_errors:
+        raise DestinationTransientException(f"Commit of stream {stream.name} failed: {[e.error_message for e in commit.stream_errors]}")
+    return row_count
@@ -23,6 +23,10 @@ class DuckDbBaseCredentials(ConnectionStringCredentials):
     database: Optional[str] = None
 
     read_only: bool = False  # open database read/write
+    threads: Optional[int] = None
+    """How many threads duckdb uses to execute queries, duckdb default is the number of cores"""
+    memory_limit: Optional[str] = None
+    """Maximum memory of the database ie. 4GB, duckdb default is 80% of RAM"""
 
     def borrow_conn(self, read_only: bool) -> Any:
         import duckdb
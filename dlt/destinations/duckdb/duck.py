@@ -1,13 +1,17 @@
-from typing import ClassVar, Dict, Optional
+from importlib.metadata import version as pkg_version
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Sequence
 
-from dlt.common.destination import DestinationCapabilitiesContext
+from dlt.common.destination import DestinationCapabilitiesContext, TLoaderFileFormat
 from dlt.common.data_types import TDataType
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
-from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
+from dlt.common.destination.reference import LoadJob, FollowupJob, NewLoadJob, TLoadJobState
 from dlt.common.schema.typing import TTableSchema, TWriteDisposition
 from dlt.common.storages.file_storage import FileStorage
 
 from dlt.destinations.insert_job_client import InsertValuesJobClient
+from dlt.destinations.job_impl import EmptyLoadJob
+from dlt.destinations.sql_client import SqlClientBase
+from dlt.destinations.sql_jobs import SqlStagingCopyJob
 
 from dlt.destinations.duckdb import capabilities
 from dlt.destinations.duckdb.sql_client import DuckDbSqlClient
@@ -65,6 +69,15 @@ class DuckDbCopyJob(LoadJob, FollowupJob):
     def exception(self) -> str:
         raise NotImplementedError()
 
+class DuckDbStagingCopyJob(SqlStagingCopyJob):
+
+    @classmethod
+    def generate_sql(cls, table_chain: Sequence[TTableSchema], sql_client: SqlClientBase[Any]) -> List[str]:
+        # tables cannot be moved between schemas so the destination tables are kept with their constraints
+        # and replaced in a single transaction
+        return ["BEGIN TRANSACTION;"] + super().generate_sql(table_chain, sql_client) + ["COMMIT;"]
+
+
 class DuckDbClient(InsertValuesJobClient):
 
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
@@ -85,6 +98,41 @@ class DuckDbClient(InsertValuesJobClient):
             job = DuckDbCopyJob(table["name"], file_path, self.sql_client)
         return job
 
+    @staticmethod
+    def supports_insert_by_name() -> bool:
+        """INSERT ... BY NAME is available from duckdb 0.8.0"""
+        return tuple(int(v) for v in pkg_version("duckdb").split(".")[:2]) >= (0, 8)
+
+    def get_max_files_per_copy_job(self, file_format: TLoaderFileFormat) -> int:
+        # only parquet files are loaded together with a single INSERT, other formats are loaded one by one
+        if file_format == "parquet" and self.supports_insert_by_name():
+            return self.capabilities.max_files_per_copy_job
+        return 1
+
+    def start_file_loads(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> Iterator[LoadJob]:
+        """Loads all parquet files with a single INSERT reading them with read_parquet so duckdb scans them with all its threads
+
+        Files are loaded one by one on duckdb versions without INSERT ... BY NAME
+        """
+        parquet_paths = [file_path for file_path in file_paths if file_path.endswith("parquet")]
+        if len(parquet_paths) < 2 or not self.supports_insert_by_name():
+            yield from super().start_file_loads(table, file_paths, load_id)
+            return
+        for file_path in file_paths:
+            if not file_path.endswith("parquet"):
+                yield self.start_file_load(table, file_path, load_id)
+        qualified_table_name = self.sql_client.make_qualified_table_name(table["name"])
+        files = ", ".join(self.capabilities.escape_literal(file_path) for file_path in parquet_paths)
+        with self.sql_client.begin_transaction():
+            # files may have different columns if schema evolved within a package
+            self.sql_client.execute_sql(f"INSERT INTO {qualified_table_name} BY NAME SELECT * FROM read_parquet([{files}], union_by_name=true);")
+        # all files got loaded in a single transaction
+        for file_path in parquet_paths:
+            yield EmptyLoadJob.from_file_path(file_path, "completed")
+
+    def _create_optimized_replace_job(self, table_chain: Sequence[TTableSchema]) -> NewLoadJob:
+        return DuckDbStagingCopyJob.from_table_chain(table_chain, self.sql_client)
+
     def _get_column_def_sql(self, c: TColumnSchema) -> str:
         hints_str = " ".join(self.active_hints.get(h, "") for h in self.active_hints.keys() if c.get(h, False) is True)
         column_name = self.capabilities.escape_identifier(c["name"])
@@ -5,7 +5,7 @@ from typing import Any, AnyStr, ClassVar, Iterator, Optional, Sequence
 from dlt.common.destination import DestinationCapabilitiesContext
 
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
-from dlt.destinations.typing import DBApi, DBApiCursor, DBTransaction, DataFrame
+from dlt.destinations.typing import ArrowTable, DBApi, DBApiCursor, DBTransaction
 from dlt.destinations.sql_client import SqlClientBase, DBApiCursorImpl, raise_database_error, raise_open_connection_error
 
 from dlt.destinations.duckdb import capabilities
@@ -13,20 +13,19 @@ from dlt.destinations.duckdb.configuration import DuckDbBaseCredentials
 
 
 class DuckDBDBApiCursorImpl(DBApiCursorImpl):
-    """Use native BigQuery data frame support if available"""
+    """Use native duckdb Arrow support"""
+    native_arrow = True
+
     native_cursor: duckdb.DuckDBPyConnection  # type: ignore
-    vector_size: ClassVar[int] = 2048
 
-    def df(self, chunk_size: int = None, **kwargs: Any) -> DataFrame:
-        if chunk_size is None:
-            return self.native_cursor.df(**kwargs)
-        else:
-            multiple = chunk_size // self.vector_size + (0 if self.vector_size % chunk_size == 0 else 1)
-            df = self.native_cursor.fetch_df_chunk(multiple, **kwargs)
-            if df.shape[0] == 0:
-                return None
-            else:
-                return df
+    def iter_arrow(self, chunk_size: int, **kwargs: Any) -> Iterator[ArrowTable]:
+        from dlt.common.libs.pyarrow import pyarrow, rechunk_arrow_tables
+
+        reader = self.native_cursor.fetch_record_batch(chunk_size, **kwargs)
+        yield from rechunk_arrow_tables((pyarrow.Table.from_batches([batch]) for batch in reader), chunk_size)
+
+    def _fetch_arrow_all(self, **kwargs: Any) -> ArrowTable:
+        return self.native_cursor.fetch_arrow_table(**kwargs)
 
 
 class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
@@ -49,6 +48,10 @@ class DuckDbSqlClient(SqlClientBase[duckdb.DuckDBPyConnection], DBTransaction):
             "TimeZone": "UTC",
             "checkpoint_threshold": "1gb"
             }
+        if self.credentials.threads:
+            config["threads"] = str(self.credentials.threads)
+        if self.credentials.memory_limit:
+            config["memory_limit"] = self.credentials.memory_limit
         if config:
             for k, v in config.items():
                 try:
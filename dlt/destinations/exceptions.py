@@ -63,6 +63,12 @@ class LoadJobTerminalException(DestinationTerminalException):
         super().__init__(f"Job with id/file name {file_path} encountered unrecoverable problem: {message}")
 
 
+class LoadJobCommitUnknownException(DestinationTransientException):
+    def __init__(self, file_names: Sequence[str], message: str) -> None:
+        self.file_names = file_names
+        super().__init__(f"Outcome of commit of files {file_names} is not known, the data may be already visible and files will not be loaded again: {message}")
+
+
 class LoadJobUnknownTableException(DestinationTerminalException):
     def __init__(self, table_name: str, file_name: str) -> None:
         self.table_name = table_name
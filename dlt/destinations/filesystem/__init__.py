@@ -15,7 +15,10 @@ def _configure(config: FilesystemClientConfiguration = config.value) -> Filesyst
 
 
 def capabilities() -> DestinationCapabilitiesContext:
-    return DestinationCapabilitiesContext.generic_capabilities("jsonl")
+    caps = DestinationCapabilitiesContext.generic_capabilities("jsonl")
+    # files of a table are uploaded concurrently
+    caps.max_files_per_copy_job = 100
+    return caps
 
 
 def client(schema: Schema, initial_config: DestinationClientDwhConfiguration = config.value) -> JobClientBase:
@@ -1,3 +1,4 @@
+import string
 from urllib.parse import urlparse
 
 from typing import Final, Type, Optional, Union, TYPE_CHECKING
@@ -9,6 +10,9 @@ from dlt.common.utils import digest128
 from dlt.common.configuration.exceptions import ConfigurationValueError
 
 
+DEFAULT_LAYOUT = "{schema_name}.{table_name}.{load_id}.{file_id}.{ext}"
+LAYOUT_PLACEHOLDERS = {"schema_name", "table_name", "load_id", "file_id", "ext", "load_date"}
+
 PROTOCOL_CREDENTIALS = {
     "gs": Union[GcpServiceAccountCredentials, GcpOAuthCredentials],
     "gcs": Union[GcpServiceAccountCredentials, GcpOAuthCredentials],
@@ -23,6 +27,16 @@ class FilesystemClientConfiguration(DestinationClientStagingConfiguration):
     # should be an union of all possible credentials as found in PROTOCOL_CREDENTIALS
     credentials: Union[AwsCredentials, GcpServiceAccountCredentials, GcpOAuthCredentials]
     bucket_url: str
+    max_concurrent_uploads: int = 16
+    """How many files or parts of a file are uploaded at once by file systems that support async uploads"""
+    multipart_chunk_size: int = 50 * 1024 * 1024
+    """Files at least twice that size are uploaded to s3 in parts of that size, bytes"""
+    layout: str = DEFAULT_LAYOUT
+    """Template of file paths in the dataset with placeholders: schema_name, table_name, load_id, file_id, ext and load_date. Use / to create folders ie. {table_name}/load_date={load_date}/{load_id}.{file_id}.{ext}"""
+    compaction_min_files: int = 0
+    """When gt 0, small parquet files of a table in the same folder are merged into one when there are at least that many of them after a load"""
+    compaction_max_file_size: int = 32 * 1024 * 1024
+    """Only parquet files smaller than that are merged, bytes"""
 
     @property
     def protocol(self) -> str:
@@ -38,6 +52,17 @@ class FilesystemClientConfiguration(DestinationClientStagingConfiguration):
         if url.path == self.bucket_url:
             url = url._replace(scheme="file")
             self.bucket_url = url.geturl()
+        self._validate_layout()
+
+    def _validate_layout(self) -> None:
+        fields = [field_name for _, field_name, _, _ in string.Formatter().parse(self.layout) if field_name is not None]
+        if unknown := set(fields) - LAYOUT_PLACEHOLDERS:
+            raise ConfigurationValueError(f"Unknown placeholders {unknown} in layout {self.layout}. Supported placeholders are {LAYOUT_PLACEHOLDERS}.")
+        if "table_name" not in fields or "file_id" not in fields:
+            raise ConfigurationValueError(f"Layout {self.layout} must contain table_name and file_id placeholders.")
+        # files of a table are found by a path prefix so only the schema name may precede the table name
+        if any(field_name not in ("schema_name", "table_name") for field_name in fields[:fields.index("table_name")]):
+            raise ConfigurationValueError(f"Layout {self.layout} may only have schema_name placeholder before table_name.")
 
     @resolve_type('credentials')
     def resolve_credentials_type(self) -> Type[CredentialsConfiguration]:
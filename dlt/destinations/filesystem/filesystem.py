@@ -1,10 +1,15 @@
+import fnmatch
 import posixpath
+import string
 import threading
 import os
 from types import TracebackType
-from typing import ClassVar, List, Sequence, Type, Iterable, cast
+from typing import Any, ClassVar, Dict, Iterator, List, Sequence, Type, Iterable, cast
 from fsspec import AbstractFileSystem
 
+from dlt.common import logger, pendulum
+from dlt.common.utils import uniq_id
+
 from dlt.common.schema import Schema, TTableSchema
 from dlt.common.schema.typing import TWriteDisposition, LOADS_TABLE_NAME
 from dlt.common.storages import FileStorage
@@ -12,8 +17,8 @@ from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.destination.reference import NewLoadJob, TLoadJobState, LoadJob, JobClientBase, FollowupJob
 from dlt.destinations.job_impl import EmptyLoadJob
 from dlt.destinations.filesystem import capabilities
-from dlt.destinations.filesystem.configuration import FilesystemClientConfiguration
-from dlt.destinations.filesystem.filesystem_client import client_from_config
+from dlt.destinations.filesystem.configuration import DEFAULT_LAYOUT, FilesystemClientConfiguration
+from dlt.destinations.filesystem.filesystem_client import client_from_config, put_files
 from dlt.common.storages import LoadStorage
 from dlt.destinations.job_impl import NewLoadJobImpl
 from dlt.destinations.job_impl import NewReferenceJob
@@ -29,20 +34,35 @@ class LoadFilesystemJob(LoadJob):
             schema_name: str,
             load_id: str
     ) -> None:
+        """Job for a file in `local_path` that is uploaded by the client that created it"""
         file_name = FileStorage.get_file_name_from_file_path(local_path)
         self.config = config
         self.dataset_path = dataset_path
-        self.destination_file_name = LoadFilesystemJob.make_destination_filename(file_name, schema_name, load_id)
+        self.local_path = local_path
+        self.destination_file_name = LoadFilesystemJob.make_destination_filename(file_name, schema_name, load_id, config.layout)
 
         super().__init__(file_name)
-        fs_client, _ = client_from_config(config)
-        self.destination_file_name = LoadFilesystemJob.make_destination_filename(file_name, schema_name, load_id)
-        fs_client.put_file(local_path, self.make_remote_path())
 
     @staticmethod
-    def make_destination_filename(file_name: str, schema_name: str, load_id: str) -> str:
+    def make_destination_filename(file_name: str, schema_name: str, load_id: str, layout: str = DEFAULT_LAYOUT) -> str:
+        """Makes file path relative to the dataset from the `layout` template"""
         job_info = LoadStorage.parse_job_file_name(file_name)
-        return f"{schema_name}.{job_info.table_name}.{load_id}.{job_info.file_id}.{job_info.file_format}"
+        return layout.format(
+            schema_name=schema_name,
+            table_name=job_info.table_name,
+            load_id=load_id,
+            file_id=job_info.file_id,
+            ext=job_info.file_format,
+            load_date=LoadFilesystemJob.make_load_date(load_id)
+        )
+
+    @staticmethod
+    def make_load_date(load_id: str) -> str:
+        try:
+            # load ids are timestamps of the moment package was created
+            return pendulum.from_timestamp(float(load_id)).to_date_string()  # type: ignore[no-any-return]
+        except (ValueError, OverflowError):
+            return pendulum.today("UTC").to_date_string()  # type: ignore[no-any-return]
 
     def make_remote_path(self) -> str:
         return f"{self.config.protocol}://{posixpath.join(self.dataset_path, self.destination_file_name)}"
@@ -79,17 +99,40 @@ class FilesystemClient(JobClientBase):
     def dataset_path(self) -> str:
         return posixpath.join(self.fs_path, self.config.dataset_name)
 
+    def get_table_prefix(self, table_name: str) -> str:
+        """Path prefix shared by all files of `table_name`: the layout up to the first placeholder that is not a schema or table name"""
+        prefix = ""
+        for literal, field_name, _, _ in string.Formatter().parse(self.config.layout):
+            prefix += literal
+            if field_name == "schema_name":
+                prefix += self.schema.name
+            elif field_name == "table_name":
+                prefix += table_name
+            elif field_name is not None:
+                break
+        return posixpath.join(self.dataset_path, prefix)
+
+    def list_table_files(self, table_names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Lists files of `table_names` with their details. Only folders that contain the files of a table are listed, once per folder"""
+        prefixes = {self.get_table_prefix(table_name) for table_name in table_names}
+        files: Dict[str, Dict[str, Any]] = {}
+        for folder in {posixpath.dirname(prefix) for prefix in prefixes}:
+            # listings are cached by some file systems
+            self.fs_client.invalidate_cache(folder)
+            if not self.fs_client.isdir(folder):
+                continue
+            # NOTE: glob implementation in fsspec does not look thread safe, way better is to use find and then filter
+            for path, info in self.fs_client.find(folder, detail=True).items():
+                if any(path.startswith(prefix) for prefix in prefixes):
+                    files[path] = info
+        return files
+
     def initialize_storage(self, truncate_tables: Iterable[str] = None) -> None:
         # clean up existing files for tables selected for truncating
-        if truncate_tables and self.fs_client.isdir(self.dataset_path):
-            all_files = self.fs_client.ls(self.dataset_path, detail=False, refresh=True)
-            for table in truncate_tables:
-                search_prefix = posixpath.join(self.dataset_path, f"{self.schema.name}.{table}.")
-                for item in all_files:
-                    # NOTE: glob implementation in fsspec does not look thread safe, way better is to use ls and then filter
-                    if item.startswith(search_prefix):
-                        # NOTE: deleting in chunks on s3 does not raise on access denied, file non existing and probably other errors
-                        self.fs_client.rm_file(item)
+        if truncate_tables:
+            for item in self.list_table_files(truncate_tables):
+                # NOTE: deleting in chunks on s3 does not raise on access denied, file non existing and probably other errors
+                self.fs_client.rm_file(item)
 
         # create destination dir
         self.fs_client.makedirs(self.dataset_path, exist_ok=True)
@@ -98,24 +141,98 @@ class FilesystemClient(JobClientBase):
         return self.fs_client.isdir(self.dataset_path)  # type: ignore[no-any-return]
 
     def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        return next(self.start_file_loads(table, [file_path], load_id))
+
+    def start_file_loads(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> Iterator[LoadJob]:
+        """Uploads all files with the file system of this client, concurrently if the file system supports it"""
         cls = FollowupFilesystemJob if self.config.as_staging else LoadFilesystemJob
-        return cls(
-            file_path,
-            self.dataset_path,
-            config=self.config,
-            schema_name=self.schema.name,
-            load_id=load_id
+        jobs = [
+            cls(
+                file_path,
+                self.dataset_path,
+                config=self.config,
+                schema_name=self.schema.name,
+                load_id=load_id
+            ) for file_path in file_paths
+        ]
+        # create folders of partitioned layouts
+        for folder in {posixpath.dirname(job.destination_file_name) for job in jobs} - {""}:
+            self.fs_client.makedirs(posixpath.join(self.dataset_path, folder), exist_ok=True)
+        put_files(
+            self.fs_client,
+            [job.local_path for job in jobs],
+            [job.make_remote_path() for job in jobs],
+            self.config.max_concurrent_uploads,
+            self.config.multipart_chunk_size
         )
+        # uploads are idempotent so jobs are yielded when all the files are uploaded
+        yield from jobs
 
     def restore_file_load(self, file_path: str) -> LoadJob:
         return EmptyLoadJob.from_file_path(file_path, "completed")
 
     def complete_load(self, load_id: str) -> None:
+        if self.config.compaction_min_files > 0:
+            self.compact_table_files([table["name"] for table in self.schema.data_tables()], load_id)
         schema_name = self.schema.name
         table_name = LOADS_TABLE_NAME
         file_name = f"{schema_name}.{table_name}.{load_id}"
         self.fs_client.touch(posixpath.join(self.dataset_path, file_name))
 
+    def compact_table_files(self, table_names: Iterable[str], load_id: str = None) -> None:
+        """Merges small parquet files of each table that are in the same folder into a single file
+
+        If `load_id` is given, only the folders into which that load wrote files of a table are listed and compacted
+        """
+        for table_name in table_names:
+            table_files = self._list_load_folder_files(table_name, load_id) if load_id else self.list_table_files([table_name])
+            folders: Dict[str, List[str]] = {}
+            for path, info in table_files.items():
+                if path.endswith(".parquet") and info["size"] < self.config.compaction_max_file_size:
+                    folders.setdefault(posixpath.dirname(path), []).append(path)
+            for files in folders.values():
+                if len(files) >= self.config.compaction_min_files:
+                    self._merge_parquet_files(sorted(files))
+
+    def _list_load_folder_files(self, table_name: str, load_id: str) -> Dict[str, Dict[str, Any]]:
+        """Lists files of `table_name` in the folder into which `load_id` wrote parquet files of that table. Nothing is listed if there are no such files"""
+        # files of the load match the layout with any file id
+        load_pattern = posixpath.join(self.dataset_path, self.config.layout.format(
+            schema_name=self.schema.name,
+            table_name=table_name,
+            load_id=load_id,
+            file_id="*",
+            ext="parquet",
+            load_date=LoadFilesystemJob.make_load_date(load_id)
+        ))
+        folder = posixpath.dirname(load_pattern)
+        self.fs_client.invalidate_cache(folder)
+        if not self.fs_client.isdir(folder):
+            return {}
+        prefix = self.get_table_prefix(table_name)
+        files = {info["name"]: info for info in self.fs_client.ls(folder, detail=True) if info["type"] == "file" and info["name"].startswith(prefix)}
+        if not any(fnmatch.fnmatch(path, load_pattern) for path in files):
+            return {}
+        return files
+
+    def _merge_parquet_files(self, files: Sequence[str]) -> None:
+        from dlt.common.libs.pyarrow import pyarrow, concat_tables_promoted
+
+        tables = []
+        for path in files:
+            with self.fs_client.open(path, "rb") as f:
+                tables.append(pyarrow.parquet.read_table(f))
+        # columns added in later loads are null in earlier files
+        merged = concat_tables_promoted(tables)
+        # merged file takes the name of the first file so it matches the layout
+        temp_path = f"{files[0]}.{uniq_id()}.tmp"
+        with self.fs_client.open(temp_path, "wb") as f:
+            pyarrow.parquet.write_table(merged, f)
+        # replace the first file before the others are removed so no rows are missing if compaction is interrupted
+        self.fs_client.mv(temp_path, files[0])
+        self.fs_client.rm(list(files[1:]))
+        logger.info(f"Merged {len(files)} parquet files into {files[0]}")
+
     def __enter__(self) -> "FilesystemClient":
         return self
 
@@ -1,7 +1,11 @@
-from typing import cast, Tuple
+import asyncio
+import math
+import os
+from typing import Any, Dict, List, Sequence, cast, Tuple
 
 from fsspec.core import url_to_fs
 from fsspec import AbstractFileSystem
+from fsspec.asyn import AsyncFileSystem, sync
 
 from dlt.common.exceptions import MissingDependencyException
 from dlt.common.typing import DictStrAny
@@ -30,3 +34,60 @@ def client_from_config(config: FilesystemClientConfiguration) -> Tuple[AbstractF
         return url_to_fs(config.bucket_url, **fs_kwargs)  # type: ignore[no-any-return]
     except ImportError as e:
         raise MissingDependencyException("filesystem destination", [f"{version.DLT_PKG_NAME}[{proto}]"]) from e
+
+
+def put_files(fs_client: AbstractFileSystem, local_paths: Sequence[str], remote_paths: Sequence[str], max_concurrency: int, multipart_chunk_size: int) -> None:
+    """Uploads `local_paths` to `remote_paths`.
+
+    Async file systems upload up to `max_concurrency` files at once. Files at least twice the `multipart_chunk_size` are uploaded to s3 in parts, concurrently
+    with other parts and files. Other file systems upload files one by one.
+    """
+    if not isinstance(fs_client, AsyncFileSystem):
+        for local_path, remote_path in zip(local_paths, remote_paths):
+            fs_client.put_file(local_path, remote_path)
+        return
+    sync(fs_client.loop, _put_files, fs_client, local_paths, remote_paths, max_concurrency, multipart_chunk_size)
+
+
+async def _put_files(fs_client: AsyncFileSystem, local_paths: Sequence[str], remote_paths: Sequence[str], max_concurrency: int, multipart_chunk_size: int) -> None:
+    # limits requests in flight, not files so parts of large files do not wait for each other
+    semaphore = asyncio.Semaphore(max_concurrency)
+    protocols = [fs_client.protocol] if isinstance(fs_client.protocol, str) else fs_client.protocol
+
+    async def _put_file(local_path: str, remote_path: str) -> None:
+        if "s3" in protocols and os.path.getsize(local_path) >= 2 * multipart_chunk_size:
+            await _put_file_multipart_s3(fs_client, local_path, remote_path, multipart_chunk_size, semaphore)
+        else:
+            async with semaphore:
+                await fs_client._put_file(local_path, remote_path)
+
+    await asyncio.gather(*[_put_file(local_path, remote_path) for local_path, remote_path in zip(local_paths, remote_paths)])
+
+
+async def _put_file_multipart_s3(fs_client: Any, local_path: str, remote_path: str, chunk_size: int, semaphore: asyncio.Semaphore) -> None:
+    bucket, key, _ = fs_client.split_path(remote_path)
+    async with semaphore:
+        mpu = await fs_client._call_s3("create_multipart_upload", Bucket=bucket, Key=key)
+
+    async def _upload_part(part_number: int) -> Dict[str, Any]:
+        async with semaphore:
+            # read the part only when it can be sent so at most `max_concurrency` parts are kept in memory
+            with open(local_path, "rb") as f:
+                f.seek((part_number - 1) * chunk_size)
+                chunk = f.read(chunk_size)
+            part = await fs_client._call_s3(
+                "upload_part", Bucket=bucket, Key=key, PartNumber=part_number, UploadId=mpu["UploadId"], Body=chunk
+            )
+        return {"PartNumber": part_number, "ETag": part["ETag"]}
+
+    parts_count = math.ceil(os.path.getsize(local_path) / chunk_size)
+    try:
+        parts: List[Dict[str, Any]] = await asyncio.gather(*[_upload_part(part_number) for part_number in range(1, parts_count + 1)])
+        async with semaphore:
+            await fs_client._call_s3(
+                "complete_multipart_upload", Bucket=bucket, Key=key, UploadId=mpu["UploadId"], MultipartUpload={"Parts": parts}
+            )
+    except Exception:
+        await fs_client._call_s3("abort_multipart_upload", Bucket=bucket, Key=key, UploadId=mpu["UploadId"])
+        raise
+    fs_client.invalidate_cache(remote_path)
@@ -6,7 +6,7 @@ import contextlib
 from copy import copy
 import datetime  # noqa: 251
 from types import TracebackType
-from typing import Any, ClassVar, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, ContextManager
+from typing import Any, Callable, ClassVar, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, Iterable, Iterator, ContextManager
 import zlib
 import re
 
@@ -96,6 +96,8 @@ class CopyRemoteFileLoadJob(LoadJob, FollowupJob):
 class SqlJobClientBase(StagingJobClientBase):
 
     VERSION_TABLE_SCHEMA_COLUMNS: ClassVar[str] = "version_hash, schema_name, version, engine_version, inserted_at, schema"
+    STORAGE_TABLES_QUERY_CHUNK: ClassVar[int] = 250
+    """How many tables are introspected in a single INFORMATION_SCHEMA query"""
 
     def __init__(self, schema: Schema, config: DestinationClientConfiguration,  sql_client: SqlClientBase[TNativeConn]) -> None:
         super().__init__(schema, config)
@@ -161,7 +163,7 @@ class SqlJobClientBase(StagingJobClientBase):
         return []
 
     def _create_merge_job(self, table_chain: Sequence[TTableSchema]) -> NewLoadJob:
-        return SqlMergeJob.from_table_chain(table_chain, self.sql_client)
+        return SqlMergeJob.from_table_chain(table_chain, self.sql_client, deduplicate=self.config.merge_deduplicate)
 
     # update destination tables from staging tables
     def _create_staging_copy_job(self, table_chain: Sequence[TTableSchema]) -> NewLoadJob:
@@ -180,11 +182,18 @@ class SqlJobClientBase(StagingJobClientBase):
         if write_disposition == "merge":
             jobs.append(self._create_merge_job(table_chain))
         elif write_disposition == "replace" and self.config.replace_strategy == "insert-from-staging":
-            jobs.append(self._create_staging_copy_job(table_chain))
+            jobs.extend(self._create_replace_jobs(table_chain, self._create_staging_copy_job))
         elif write_disposition == "replace" and self.config.replace_strategy == "staging-optimized":
-            jobs.append(self._create_optimized_replace_job(table_chain))
+            jobs.extend(self._create_replace_jobs(table_chain, self._create_optimized_replace_job))
         return jobs
 
+    def _create_replace_jobs(self, table_chain: Sequence[TTableSchema], create_job: Callable[[Sequence[TTableSchema]], NewLoadJob]) -> List[NewLoadJob]:
+        """Creates a single replace job for the whole `table_chain` if the destination executes it atomically, otherwise one job per table so the tables are replaced in parallel by the loader workers"""
+        if self.capabilities.supports_atomic_sql_jobs:
+            return [create_job(table_chain)]
+        # replacing a table does not depend on the other tables in the chain
+        return [create_job([table]) for table in table_chain]
+
     def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
         """Starts SqlLoadJob for files ending with .sql or returns None to let derived classes to handle their specific jobs"""
         if SqlLoadJob.is_sql_job(file_path):
@@ -224,6 +233,16 @@ class SqlJobClientBase(StagingJobClientBase):
         self.sql_client.close_connection()
 
     def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
+        storage_tables = self.get_storage_tables([table_name])
+        if table_name in storage_tables:
+            return True, storage_tables[table_name]
+        return False, {}
+
+    def get_storage_tables(self, table_names: Iterable[str]) -> Dict[str, TTableSchemaColumns]:
+        """Gets columns of `table_names` in the destination dataset, with as few INFORMATION_SCHEMA queries as possible.
+
+        Tables that do not exist in the destination are not present in the returned dictionary.
+        """
 
         def _null_to_bool(v: str) -> bool:
             if v == "NO":
@@ -232,30 +251,39 @@ class SqlJobClientBase(StagingJobClientBase):
                 return True
             raise ValueError(v)
 
-        db_params = self.sql_client.make_qualified_table_name(table_name, escape=False).split(".", 3)
+        # map names as stored in INFORMATION_SCHEMA to table names
+        storage_names: Dict[str, str] = {}
+        db_params: List[str] = None
+        for table_name in table_names:
+            db_params = self.sql_client.make_qualified_table_name(table_name, escape=False).split(".", 3)
+            storage_names[db_params[-1]] = table_name
+        storage_tables: Dict[str, TTableSchemaColumns] = {}
+        if not storage_names:
+            return storage_tables
+
+        # all tables are in the same dataset
         query = """
-SELECT column_name, data_type, is_nullable, numeric_precision, numeric_scale
+SELECT table_name, column_name, data_type, is_nullable, numeric_precision, numeric_scale
     FROM INFORMATION_SCHEMA.COLUMNS
 WHERE """
         if len(db_params) == 3:
             query += "table_catalog = %s AND "
-        query += "table_schema = %s AND table_name = %s ORDER BY ordinal_position;"
-        rows = self.sql_client.execute_sql(query, *db_params)
-
-        # if no rows we assume that table does not exist
-        schema_table: TTableSchemaColumns = {}
-        if len(rows) == 0:
-            # TODO: additionally check if table exists
-            return False, schema_table
-        # TODO: pull more data to infer indexes, PK and uniques attributes/constraints
-        for c in rows:
-            schema_c: TColumnSchemaBase = {
-                "name": c[0],
-                "nullable": _null_to_bool(c[2]),
-                "data_type": self._from_db_type(c[1], c[3], c[4]),
-            }
-            schema_table[c[0]] = add_missing_hints(schema_c)
-        return True, schema_table
+        query += "table_schema = %s AND table_name IN ({}) ORDER BY table_name, ordinal_position;"
+        names = list(storage_names)
+        for idx in range(0, len(names), self.STORAGE_TABLES_QUERY_CHUNK):
+            names_chunk = names[idx:idx + self.STORAGE_TABLES_QUERY_CHUNK]
+            chunk_query = query.format(",".join(["%s"] * len(names_chunk)))
+            rows = self.sql_client.execute_sql(chunk_query, *db_params[:-1], *names_chunk)
+            # if no rows we assume that table does not exist
+            # TODO: pull more data to infer indexes, PK and uniques attributes/constraints
+            for c in rows:
+                schema_c: TColumnSchemaBase = {
+                    "name": c[1],
+                    "nullable": _null_to_bool(c[3]),
+                    "data_type": self._from_db_type(c[2], c[4], c[5]),
+                }
+                storage_tables.setdefault(storage_names[c[0]], {})[c[1]] = add_missing_hints(schema_c)
+        return storage_tables
 
     @classmethod
     @abstractmethod
@@ -300,8 +328,12 @@ WHERE """
         """
         sql_updates = []
         schema_update: TSchemaTables = {}
-        for table_name in only_tables or self.schema.tables:
-            exists, storage_table = self.get_storage_table(table_name)
+        table_names = list(only_tables or self.schema.tables)
+        # introspect all tables at once
+        storage_tables = self.get_storage_tables(table_names)
+        for table_name in table_names:
+            exists = table_name in storage_tables
+            storage_table = storage_tables.get(table_name, {})
             new_columns = self._create_table_update(table_name, storage_table)
             if len(new_columns) > 0:
                 # build and add sql to execute
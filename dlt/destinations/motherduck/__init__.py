@@ -32,6 +32,7 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.max_text_data_type_length = 1024 * 1024 * 1024
     caps.is_max_text_data_type_length_in_bytes = True
     caps.supports_ddl_transactions = False
+    caps.supports_delete_using = True
     caps.alter_add_multi_column = False
     caps.supports_truncate_command = False
 
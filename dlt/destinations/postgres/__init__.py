@@ -35,6 +35,8 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.max_text_data_type_length = 1024 * 1024 * 1024
     caps.is_max_text_data_type_length_in_bytes = True
     caps.supports_ddl_transactions = True
+    caps.supports_atomic_sql_jobs = True
+    caps.supports_delete_using = True
 
     return caps
 
@@ -33,6 +33,9 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.max_text_data_type_length = 65535
     caps.is_max_text_data_type_length_in_bytes = True
     caps.supports_ddl_transactions = True
+    caps.supports_atomic_sql_jobs = True
+    caps.supports_delete_using = True
+    caps.max_files_per_copy_job = 100
     caps.alter_add_multi_column = False
 
     return caps
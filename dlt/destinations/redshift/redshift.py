@@ -1,5 +1,6 @@
 import platform
 import os
+import posixpath
 
 from dlt.destinations.postgres.sql_client import Psycopg2SqlClient
 
@@ -11,7 +12,12 @@ else:
     import psycopg2
     # from psycopg2.sql import SQL, Composed
 
-from typing import ClassVar, Dict, List, Optional, Sequence, Any
+from typing import ClassVar, Dict, Iterator, List, Optional, Sequence, Any, Tuple
+from fsspec.core import url_to_fs
+
+from dlt.common import json, logger
+from dlt.common.typing import DictStrAny
+from dlt.common.utils import uniq_id
 
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.destination.reference import NewLoadJob, CredentialsConfiguration
@@ -27,7 +33,7 @@ from dlt.destinations.job_client_impl import CopyRemoteFileLoadJob, LoadJob
 
 from dlt.destinations.redshift import capabilities
 from dlt.destinations.redshift.configuration import RedshiftClientConfiguration
-from dlt.destinations.job_impl import NewReferenceJob
+from dlt.destinations.job_impl import EmptyLoadJob, NewReferenceJob
 from dlt.destinations.sql_client import SqlClientBase
 
 
@@ -90,25 +96,41 @@ class RedshiftCopyFileLoadJob(CopyRemoteFileLoadJob):
         super().__init__(table, file_path, sql_client, staging_credentials)
 
     def execute(self, table: TTableSchema, bucket_path: str) -> None:
+        ext = os.path.splitext(bucket_path)[1][1:]
+        with self._sql_client.begin_transaction():
+            self._sql_client.execute_sql(
+                self.gen_copy_sql(table, bucket_path, ext, self._sql_client, self.file_name(), self._staging_credentials, self._staging_iam_role)
+            )
 
+    @staticmethod
+    def gen_copy_sql(
+        table: TTableSchema,
+        from_path: str,
+        ext: str,
+        sql_client: SqlClientBase[Any],
+        file_name: str,
+        staging_credentials: Optional[CredentialsConfiguration] = None,
+        staging_iam_role: str = None,
+        manifest: bool = False
+    ) -> str:
+        """Generates COPY statement loading files with extension `ext` from `from_path`. If `manifest` is set, `from_path` is a manifest listing the files"""
         # we assume s3 credentials where provided for the staging
         credentials = ""
-        if self._staging_iam_role:
-            credentials = f"IAM_ROLE '{self._staging_iam_role}'"
-        elif self._staging_credentials and isinstance(self._staging_credentials, AwsCredentialsWithoutDefaults):
-            aws_access_key = self._staging_credentials.aws_access_key_id
-            aws_secret_key = self._staging_credentials.aws_secret_access_key
+        if staging_iam_role:
+            credentials = f"IAM_ROLE '{staging_iam_role}'"
+        elif staging_credentials and isinstance(staging_credentials, AwsCredentialsWithoutDefaults):
+            aws_access_key = staging_credentials.aws_access_key_id
+            aws_secret_key = staging_credentials.aws_secret_access_key
             credentials = f"CREDENTIALS 'aws_access_key_id={aws_access_key};aws_secret_access_key={aws_secret_key}'"
         table_name = table["name"]
 
         # get format
-        ext = os.path.splitext(bucket_path)[1][1:]
         file_type = ""
         dateformat = ""
         compression = ""
         if ext == "jsonl":
             if table_schema_has_type(table, "binary"):
-                raise LoadJobTerminalException(self.file_name(), "Redshift cannot load VARBYTE columns from json files. Switch to parquet to load binaries.")
+                raise LoadJobTerminalException(file_name, "Redshift cannot load VARBYTE columns from json files. Switch to parquet to load binaries.")
             file_type = "FORMAT AS JSON 'auto'"
             dateformat = "dateformat 'auto' timeformat 'auto'"
             compression = "GZIP"
@@ -121,19 +143,16 @@ class RedshiftCopyFileLoadJob(CopyRemoteFileLoadJob):
         else:
             raise ValueError(f"Unsupported file type {ext} for Redshift.")
 
-        with self._sql_client.begin_transaction():
-            dataset_name = self._sql_client.dataset_name
-            # TODO: if we ever support csv here remember to add column names to COPY
-            self._sql_client.execute_sql(f"""
-                COPY {dataset_name}.{table_name}
-                FROM '{bucket_path}'
-                {file_type}
-                {dateformat}
-                {compression}
-                {credentials} MAXERROR 0;""")
-
-
-
+        dataset_name = sql_client.dataset_name
+        # TODO: if we ever support csv here remember to add column names to COPY
+        return f"""
+            COPY {dataset_name}.{table_name}
+            FROM '{from_path}'
+            {"MANIFEST" if manifest else ""}
+            {file_type}
+            {dateformat}
+            {compression}
+            {credentials} MAXERROR 0;"""
 
     def exception(self) -> str:
         # this part of code should be never reached
@@ -166,7 +185,7 @@ class RedshiftClient(InsertValuesJobClient):
         self.config: RedshiftClientConfiguration = config
 
     def _create_merge_job(self, table_chain: Sequence[TTableSchema]) -> NewLoadJob:
-        return RedshiftMergeJob.from_table_chain(table_chain, self.sql_client)
+        return RedshiftMergeJob.from_table_chain(table_chain, self.sql_client, deduplicate=self.config.merge_deduplicate)
 
     def _get_column_def_sql(self, c: TColumnSchema) -> str:
         hints_str = " ".join(HINT_TO_REDSHIFT_ATTR.get(h, "") for h in HINT_TO_REDSHIFT_ATTR.keys() if c.get(h, False) is True)
@@ -181,6 +200,56 @@ class RedshiftClient(InsertValuesJobClient):
             job = RedshiftCopyFileLoadJob(table, file_path, self.sql_client, staging_credentials=self.config.staging_credentials, staging_iam_role=self.config.staging_iam_role)
         return job
 
+    def start_file_loads(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> Iterator[LoadJob]:
+        """Loads referenced files of the same format with a single COPY from a manifest written next to them in the bucket"""
+        bucket_files: Dict[str, List[Tuple[str, str]]] = {}
+        for file_path in file_paths:
+            if NewReferenceJob.is_reference_job(file_path):
+                bucket_path = NewReferenceJob.resolve_reference(file_path)
+                bucket_files.setdefault(os.path.splitext(bucket_path)[1][1:], []).append((file_path, bucket_path))
+            else:
+                yield self.start_file_load(table, file_path, load_id)
+        for ext, files in bucket_files.items():
+            if len(files) == 1:
+                yield self.start_file_load(table, files[0][0], load_id)
+                continue
+            self._copy_with_manifest(table, ext, [bucket_path for _, bucket_path in files], load_id)
+            # all files got loaded in a single transaction
+            for file_path, _ in files:
+                yield EmptyLoadJob.from_file_path(file_path, "completed")
+
+    def _copy_with_manifest(self, table: TTableSchema, ext: str, bucket_paths: Sequence[str], load_id: str) -> None:
+        fs, _ = url_to_fs(bucket_paths[0], **self._staging_fs_kwargs())
+        entries = [{"url": bucket_path, "mandatory": True, "meta": {"content_length": fs.size(bucket_path)}} for bucket_path in bucket_paths]
+        manifest_path = f"{posixpath.dirname(bucket_paths[0])}/{table['name']}.{load_id}.{uniq_id()}.manifest"
+        fs.write_text(manifest_path, json.dumps({"entries": entries}))
+        try:
+            with self.sql_client.begin_transaction():
+                self.sql_client.execute_sql(
+                    RedshiftCopyFileLoadJob.gen_copy_sql(
+                        table,
+                        manifest_path,
+                        ext,
+                        self.sql_client,
+                        posixpath.basename(manifest_path),
+                        self.config.staging_credentials,
+                        self.config.staging_iam_role,
+                        manifest=True
+                    )
+                )
+        finally:
+            # files are already loaded when cleanup fails so it must not fail the job
+            try:
+                fs.rm(manifest_path)
+            except Exception:
+                logger.exception(f"Could not remove manifest {manifest_path}")
+
+    def _staging_fs_kwargs(self) -> DictStrAny:
+        if isinstance(self.config.staging_credentials, AwsCredentialsWithoutDefaults):
+            return self.config.staging_credentials.to_s3fs_credentials()
+        # let s3fs find the default credentials
+        return {}
+
     @classmethod
     def _to_db_type(cls, sc_t: TDataType) -> str:
         if sc_t == "wei":
@@ -33,6 +33,8 @@ def capabilities() -> DestinationCapabilitiesContext:
     caps.max_text_data_type_length = 16 * 1024 * 1024
     caps.is_max_text_data_type_length_in_bytes = True
     caps.supports_ddl_transactions = True
+    caps.supports_delete_using = True
+    caps.max_files_per_copy_job = 100
     caps.alter_add_multi_column = True
     return caps
 
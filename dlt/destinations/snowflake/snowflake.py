@@ -1,4 +1,5 @@
-from typing import ClassVar, Dict, Optional, Sequence, Tuple, List, Any
+import os
+from typing import ClassVar, Dict, Iterator, Optional, Sequence, List, Any, Iterable, Tuple
 from urllib.parse import urlparse
 
 from dlt.common.arithmetics import DEFAULT_NUMERIC_PRECISION, DEFAULT_NUMERIC_SCALE
@@ -58,58 +59,78 @@ class SnowflakeLoadJob(LoadJob, FollowupJob):
         file_name = FileStorage.get_file_name_from_file_path(file_path)
         super().__init__(file_name)
 
+        if NewReferenceJob.is_reference_job(file_path):
+            bucket_path = NewReferenceJob.resolve_reference(file_path)
+            self.copy_from_bucket(client, table_name, file_path, [bucket_path], stage_name, staging_credentials)
+            return
+
+        # this means we have a local file
         qualified_table_name = client.make_qualified_table_name(table_name)
+        if not stage_name:
+            # Use implicit table stage by default: "SCHEMA_NAME"."%TABLE_NAME"
+            stage_name = client.make_qualified_table_name('%'+table_name)
+        stage_file_path = f'@{stage_name}/"{load_id}"/{file_name}'
+
+        with client.begin_transaction():
+            # PUT and COPY in one tx
+            client.execute_sql(f'PUT file://{file_path} @{stage_name}/"{load_id}" OVERWRITE = TRUE, AUTO_COMPRESS = FALSE')
+            client.execute_sql(self.gen_copy_sql(qualified_table_name, f"FROM {stage_file_path}", "", "", file_name))
+            if not keep_staged_files:
+                client.execute_sql(f'REMOVE {stage_file_path}')
 
-        # extract and prepare some vars
-        bucket_path = NewReferenceJob.resolve_reference(file_path) if NewReferenceJob.is_reference_job(file_path) else ""
-        file_name = FileStorage.get_file_name_from_file_path(bucket_path) if bucket_path else file_name
-        from_clause = ""
+    @staticmethod
+    def copy_from_bucket(
+        client: SnowflakeSqlClient,
+        table_name: str,
+        file_path: str,
+        bucket_paths: Sequence[str],
+        stage_name: Optional[str] = None,
+        staging_credentials: Optional[CredentialsConfiguration] = None
+    ) -> None:
+        """Loads files in `bucket_paths` into `table_name` with a single COPY INTO. All files must be in the same bucket and have the same format"""
+        qualified_table_name = client.make_qualified_table_name(table_name)
+        bucket_path = bucket_paths[0]
         credentials_clause = ""
         files_clause = ""
-        stage_file_path = ""
-
-        if bucket_path:
-            # s3 credentials case
-            if bucket_path.startswith("s3://") and staging_credentials and isinstance(staging_credentials, AwsCredentialsWithoutDefaults):
-                credentials_clause = f"""CREDENTIALS=(AWS_KEY_ID='{staging_credentials.aws_access_key_id}' AWS_SECRET_KEY='{staging_credentials.aws_secret_access_key}')"""
+        # s3 credentials case
+        if bucket_path.startswith("s3://") and staging_credentials and isinstance(staging_credentials, AwsCredentialsWithoutDefaults):
+            credentials_clause = f"""CREDENTIALS=(AWS_KEY_ID='{staging_credentials.aws_access_key_id}' AWS_SECRET_KEY='{staging_credentials.aws_secret_access_key}')"""
+            if len(bucket_paths) == 1:
                 from_clause = f"FROM '{bucket_path}'"
             else:
-                # ensure that gcs bucket path starts with gcs://, this is a requirement of snowflake
-                bucket_path = bucket_path.replace("gs://", "gcs://")
-                if not stage_name:
-                    # when loading from bucket stage must be given
-                    raise LoadJobTerminalException(file_path, f"Cannot load from bucket path {bucket_path} without a stage name. See https://dlthub.com/docs/dlt-ecosystem/destinations/snowflake for instructions on setting up the `stage_name`")
-                from_clause = f"FROM @{stage_name}/"
-                files_clause = f"FILES = ('{urlparse(bucket_path).path.lstrip('/')}')"
+                from_clause = f"FROM 's3://{urlparse(bucket_path).netloc}/'"
+                files_clause = SnowflakeLoadJob.gen_files_clause(bucket_paths)
         else:
-            # this means we have a local file
+            # ensure that gcs bucket path starts with gcs://, this is a requirement of snowflake
+            bucket_path = bucket_path.replace("gs://", "gcs://")
             if not stage_name:
-                # Use implicit table stage by default: "SCHEMA_NAME"."%TABLE_NAME"
-                stage_name = client.make_qualified_table_name('%'+table_name)
-            stage_file_path = f'@{stage_name}/"{load_id}"/{file_name}'
-            from_clause = f"FROM {stage_file_path}"
-
-        # decide on source format, stage_file_path will either be a local file or a bucket path
-        source_format = "( TYPE = 'JSON', BINARY_FORMAT = 'BASE64' )"
-        if file_name.endswith("parquet"):
-            source_format = "(TYPE = 'PARQUET', BINARY_AS_TEXT = FALSE)"
+                # when loading from bucket stage must be given
+                raise LoadJobTerminalException(file_path, f"Cannot load from bucket path {bucket_path} without a stage name. See https://dlthub.com/docs/dlt-ecosystem/destinations/snowflake for instructions on setting up the `stage_name`")
+            from_clause = f"FROM @{stage_name}/"
+            files_clause = SnowflakeLoadJob.gen_files_clause(bucket_paths)
 
         with client.begin_transaction():
-            # PUT and COPY in one tx if local file, otherwise only copy
-            if not bucket_path:
-                client.execute_sql(f'PUT file://{file_path} @{stage_name}/"{load_id}" OVERWRITE = TRUE, AUTO_COMPRESS = FALSE')
             client.execute_sql(
-                f"""COPY INTO {qualified_table_name}
-                {from_clause}
-                {files_clause}
-                {credentials_clause}
-                FILE_FORMAT = {source_format}
-                MATCH_BY_COLUMN_NAME='CASE_INSENSITIVE'
-                """
+                SnowflakeLoadJob.gen_copy_sql(qualified_table_name, from_clause, files_clause, credentials_clause, bucket_path)
             )
-            if stage_file_path and not keep_staged_files:
-                client.execute_sql(f'REMOVE {stage_file_path}')
 
+    @staticmethod
+    def gen_files_clause(bucket_paths: Sequence[str]) -> str:
+        return "FILES = (" + ", ".join(f"'{urlparse(bucket_path).path.lstrip('/')}'" for bucket_path in bucket_paths) + ")"
+
+    @staticmethod
+    def gen_copy_sql(qualified_table_name: str, from_clause: str, files_clause: str, credentials_clause: str, file_name: str) -> str:
+        # decide on source format, file name will either be a local file or a bucket path
+        source_format = "( TYPE = 'JSON', BINARY_FORMAT = 'BASE64' )"
+        if file_name.endswith("parquet"):
+            source_format = "(TYPE = 'PARQUET', BINARY_AS_TEXT = FALSE)"
+        return f"""COPY INTO {qualified_table_name}
+            {from_clause}
+            {files_clause}
+            {credentials_clause}
+            FILE_FORMAT = {source_format}
+            MATCH_BY_COLUMN_NAME='CASE_INSENSITIVE'
+            """
 
     def state(self) -> TLoadJobState:
         return "completed"
@@ -126,10 +147,10 @@ class SnowflakeStagingCopyJob(SqlStagingCopyJob):
             with sql_client.with_staging_dataset(staging=True):
                 staging_table_name = sql_client.make_qualified_table_name(table["name"])
             table_name = sql_client.make_qualified_table_name(table["name"])
-            # drop destination table
-            sql.append(f"DROP TABLE IF EXISTS {table_name};")
-            # recreate destination table with data cloned from staging table
-            sql.append(f"CREATE TABLE {table_name} CLONE {staging_table_name};")
+            # swap data and metadata of destination and staging tables in a single atomic operation
+            sql.append(f"ALTER TABLE {table_name} SWAP WITH {staging_table_name};")
+            # staging table holds the replaced data now
+            sql.append(sql_client._truncate_table_sql(staging_table_name))
         return sql
 
 
@@ -161,6 +182,33 @@ class SnowflakeClient(SqlJobClientBase):
             )
         return job
 
+    def start_file_loads(self, table: TTableSchema, file_paths: Sequence[str], load_id: str) -> Iterator[LoadJob]:
+        """Loads referenced files of the same format and bucket with a single COPY INTO listing them in FILES"""
+        bucket_files: Dict[Tuple[str, str, str], List[Tuple[str, str]]] = {}
+        for file_path in file_paths:
+            if NewReferenceJob.is_reference_job(file_path):
+                bucket_path = NewReferenceJob.resolve_reference(file_path)
+                parsed_path = urlparse(bucket_path)
+                key = (parsed_path.scheme, parsed_path.netloc, os.path.splitext(bucket_path)[1][1:])
+                bucket_files.setdefault(key, []).append((file_path, bucket_path))
+            else:
+                yield self.start_file_load(table, file_path, load_id)
+        for files in bucket_files.values():
+            if len(files) == 1:
+                yield self.start_file_load(table, files[0][0], load_id)
+                continue
+            SnowflakeLoadJob.copy_from_bucket(
+                self.sql_client,
+                table["name"],
+                files[0][0],
+                [bucket_path for _, bucket_path in files],
+                stage_name=self.config.stage_name,
+                staging_credentials=self.config.staging_credentials
+            )
+            # all files got loaded in a single transaction
+            for file_path, _ in files:
+                yield EmptyLoadJob.from_file_path(file_path, "completed")
+
     def restore_file_load(self, file_path: str) -> LoadJob:
         return EmptyLoadJob.from_file_path(file_path, "completed")
 
@@ -203,12 +251,12 @@ class SnowflakeClient(SqlJobClientBase):
         name = self.capabilities.escape_identifier(c["name"])
         return f"{name} {self._to_db_type(c['data_type'])} {self._gen_not_null(c['nullable'])}"
 
-    def get_storage_table(self, table_name: str) -> Tuple[bool, TTableSchemaColumns]:
-        table_name = table_name.upper()  # All snowflake tables are uppercased in information schema
-        exists, table = super().get_storage_table(table_name)
-        if not exists:
-            return exists, table
+    def get_storage_tables(self, table_names: Iterable[str]) -> Dict[str, TTableSchemaColumns]:
+        upper_names = {table_name.upper(): table_name for table_name in table_names}  # All snowflake tables are uppercased in information schema
+        storage_tables = super().get_storage_tables(upper_names)
         # Snowflake converts all unquoted columns to UPPER CASE
         # Convert back to lower case to enable comparison with dlt schema
-        table = {col_name.lower(): dict(col, name=col_name.lower()) for col_name, col in table.items()}  # type: ignore
-        return exists, table
+        return {
+            upper_names[name]: {col_name.lower(): dict(col, name=col_name.lower()) for col_name, col in table.items()}  # type: ignore
+            for name, table in storage_tables.items()
+        }
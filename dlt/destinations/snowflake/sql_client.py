@@ -6,17 +6,27 @@ import snowflake.connector as snowflake_lib
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.destinations.exceptions import DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 from dlt.destinations.sql_client import DBApiCursorImpl, SqlClientBase, raise_database_error, raise_open_connection_error
-from dlt.destinations.typing import DBApi, DBApiCursor, DBTransaction, DataFrame
+from dlt.destinations.typing import ArrowTable, DBApi, DBApiCursor, DBTransaction
 from dlt.destinations.snowflake.configuration import SnowflakeCredentials
 from dlt.destinations.snowflake import capabilities
 
 class SnowflakeCursorImpl(DBApiCursorImpl):
-    native_cursor: snowflake_lib.cursor.SnowflakeCursor  # type: ignore[assignment]
+    native_arrow = True
 
-    def df(self, chunk_size: int = None, **kwargs: Any) -> Optional[DataFrame]:
-        if chunk_size is None:
-            return self.native_cursor.fetch_pandas_all(**kwargs)
-        return super().df(chunk_size=chunk_size, **kwargs)
+    native_cursor: snowflake_lib.cursor.SnowflakeCursor
+
+    def iter_arrow(self, chunk_size: int, **kwargs: Any) -> Iterator[ArrowTable]:
+        from dlt.common.libs.pyarrow import rechunk_arrow_tables
+
+        # batches are sized by the server, slice them into chunks
+        yield from rechunk_arrow_tables(self.native_cursor.fetch_arrow_batches(**kwargs), chunk_size)
+
+    def _fetch_arrow_all(self, **kwargs: Any) -> ArrowTable:
+        table = self.native_cursor.fetch_arrow_all(**kwargs)
+        if table is None:
+            # no rows in the results
+            return super()._fetch_arrow_all()
+        return table
 
 
 class SnowflakeSqlClient(SqlClientBase[snowflake_lib.SnowflakeConnection], DBTransaction):
@@ -90,7 +100,7 @@ class SnowflakeSqlClient(SqlClientBase[snowflake_lib.SnowflakeConnection], DBTra
     def execute_query(self, query: AnyStr, *args: Any, **kwargs: Any) -> Iterator[DBApiCursor]:
         curr: DBApiCursor = None
         db_args = args if args else kwargs if kwargs else None
-        with self._conn.cursor() as curr:  # type: ignore[assignment]
+        with self._conn.cursor() as curr:
             try:
                 curr.execute(query, db_args, num_statements=0)
                 yield SnowflakeCursorImpl(curr)  # type: ignore[abstract]
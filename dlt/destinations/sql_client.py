@@ -9,13 +9,15 @@ from dlt.common.typing import TFun
 from dlt.common.destination import DestinationCapabilitiesContext
 
 from dlt.destinations.exceptions import DestinationConnectionError, LoadClientNotConnected
-from dlt.destinations.typing import DBApi, TNativeConn, DBApiCursor, DataFrame, DBTransaction
+from dlt.destinations.typing import DBApi, TNativeConn, DBApiCursor, DataFrame, ArrowTable, DBTransaction
 
 
 class SqlClientBase(ABC, Generic[TNativeConn]):
 
     dbapi: ClassVar[DBApi] = None
     capabilities: ClassVar[DestinationCapabilitiesContext] = None
+    staging_load_id: Optional[str] = None
+    """When set, a separate staging dataset is used for the load package with that id"""
 
     def __init__(self, database_name: str, dataset_name: str) -> None:
         if not dataset_name:
@@ -122,7 +124,7 @@ SELECT 1
     def with_staging_dataset(self, staging: bool = False)-> ContextManager["SqlClientBase[TNativeConn]"]:
         dataset_name = self.dataset_name
         if staging:
-            dataset_name = SqlClientBase.make_staging_dataset_name(dataset_name)
+            dataset_name = SqlClientBase.make_staging_dataset_name(dataset_name, self.staging_load_id)
         return self.with_alternative_dataset_name(dataset_name)
 
     def _ensure_native_conn(self) -> None:
@@ -141,8 +143,12 @@ SELECT 1
         return any(t.__name__ in ("DatabaseError", "DataError") for t in mro)
 
     @staticmethod
-    def make_staging_dataset_name(dataset_name: str) -> str:
-        return dataset_name + "_staging"
+    def make_staging_dataset_name(dataset_name: str, load_id: str = None) -> str:
+        staging_dataset_name = dataset_name + "_staging"
+        if load_id:
+            # load ids are timestamps with fractional part
+            staging_dataset_name += "_" + load_id.replace(".", "_")
+        return staging_dataset_name
 
     #
     # generate sql statements
@@ -155,9 +161,14 @@ SELECT 1
 
 
 class DBApiCursorImpl(DBApiCursor):
-    """A DBApi Cursor wrapper with dataframes reading functionality"""
+    """A DBApi Cursor wrapper with Arrow tables and dataframes reading functionality"""
+    native_arrow: ClassVar[bool] = False
+    """Cursor fetches Arrow tables natively so data frames are converted from them"""
+
     def __init__(self, curr: DBApiCursor) -> None:
         self.native_cursor = curr
+        # chunks of the results when read with `arrow` and `chunk_size`
+        self._arrow_chunks: Iterator[ArrowTable] = None
 
         # wire protocol methods
         self.execute = curr.execute  # type: ignore
@@ -172,6 +183,12 @@ class DBApiCursorImpl(DBApiCursor):
         return [c[0] for c in self.native_cursor.description]
 
     def df(self, chunk_size: int = None, **kwargs: Any) -> Optional[DataFrame]:
+        if self.native_arrow and ArrowTable is not None:
+            table = self.arrow(chunk_size=chunk_size)
+            if table is None:
+                return None
+            return table.to_pandas(**kwargs)
+
         from dlt.helpers.pandas_helper import _wrap_result
 
         columns = self._get_columns()
@@ -185,6 +202,31 @@ class DBApiCursorImpl(DBApiCursor):
             else:
                 return df
 
+    def arrow(self, chunk_size: int = None, **kwargs: Any) -> Optional[ArrowTable]:
+        if chunk_size is None:
+            return self._fetch_arrow_all(**kwargs)
+        # keep the iterator so native readers are not recreated with each chunk
+        if self._arrow_chunks is None:
+            self._arrow_chunks = self.iter_arrow(chunk_size, **kwargs)
+        return next(self._arrow_chunks, None)
+
+    def iter_arrow(self, chunk_size: int, **kwargs: Any) -> Iterator[ArrowTable]:
+        from dlt.common.libs.pyarrow import rows_to_arrow_table
+
+        # rows are converted with `rows_to_arrow_table` so it receives the remaining kwargs
+        schema = kwargs.pop("schema", None)
+        columns = self._get_columns()
+        while rows := self.native_cursor.fetchmany(chunk_size):
+            table = rows_to_arrow_table(rows, columns, schema, **kwargs)
+            # next chunks keep the types of this one so all chunks have the same schema
+            schema = table.schema
+            yield table
+
+    def _fetch_arrow_all(self, **kwargs: Any) -> ArrowTable:
+        from dlt.common.libs.pyarrow import rows_to_arrow_table
+
+        return rows_to_arrow_table(self.native_cursor.fetchall(), self._get_columns(), **kwargs)
+
 
 def raise_database_error(f: TFun) -> TFun:
 
@@ -17,10 +17,11 @@ class SqlBaseJob(NewLoadJobImpl):
     failed_text: str = ""
 
     @classmethod
-    def from_table_chain(cls, table_chain: Sequence[TTableSchema], sql_client: SqlClientBase[Any]) -> NewLoadJobImpl:
+    def from_table_chain(cls, table_chain: Sequence[TTableSchema], sql_client: SqlClientBase[Any], **kwargs: Any) -> NewLoadJobImpl:
         """Generates a list of sql statements, that will be executed by the sql client when the job is executed in the loader.
 
         The `table_chain` contains a list schemas of a tables with parent-child relationship, ordered by the ancestry (the root of the tree is first on the list).
+        `kwargs` are passed to `generate_sql`.
         """
 
         top_table = table_chain[0]
@@ -28,7 +29,7 @@ class SqlBaseJob(NewLoadJobImpl):
         try:
             # Remove line breaks from multiline statements and write one SQL statement per line in output file
             # to support clients that need to execute one statement at a time (i.e. snowflake)
-            sql = [' '.join(stmt.splitlines()) for stmt in cls.generate_sql(table_chain, sql_client)]
+            sql = [' '.join(stmt.splitlines()) for stmt in cls.generate_sql(table_chain, sql_client, **kwargs)]
             job = cls(file_info.job_id(), "running")
             job._save_text_file("\n".join(sql))
         except Exception:
@@ -64,7 +65,7 @@ class SqlMergeJob(SqlBaseJob):
     failed_text: str = "Tried to generate a merge sql job for the following tables:"
 
     @classmethod
-    def generate_sql(cls, table_chain: Sequence[TTableSchema], sql_client: SqlClientBase[Any]) -> List[str]:
+    def generate_sql(cls, table_chain: Sequence[TTableSchema], sql_client: SqlClientBase[Any], deduplicate: bool = True) -> List[str]:
         """Generates a list of sql statements that merge the data in staging dataset with the data in destination dataset.
 
         The `table_chain` contains a list schemas of a tables with parent-child relationship, ordered by the ancestry (the root of the tree is first on the list).
@@ -72,9 +73,10 @@ class SqlMergeJob(SqlBaseJob):
         The child tables are merged based on propagated `root_key` which is a type of foreign key but always leading to a root table.
 
         First we store the root_keys of root table elements to be deleted in the temp table. Then we use the temp table to delete records from root and all child tables in the destination dataset.
-        At the end we copy the data from the staging dataset into destination dataset.
+        At the end we copy the data from the staging dataset into destination dataset. Rows with the same primary key are deduplicated
+        unless `deduplicate` is False, which may be set when the staging data is known to contain unique primary keys.
         """
-        return cls.gen_merge_sql(table_chain, sql_client)
+        return cls.gen_merge_sql(table_chain, sql_client, deduplicate)
 
     @classmethod
     def _gen_key_table_clauses(cls, primary_keys: Sequence[str], merge_keys: Sequence[str])-> List[str]:
@@ -108,6 +110,19 @@ class SqlMergeJob(SqlBaseJob):
             sql.append(f"INSERT INTO {temp_table_name} SELECT {unique_column} {clause};")
         return sql, temp_table_name
 
+    @classmethod
+    def gen_delete_from_sql(cls, table_name: str, column_name: str, temp_table_name: str, temp_table_column: str, sql_client: SqlClientBase[Any]) -> str:
+        """Generate DELETE FROM statement deleting the records from `table_name` with `column_name` found in `temp_table_column` of the delete temp table.
+
+           Joins the temp table with DELETE ... USING on engines that support it, which is much cheaper than the IN subquery over large key sets.
+        """
+        qualified_table_name = sql_client.make_qualified_table_name(table_name)
+        if sql_client.capabilities.supports_delete_using:
+            # both tables may have a column with the same name so column references must be qualified
+            escaped_table_name = sql_client.capabilities.escape_identifier(table_name)
+            return f"DELETE FROM {qualified_table_name} USING {temp_table_name} WHERE {escaped_table_name}.{column_name} = {temp_table_name}.{temp_table_column};"
+        return f"DELETE FROM {qualified_table_name} WHERE {column_name} IN (SELECT * FROM {temp_table_name});"
+
     @classmethod
     def gen_insert_temp_table_sql(cls, staging_root_table_name: str, primary_keys: Sequence[str], unique_column: str) -> Tuple[List[str], str]:
         sql: List[str] = []
@@ -121,7 +136,7 @@ class SqlMergeJob(SqlBaseJob):
         return sql, temp_table_name
 
     @classmethod
-    def gen_merge_sql(cls, table_chain: Sequence[TTableSchema], sql_client: SqlClientBase[Any]) -> List[str]:
+    def gen_merge_sql(cls, table_chain: Sequence[TTableSchema], sql_client: SqlClientBase[Any], deduplicate: bool = True) -> List[str]:
         sql: List[str] = []
         root_table = table_chain[0]
 
@@ -161,10 +176,9 @@ class SqlMergeJob(SqlBaseJob):
             create_delete_temp_table_sql, delete_temp_table_sql = cls.gen_delete_temp_table_sql(unique_column, key_table_clauses)
             sql.extend(create_delete_temp_table_sql)
             # delete top table
-            sql.append(f"DELETE FROM {root_table_name} WHERE {unique_column} IN (SELECT * FROM {delete_temp_table_sql});")
+            sql.append(cls.gen_delete_from_sql(root_table["name"], unique_column, delete_temp_table_sql, unique_column, sql_client))
             # delete other tables
             for table in table_chain[1:]:
-                table_name = sql_client.make_qualified_table_name(table["name"])
                 root_key_columns = get_columns_names_with_prop(table, "root_key")
                 if not root_key_columns:
                     raise MergeDispositionException(
@@ -174,9 +188,9 @@ class SqlMergeJob(SqlBaseJob):
                         f"There is no root foreign key (ie _dlt_root_id) in child table {table['name']} so it is not possible to refer to top level table {root_table['name']} unique column {unique_column}"
                     )
                 root_key_column = sql_client.capabilities.escape_identifier(root_key_columns[0])
-                sql.append(f"DELETE FROM {table_name} WHERE {root_key_column} IN (SELECT * FROM {delete_temp_table_sql});")
+                sql.append(cls.gen_delete_from_sql(table["name"], root_key_column, delete_temp_table_sql, unique_column, sql_client))
             # create temp table used to deduplicate, only when we have primary keys
-            if primary_keys:
+            if primary_keys and deduplicate:
                 create_insert_temp_table_sql, insert_temp_table_sql = cls.gen_insert_temp_table_sql(staging_root_table_name, primary_keys, unique_column)
                 sql.extend(create_insert_temp_table_sql)
 
@@ -187,7 +201,8 @@ class SqlMergeJob(SqlBaseJob):
                 staging_table_name = sql_client.make_qualified_table_name(table["name"])
             columns = ", ".join(map(sql_client.capabilities.escape_identifier, get_columns_names_with_prop(table, "name")))
             insert_sql = f"INSERT INTO {table_name}({columns}) SELECT {columns} FROM {staging_table_name}"
-            if len(primary_keys) > 0:
+            # deduplication may be disabled when staging rows have unique primary keys
+            if len(primary_keys) > 0 and deduplicate:
                 if len(table_chain) == 1:
                     insert_sql = f"""INSERT INTO {table_name}({columns})
                         WITH _dlt_dedup_numbered AS (
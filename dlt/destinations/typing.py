@@ -1,9 +1,14 @@
-from typing import Any, AnyStr, List, Type, Optional, Protocol, Tuple, TypeVar
+from typing import Any, AnyStr, Iterator, List, Type, Optional, Protocol, Tuple, TypeVar
 try:
     from pandas import DataFrame
 except ImportError:
     DataFrame: Type[Any] = None  # type: ignore
 
+try:
+    from pyarrow import Table as ArrowTable
+except ImportError:
+    ArrowTable: Type[Any] = None  # type: ignore
+
 # native connection
 TNativeConn = TypeVar("TNativeConn", bound=Any)
 
@@ -42,16 +47,34 @@ class DBApiCursor(Protocol):
     def df(self, chunk_size: int = None, **kwargs: None) -> Optional[DataFrame]:
         """Fetches the results as data frame. For large queries the results may be chunked
 
-        Fetches the results into a data frame. The default implementation uses helpers in `pandas.io.sql` to generate Pandas data frame.
-        This function will try to use native data frame generation for particular destination. For `BigQuery`: `QueryJob.to_dataframe` is used.
-        For `duckdb`: `DuckDBPyConnection.df'
+        If the driver fetches Arrow tables natively (`duckdb`, `BigQuery`, `Snowflake`), the results are fetched with `arrow` and converted into Pandas data frame.
+        Other destinations convert the fetched rows with `pandas.DataFrame.from_records`.
 
         Args:
             chunk_size (int, optional): Will chunk the results into several data frames. Defaults to None
-            **kwargs (Any): Additional parameters which will be passed to native data frame generation function.
+            **kwargs (Any): Additional parameters which will be passed to `pyarrow.Table.to_pandas` or `pandas.DataFrame.from_records`.
 
         Returns:
             Optional[DataFrame]: A data frame with query results. If chunk_size > 0, None will be returned if there is no more data in results
         """
         ...
 
+    def arrow(self, chunk_size: int = None, **kwargs: Any) -> Optional[ArrowTable]:
+        """Fetches the results as Arrow table. For large queries the results may be chunked
+
+        Uses native Arrow fetch where the driver supports it. For `duckdb`: `DuckDBPyConnection.fetch_arrow_table`, for `BigQuery`: `QueryJob.to_arrow`
+        which reads with Storage Read API when available, for `Snowflake`: `SnowflakeCursor.fetch_arrow_batches`. Other destinations fetch the rows
+        in batches and convert them into Arrow tables. All chunks keep the column types of the first chunk in which the column had a value.
+
+        Args:
+            chunk_size (int, optional): Will chunk the results into several tables. Defaults to None
+            **kwargs (Any): Additional parameters which will be passed to native Arrow fetch function. Other destinations accept `schema` with Arrow types of the columns.
+
+        Returns:
+            Optional[ArrowTable]: An Arrow table with query results. If chunk_size > 0, None will be returned if there is no more data in results
+        """
+        ...
+
+    def iter_arrow(self, chunk_size: int, **kwargs: Any) -> Iterator[ArrowTable]:
+        """Yields Arrow tables with `chunk_size` rows until all the results are fetched. The last table may be shorter"""
+        ...
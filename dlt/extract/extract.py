@@ -1,6 +1,6 @@
 import contextlib
 import os
-from typing import ClassVar, List, Set
+from typing import ClassVar, Dict, List, Set
 
 from dlt.common.configuration.container import Container
 from dlt.common.configuration.resolve import inject_section
@@ -86,22 +86,31 @@ def extract(
             resources_with_items.add(resource_name)
             storage.write_data_item(extract_id, schema.name, table_name, item, None)
 
-        def _write_dynamic_table(resource: DltResource, item: TDataItem) -> None:
-            table_name = resource._table_name_hint_fun(item)
-            existing_table = dynamic_tables.get(table_name)
-            if existing_table is None:
-                dynamic_tables[table_name] = [resource.table_schema(item)]
-            else:
-                # quick check if deep table merge is required
-                if resource._table_has_other_dynamic_hints:
-                    new_table = resource.table_schema(item)
-                    # this merges into existing table in place
-                    utils.merge_tables(existing_table[0], new_table)
+        def _write_dynamic_table(resource: DltResource, item: TDataItems) -> None:
+            # group items by table name so each table is written with a single call
+            items = item if isinstance(item, list) else [item]
+            table_items: Dict[str, List[TDataItem]] = {}
+            for row in items:
+                table_name = resource._table_name_hint_fun(row)
+                existing_table = dynamic_tables.get(table_name)
+                if existing_table is None:
+                    dynamic_tables[table_name] = [resource.table_schema(row)]
+                else:
+                    # quick check if deep table merge is required
+                    if resource._table_has_other_dynamic_hints:
+                        new_table = resource.table_schema(row)
+                        # this merges into existing table in place
+                        utils.merge_tables(existing_table[0], new_table)
+                    else:
+                        # if there are no other dynamic hints besides name then we just leave the existing partial table
+                        pass
+                if table_name in table_items:
+                    table_items[table_name].append(row)
                 else:
-                    # if there are no other dynamic hints besides name then we just leave the existing partial table
-                    pass
+                    table_items[table_name] = [row]
             # write to storage with inferred table name
-            _write_item(table_name, resource.name, item)
+            for table_name, rows in table_items.items():
+                _write_item(table_name, resource.name, rows)
 
         def _write_static_table(resource: DltResource, table_name: str) -> None:
             existing_table = dynamic_tables.get(table_name)
@@ -135,11 +144,7 @@ def extract(
                 else:
                     # get partial table from table template
                     if resource._table_name_hint_fun:
-                        if isinstance(pipe_item.item, List):
-                            for item in pipe_item.item:
-                                _write_dynamic_table(resource, item)
-                        else:
-                            _write_dynamic_table(resource, pipe_item.item)
+                        _write_dynamic_table(resource, pipe_item.item)
                     else:
                         # write item belonging to table with static name
                         table_name = resource.table_name
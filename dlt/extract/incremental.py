@@ -1,13 +1,16 @@
 import os
-from typing import Generic, TypeVar, Any, Optional, Callable, List, TypedDict, get_args, get_origin, Sequence, Type
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generic, TypeVar, Any, Optional, Callable, Iterator, List, Set, Tuple, TypedDict, get_args, get_origin, Sequence, Type
 import inspect
 from functools import wraps
-from datetime import datetime  # noqa: I251
+from datetime import date, datetime  # noqa: I251
 
 import dlt
 from dlt.common import pendulum, logger
 from dlt.common.json import json
-from dlt.common.jsonpath import compile_path, find_values, JSONPath
+from dlt.common.jsonpath import compile_path, find_values, single_field_name, JSONPath
 from dlt.common.typing import TDataItem, TDataItems, TFun, extract_inner_type, get_generic_type_argument_from_instance, is_optional_type
 from dlt.common.schema.typing import TColumnKey
 from dlt.common.configuration import configspec, ConfigurationValueError
@@ -50,6 +53,32 @@ class IncrementalPrimaryKeyMissing(PipeException):
         super().__init__(pipe_name, msg)
 
 
+class IncrementalRangeNotSplittable(PipeException):
+    def __init__(self, pipe_name: str, initial_value: Any, end_value: Any, msg: str) -> None:
+        self.initial_value = initial_value
+        self.end_value = end_value
+        super().__init__(pipe_name, f"Cannot split incremental range from {initial_value} to {end_value}: {msg}")
+
+
+def split_range(initial_value: TCursorValue, end_value: TCursorValue, partitions: int) -> List[Tuple[TCursorValue, TCursorValue]]:
+    """Splits `[initial_value, end_value)` into at most `partitions` adjacent ranges of equal length. Works for int, float, date and datetime values.
+    The `end_value` may be lower than `initial_value` (ie. when `min` is used as `last_value_func`). Ranges that would be empty are dropped.
+    """
+    if partitions < 1:
+        raise ValueError(partitions)
+    if isinstance(initial_value, bool) or type(initial_value) is not type(end_value):
+        raise TypeError(f"Values {initial_value} and {end_value} have different types")
+    if isinstance(initial_value, int):
+        bounds = [initial_value + (end_value - initial_value) * i // partitions for i in range(partitions)]
+    elif isinstance(initial_value, (float, datetime, date)):
+        step = (end_value - initial_value) / partitions
+        bounds = [initial_value + step * i for i in range(partitions)]
+    else:
+        raise TypeError(f"Values of type {type(initial_value).__name__} cannot be split")
+    bounds.append(end_value)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start != end]
+
+
 @configspec
 class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
     """Adds incremental extraction for a resource by storing a cursor value in persistent state.
@@ -117,6 +146,11 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
 
         self._cached_state: IncrementalColumnState = None
         """State dictionary cached on first access"""
+        self._cursor_field: str = None
+        """Name of the cursor field if cursor path is a simple top level key"""
+        self._unique_hashes_list: List[str] = None
+        self._unique_hashes_set: Set[str] = None
+        """Set of hashes mirroring `unique_hashes` list in state for fast lookups"""
         super().__init__(self.transform)
 
         self.end_out_of_range: bool = False
@@ -246,19 +280,38 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         except KeyError as k_err:
             raise IncrementalPrimaryKeyMissing(self.resource_name, k_err.args[0], row)
 
-    def transform(self, row: TDataItem) -> bool:
-        if row is None:
-            return True
-
-        row_values = find_values(self.cursor_path_p, row)
-        if not row_values:
-            raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
-        row_value = row_values[0]
+    def _unique_hashes(self) -> Set[str]:
+        """Returns a set of `unique_hashes` from the state. The set is rebuilt only when the list in state was replaced or modified elsewhere"""
+        unique_hashes = self._cached_state["unique_hashes"]
+        if unique_hashes is not self._unique_hashes_list or len(unique_hashes) != len(self._unique_hashes_set):
+            self._unique_hashes_list = unique_hashes
+            self._unique_hashes_set = set(unique_hashes)
+        return self._unique_hashes_set
+
+    def find_cursor_value(self, row: TDataItem) -> Any:
+        """Finds a cursor value in `row`. A simple top level key is read directly from the row without evaluating the json path."""
+        if self._cursor_field is not None and isinstance(row, dict):
+            try:
+                row_value = row[self._cursor_field]
+            except KeyError:
+                raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
+        else:
+            row_values = find_values(self.cursor_path_p, row)
+            if not row_values:
+                raise IncrementalCursorPathMissing(self.resource_name, self.cursor_path, row)
+            row_value = row_values[0]
 
         # For datetime cursor, ensure the value is a timezone aware datetime.
         # The object saved in state will always be a tz aware pendulum datetime so this ensures values are comparable
         if isinstance(row_value, datetime):
             row_value = pendulum.instance(row_value)
+        return row_value
+
+    def transform(self, row: TDataItem) -> bool:
+        if row is None:
+            return True
+
+        row_value = self.find_cursor_value(row)
 
         incremental_state = self._cached_state
         last_value = incremental_state['last_value']
@@ -281,10 +334,12 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
                 unique_value = self.unique_value(row)
                 # if unique value exists then use it to deduplicate
                 if unique_value:
-                    if unique_value in incremental_state['unique_hashes']:
+                    unique_hashes = self._unique_hashes()
+                    if unique_value in unique_hashes:
                         return False
                     # add new hash only if the record row id is same as current last value
                     incremental_state['unique_hashes'].append(unique_value)
+                    unique_hashes.add(unique_value)
                 return True
             # skip the record that is not a last_value or new_value: that record was already processed
             check_values = (row_value,) + ((self.start_value,) if self.start_value is not None else ())
@@ -303,6 +358,153 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
 
         return True
 
+    def transform_page(self, rows: List[TDataItem]) -> bool:
+        """Processes a page of `rows` at once when all of them are new: their cursor values are unique, beyond the `last_value` and within the `end_value`.
+        In that case the state is updated with a single comparison of page minimum and maximum and all rows are kept. Returns False if
+        the page must be processed row by row. Works only with built-in `max` and `min` as `last_value_func`.
+        """
+        last_value_func = self.last_value_func
+        if last_value_func is not max and last_value_func is not min:
+            return False
+        if any(row is None for row in rows):
+            return False
+        row_values = [self.find_cursor_value(row) for row in rows]
+        incremental_state = self._cached_state
+        last_value = incremental_state["last_value"]
+        try:
+            # value closest to the end of the range and value closest to the last value
+            page_value = last_value_func(row_values)
+            bound_value = min(row_values) if last_value_func is max else max(row_values)
+            # rows with the same cursor value may require deduplication
+            if len(set(row_values)) != len(row_values):
+                return False
+            # rows at or before last value may require deduplication or filtering
+            if last_value is not None and last_value_func((bound_value, last_value)) == last_value:
+                return False
+            # rows at or after end value are filtered out
+            if self.end_value is not None and (last_value_func((page_value, self.end_value)) != self.end_value or page_value == self.end_value):
+                return False
+        except TypeError:
+            # values not comparable or not hashable, row by row processing will handle it
+            return False
+        incremental_state["last_value"] = page_value
+        unique_value = self.unique_value(rows[row_values.index(page_value)])
+        if unique_value:
+            incremental_state["unique_hashes"] = [unique_value]
+        return True
+
+    def parallel_ranges(
+        self,
+        fetch_range: Callable[[TCursorValue, TCursorValue], Iterator[TDataItems]],
+        partitions: int,
+        workers: int = None
+    ) -> Iterator[TDataItems]:
+        """Splits `[initial_value, end_value)` into `partitions` cursor ranges and fetches them concurrently in a thread pool.
+
+        Use it to backfill large ranges from within a resource that receives this incremental in its argument:
+        >>> @dlt.resource(primary_key="id")
+        >>> def issues(updated_at=dlt.sources.incremental("updated_at", initial_value=0, end_value=2000000)):
+        >>>     yield from updated_at.parallel_ranges(lambda start, end: request_issues(start, end), partitions=8)
+
+        `fetch_range` is called with start and end of each range in a worker thread and should yield the data items in that range. The items from each
+        range are filtered with a separate instance of this incremental, using the stateless `end_value` semantics, so ranges do not overlap.
+        Items from all ranges are yielded as they arrive so their order is not preserved. When all ranges are fetched without errors, the `last_value` and
+        `unique_hashes` found in the whole range are written to the resource state so the next incremental load continues from there. Nothing is written if
+        any of the ranges fails.
+
+        Args:
+            fetch_range: A callable that receives start and end value of the range and yields data items within it
+            partitions: A number of ranges to split into
+            workers: A number of worker threads. Defaults to `partitions`
+
+        Returns:
+            Iterator[TDataItems]: Data items from all ranges
+        """
+        if not self.resource_name:
+            raise IncrementalUnboundError(self.cursor_path)
+        if self.initial_value is None or self.end_value is None:
+            raise IncrementalRangeNotSplittable(self.resource_name, self.initial_value, self.end_value, "both initial_value and end_value are required")
+        try:
+            ranges = split_range(self.initial_value, self.end_value, partitions)
+        except (TypeError, ValueError) as ex:
+            raise IncrementalRangeNotSplittable(self.resource_name, self.initial_value, self.end_value, str(ex))
+
+        range_incrementals: List[Incremental[TCursorValue]] = []
+        for start, end in ranges:
+            range_incremental = self.copy()
+            range_incremental.initial_value = start
+            range_incremental.end_value = end
+            range_incremental.allow_external_schedulers = False
+            range_incremental.resolve()
+            range_incrementals.append(range_incremental.bind(Pipe(self.resource_name)))
+
+        workers = workers or len(range_incrementals)
+        # bounded queue so the workers do not fetch far ahead of the extraction
+        items: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=workers * 2)
+        stop = threading.Event()
+
+        def _put(kind: str, payload: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    items.put((kind, payload), timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def _fetch(range_incremental: Incremental[TCursorValue]) -> None:
+            try:
+                if stop.is_set():
+                    return
+                for item in fetch_range(range_incremental.initial_value, range_incremental.end_value):
+                    item = range_incremental(item)
+                    if item is not None and not _put("item", item):
+                        return
+                _put("done", None)
+            except Exception as ex:
+                _put("error", ex)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"incremental_{self.resource_name}") as pool:
+            try:
+                for range_incremental in range_incrementals:
+                    pool.submit(_fetch, range_incremental)
+                pending = len(range_incrementals)
+                while pending:
+                    kind, payload = items.get()
+                    if kind == "item":
+                        yield payload
+                    elif kind == "done":
+                        pending -= 1
+                    else:
+                        raise payload
+            finally:
+                stop.set()
+
+        # all ranges succeeded: this instance filtered all the items with its stateless state, now persist it
+        self._write_backfill_state()
+
+    def _write_backfill_state(self) -> None:
+        """Writes `last_value` and `unique_hashes` collected with end value mock state into the resource state if they are beyond the stored last value"""
+        backfill_state = self._cached_state
+        if backfill_state["last_value"] is None:
+            return
+        state = Incremental._get_state(self.resource_name, self.cursor_path)
+        stored_value = state.get("last_value")
+        new_value = backfill_state["last_value"]
+        if stored_value is not None:
+            if self.last_value_func((new_value, stored_value)) != new_value:
+                return
+            if new_value == stored_value:
+                # extend the hashes of rows with the same last value
+                stored_hashes = set(state["unique_hashes"])
+                state["unique_hashes"].extend(h for h in backfill_state["unique_hashes"] if h not in stored_hashes)
+                return
+        state.update({
+            "initial_value": state.get("initial_value", self.initial_value),
+            "last_value": new_value,
+            "unique_hashes": list(backfill_state["unique_hashes"])
+        })
+
     def get_incremental_value_type(self) -> Type[Any]:
         """Infers the type of incremental value from a class of an instance if those preserve the Generic arguments information."""
         return get_generic_type_argument_from_instance(self, self.initial_value)
@@ -365,6 +567,8 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         if self.is_partial():
             raise IncrementalCursorPathMissing(pipe.name, None, None)
         self.resource_name = pipe.name
+        # access simple top level keys without evaluating json path
+        self._cursor_field = single_field_name(self.cursor_path_p)
         # try to join external scheduler
         if self.allow_external_schedulers:
             self._join_external_scheduler()
@@ -375,6 +579,11 @@ class Incremental(FilterItem, BaseConfiguration, Generic[TCursorValue]):
         self._cached_state = self.get_state()
         return self
 
+    def __call__(self, item: TDataItems, meta: Any = None) -> Optional[TDataItems]:
+        if isinstance(item, list) and len(item) > 1 and self.transform_page(item):
+            return item
+        return super().__call__(item, meta)
+
     def __str__(self) -> str:
         return f"Incremental at {id(self)} for resource {self.resource_name} with cursor path: {self.cursor_path} initial {self.initial_value} lv_func {self.last_value_func}"
 
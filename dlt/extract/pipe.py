@@ -1,12 +1,13 @@
 import inspect
 import types
 import asyncio
+import time
 import makefun
 from asyncio import Future
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from threading import Thread
-from typing import Any, ContextManager, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
+from typing import Any, ContextManager, Dict, Optional, Sequence, Union, Callable, Iterable, Iterator, List, NamedTuple, Awaitable, Tuple, Type, TYPE_CHECKING, Literal
 
 from dlt.common import sleep
 from dlt.common.configuration import configspec
@@ -68,12 +69,45 @@ TPipeStep = Union[
 TPipeNextItemMode = Union[Literal["fifo"], Literal["round_robin"]]
 
 
+class PipeQueueDepth(NamedTuple):
+    """Number of pending sources and futures held by the `PipeIterator`, current and peak values"""
+    sources: int
+    futures: int
+    peak_sources: int
+    peak_futures: int
+
+
+class PipeStepProfiler:
+    """Records the number of calls and the time spent in each step of each pipe processed by `PipeIterator`.
+
+    Assign an instance to `PipeIterator.step_profiler` to enable profiling. Time spent in getting an item from a source (a generator or
+    an iterator returned by a transformer) is attributed to the pipe and step of the returned item. Items forked to child pipes
+    enter them at step -1.
+    """
+    def __init__(self) -> None:
+        self.calls: Dict[Tuple[str, int], int] = {}
+        self.elapsed: Dict[Tuple[str, int], float] = {}
+
+    def record(self, pipe_name: str, step: int, elapsed: float) -> None:
+        key = (pipe_name, step)
+        if key in self.calls:
+            self.calls[key] += 1
+            self.elapsed[key] += elapsed
+        else:
+            self.calls[key] = 1
+            self.elapsed[key] = elapsed
+
+    def clear(self) -> None:
+        self.calls.clear()
+        self.elapsed.clear()
+
+
 class ForkPipe:
     def __init__(self, pipe: "Pipe", step: int = -1, copy_on_fork: bool = False) -> None:
         """A transformer that forks the `pipe` and sends the data items to forks added via `add_pipe` method."""
         self._pipes: List[Tuple["Pipe", int]] = []
         self.copy_on_fork = copy_on_fork
-        """If true, the data items going to a forked pipe will be copied"""
+        """If true, the data items going to a forked pipe will be shallow copied. Nested objects are shared between the forks"""
         self.add_pipe(pipe, step)
 
     def add_pipe(self, pipe: "Pipe", step: int = -1) -> None:
@@ -88,7 +122,8 @@ class ForkPipe:
             if i == 0 or not self.copy_on_fork:
                 _it = item
             else:
-                # shallow copy the item
+                # shallow copy the item: a list of items or a dict gets a new container but nested values are not copied.
+                # this is cheap compared to deepcopy and isolates forks that add, remove or replace top level elements
                 _it = copy(item)
             # always start at the beginning
             yield ResolvablePipeItem(_it, step, pipe, meta)
@@ -443,6 +478,10 @@ class PipeIterator(Iterator[PipeItem]):
         self._sources: List[SourcePipeItem] = []
         self._futures: List[FuturePipeItem] = []
         self._next_item_mode = next_item_mode
+        self._peak_sources: int = 0
+        self._peak_futures: int = 0
+        self.step_profiler: PipeStepProfiler = None
+        """Records time spent in each pipe step when set"""
 
     @classmethod
     @with_config(spec=PipeIteratorConfiguration)
@@ -459,7 +498,7 @@ class PipeIterator(Iterator[PipeItem]):
         extract = cls(max_parallel_items, workers, futures_poll_interval, next_item_mode)
         # add as first source
         extract._sources.append(SourcePipeItem(pipe.gen, 0, pipe, None))
-        cls._initial_sources_count = 1
+        extract._initial_sources_count = extract._peak_sources = 1
         return extract
 
     @classmethod
@@ -507,9 +546,20 @@ class PipeIterator(Iterator[PipeItem]):
             _fork_pipeline(pipe)
 
         extract._initial_sources_count = len(extract._sources)
+        extract._peak_sources = extract._initial_sources_count
 
         return extract
 
+    @property
+    def queue_depth(self) -> PipeQueueDepth:
+        """Returns current and peak number of sources and futures pending in the iterator.
+
+        Sources are always drained starting from the most recently added one so parent generators are not advanced until nested iterators
+        are exhausted. The number of futures is bounded by `max_parallel_items`: when all slots are taken, the iterator stops requesting new items
+        from the sources until a future completes.
+        """
+        return PipeQueueDepth(len(self._sources), len(self._futures), self._peak_sources, self._peak_futures)
+
     def __next__(self) -> PipeItem:
         pipe_item: Union[ResolvablePipeItem, SourcePipeItem] = None
         # __next__ should call itself to remove the `while` loop and continue clauses but that may lead to stack overflows: there's no tail recursion opt in python
@@ -522,7 +572,13 @@ class PipeIterator(Iterator[PipeItem]):
                     pipe_item = self._resolve_futures()
                 # if none then take element from the newest source
                 if pipe_item is None:
-                    pipe_item = self._get_source_item()
+                    if self.step_profiler is None:
+                        pipe_item = self._get_source_item()
+                    else:
+                        started = time.perf_counter()
+                        pipe_item = self._get_source_item()
+                        if pipe_item is not None:
+                            self.step_profiler.record(pipe_item.pipe.name, pipe_item.step, time.perf_counter() - started)
 
                 if pipe_item is None:
                     if len(self._futures) == 0 and len(self._sources) == 0:
@@ -537,21 +593,30 @@ class PipeIterator(Iterator[PipeItem]):
             if isinstance(item, Iterator):
                 # print(f"adding iterable {item}")
                 self._sources.append(SourcePipeItem(item, pipe_item.step, pipe_item.pipe, pipe_item.meta))
+                self._peak_sources = max(self._peak_sources, len(self._sources))
                 pipe_item = None
                 continue
 
             if isinstance(item, Awaitable) or callable(item):
-                # do we have a free slot or one of the slots is done?
-                if len(self._futures) < self.max_parallel_items or self._next_future() >= 0:
+                # do we have a free slot?
+                if len(self._futures) < self.max_parallel_items:
                     if isinstance(item, Awaitable):
                         future = asyncio.run_coroutine_threadsafe(item, self._ensure_async_pool())
                     elif callable(item):
                         future = self._ensure_thread_pool().submit(item)
                     # print(future)
                     self._futures.append(FuturePipeItem(future, pipe_item.step, pipe_item.pipe, pipe_item.meta))  # type: ignore
+                    self._peak_futures = max(self._peak_futures, len(self._futures))
                     # pipe item consumed for now, request a new one
                     pipe_item = None
                     continue
+                elif self._next_future() >= 0:
+                    # one of the slots is done: park the item as a source so the completed futures are resolved first
+                    # this keeps the number of pending futures bounded by `max_parallel_items`
+                    self._sources.append(SourcePipeItem(iter([pipe_item]), pipe_item.step, pipe_item.pipe, pipe_item.meta))
+                    self._peak_sources = max(self._peak_sources, len(self._sources))
+                    pipe_item = None
+                    continue
                 else:
                     # print("maximum futures exceeded, waiting")
                     sleep(self.futures_poll_interval)
@@ -572,7 +637,12 @@ class PipeIterator(Iterator[PipeItem]):
             try:
                 set_current_pipe_name(pipe_item.pipe.name)
                 next_meta = pipe_item.meta
-                next_item = step(item, meta=pipe_item.meta)  # type: ignore
+                if self.step_profiler is None:
+                    next_item = step(item, meta=pipe_item.meta)  # type: ignore
+                else:
+                    started = time.perf_counter()
+                    next_item = step(item, meta=pipe_item.meta)  # type: ignore
+                    self.step_profiler.record(pipe_item.pipe.name, pipe_item.step + 1, time.perf_counter() - started)
                 if isinstance(next_item, DataItemWithMeta):
                     next_meta = next_item.meta
                     next_item = next_item.data
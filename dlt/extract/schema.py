@@ -132,7 +132,8 @@ class DltResourceSchema:
         else:
             self._table_name_hint_fun = None
         # check if any other hints in the table template should be inferred from data
-        self._table_has_other_dynamic_hints = any(callable(v) for k, v in table_schema_template.items() if k != "name")
+        # note: "resource" holds the name hint by default and is always replaced with the resource name in `table_schema`
+        self._table_has_other_dynamic_hints = any(callable(v) for k, v in table_schema_template.items() if k not in ("name", "resource"))
         self._table_schema_template = table_schema_template
 
     @staticmethod
@@ -520,12 +520,18 @@ class DltResourceDict(Dict[str, DltResource]):
     def find_by_pipe(self, pipe: Pipe) -> DltResource:
         # TODO: many resources may share the same pipe so return a list and also filter the resources by self._enabled_resource_names
         # identify pipes by _pipe_id
-        if pipe._pipe_id in self._known_pipes:
-            return self._known_pipes[pipe._pipe_id]
-        try:
-            return self._known_pipes.setdefault(pipe._pipe_id, next(r for r in self.values() if r._pipe._pipe_id == pipe._pipe_id))
-        except StopIteration:
-            raise KeyError(pipe)
+        resource = self._known_pipes.get(pipe._pipe_id)
+        # resource may have its pipe replaced after it was indexed
+        if resource is None or resource._pipe._pipe_id != pipe._pipe_id:
+            # index all resources in a single pass, forked and cloned pipes keep the pipe id of the original
+            self._known_pipes = {}
+            for r in self.values():
+                self._known_pipes.setdefault(r._pipe._pipe_id, r)
+            try:
+                resource = self._known_pipes[pipe._pipe_id]
+            except KeyError:
+                raise KeyError(pipe)
+        return resource
 
     def clone_new_pipes(self) -> None:
         cloned_pipes = ManagedPipeIterator.clone_pipes([r._pipe for r in self.values() if r in self._recently_added])
@@ -541,6 +547,8 @@ class DltResourceDict(Dict[str, DltResource]):
         resource.source_name = self.source_name
         # now set it in dict
         self._recently_added.append(resource)
+        # resource may replace a resource with the same pipe
+        self._known_pipes.clear()
         return super().__setitem__(resource_name, resource)
 
     def __delitem__(self, resource_name: str) -> None:
@@ -0,0 +1,104 @@
+import contextlib
+import threading
+import time
+from typing import Callable, Dict, Hashable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from dlt.common import logger
+from dlt.common.destination.reference import JobClientBase
+
+from dlt.destinations.job_client_impl import SqlJobClientBase
+
+
+class PooledJobClient(NamedTuple):
+    client: JobClientBase
+    opened_at: float
+    returned_at: float
+
+
+class JobClientPool:
+    """Keeps opened job clients so their connections are reused across load jobs and load packages.
+
+    Clients are stored under a key provided by the caller, which must identify the destination and the schema the client was created with.
+    Idle clients older than `max_lifetime` are closed. Idle clients not used for longer than `check_after` are checked with a simple query
+    before they are reused. Clients that raised an exception while borrowed are closed. Clients borrowed when the pool is closed
+    are closed when returned.
+    """
+    def __init__(self, max_lifetime: float, check_after: float) -> None:
+        self.max_lifetime = max_lifetime
+        self.check_after = check_after
+        self._idle: Dict[Hashable, List[PooledJobClient]] = {}
+        self._borrowed: Set[JobClientBase] = set()
+        self._close_on_return: Set[JobClientBase] = set()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def borrow(self, key: Hashable, create_client: Callable[[], JobClientBase]) -> Iterator[JobClientBase]:
+        """Borrows an opened client stored under `key` or opens a new one with `create_client`. The client is returned to the pool on exit"""
+        client, opened_at = self._take(key)
+        if client is None:
+            client = create_client()
+            client.__enter__()
+            opened_at = time.monotonic()
+        with self._lock:
+            self._borrowed.add(client)
+        try:
+            yield client
+        except BaseException:
+            with self._lock:
+                self._borrowed.discard(client)
+                self._close_on_return.discard(client)
+            # connection may be left in any state
+            self._close(client)
+            raise
+        with self._lock:
+            self._borrowed.discard(client)
+            close_client = client in self._close_on_return
+            if close_client:
+                self._close_on_return.discard(client)
+            else:
+                self._idle.setdefault(key, []).append(PooledJobClient(client, opened_at, time.monotonic()))
+        if close_client:
+            self._close(client)
+
+    def close_all(self) -> None:
+        """Closes all idle clients. Clients that are borrowed are closed when returned"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+            self._close_on_return.update(self._borrowed)
+        for pooled in idle.values():
+            for client, _, _ in pooled:
+                self._close(client)
+
+    def _take(self, key: Hashable) -> Tuple[Optional[JobClientBase], float]:
+        while True:
+            with self._lock:
+                pooled = self._idle.get(key)
+                if not pooled:
+                    return None, None
+                client, opened_at, returned_at = pooled.pop()
+            now = time.monotonic()
+            if now - opened_at > self.max_lifetime:
+                logger.info(f"Closing pooled client {type(client).__name__} that exceeded max lifetime of {self.max_lifetime}s")
+                self._close(client)
+            elif now - returned_at > self.check_after and not self._is_healthy(client):
+                logger.warning(f"Closing pooled client {type(client).__name__} that failed a health check")
+                self._close(client)
+            else:
+                return client, opened_at
+
+    @staticmethod
+    def _is_healthy(client: JobClientBase) -> bool:
+        if not isinstance(client, SqlJobClientBase):
+            return True
+        try:
+            client.sql_client.execute_sql("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(client: JobClientBase) -> None:
+        try:
+            client.__exit__(None, None, None)
+        except Exception:
+            logger.exception(f"Could not close pooled client {type(client).__name__}")
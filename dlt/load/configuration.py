@@ -14,6 +14,14 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """when True, raises on terminally failed jobs immediately"""
     raise_on_max_retries: int = 5
     """When gt 0 will raise when job reaches raise_on_max_retries"""
+    reuse_connections: bool = True
+    """Keeps destination connections open and reuses them across load jobs and packages"""
+    connection_max_lifetime: float = 600.0
+    """Reused connections older than that are closed, seconds"""
+    connection_check_after: float = 30.0
+    """Reused connections idle for longer than that are checked with a simple query before use, seconds"""
+    staging_dataset_per_load: bool = False
+    """Loads staging data of each load package into a separate staging dataset that is dropped in the background when package completes, instead of truncating the shared staging dataset"""
     _load_storage_config: LoadStorageConfiguration = None
 
     if TYPE_CHECKING:
@@ -0,0 +1,51 @@
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from dlt.common import logger
+from dlt.common.destination.reference import LoadJob, PolledJob
+
+
+class JobPoller:
+    """Decides when running load jobs are asked for their state.
+
+    Each job is polled with its own exponential backoff: a job that is still running is polled again after `min_interval`, and the interval is doubled
+    up to `max_interval` with each poll that finds the job running. Jobs that implement `PolledJob` get their states refreshed in batches, once for all jobs
+    of the same type that are due.
+    """
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        # next poll time and current interval for jobs found running
+        self._schedule: Dict[str, Tuple[float, float]] = {}
+
+    def due_jobs(self, jobs: Sequence[LoadJob]) -> List[LoadJob]:
+        """Returns jobs that should be polled now and refreshes states of the polled jobs in batches"""
+        now = time.monotonic()
+        due = [job for job in jobs if self._schedule.get(job.file_name(), (now, None))[0] <= now]
+        batches: Dict[Type[PolledJob], List[LoadJob]] = {}
+        for job in due:
+            if isinstance(job, PolledJob):
+                batches.setdefault(type(job), []).append(job)
+        for job_type, batch in batches.items():
+            try:
+                job_type.poll_states(batch)
+            except Exception:
+                # jobs will poll their states one by one
+                logger.exception(f"Could not poll states of {len(batch)} jobs of type {job_type.__name__}")
+        return due
+
+    def backoff(self, job: LoadJob) -> None:
+        """Schedules the next poll of a `job` that is still running"""
+        _, interval = self._schedule.get(job.file_name(), (None, None))
+        interval = self.min_interval if interval is None else min(interval * 2, self.max_interval)
+        self._schedule[job.file_name()] = (time.monotonic() + interval, interval)
+
+    def forget(self, job: LoadJob) -> None:
+        """Stops tracking a `job` that reached a terminal state"""
+        self._schedule.pop(job.file_name(), None)
+
+    def next_poll_in(self) -> Optional[float]:
+        """Seconds until the earliest scheduled poll or None if no job is scheduled"""
+        if not self._schedule:
+            return None
+        return max(min(next_poll for next_poll, _ in self._schedule.values()) - time.monotonic(), 0.0)
@@ -2,11 +2,12 @@ import contextlib
 from copy import copy
 from functools import reduce
 import datetime  # noqa: 251
-from typing import Dict, List, Optional, Tuple, Set, Iterator
-from multiprocessing.pool import ThreadPool
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple, Set, Iterator
+from multiprocessing.pool import AsyncResult, ThreadPool
 import os
+import threading
 
-from dlt.common import sleep, logger
+from dlt.common import logger
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.pipeline import LoadInfo, SupportsPipeline
@@ -14,22 +15,33 @@ from dlt.common.schema.utils import get_child_tables, get_top_level_table, get_w
 from dlt.common.storages.load_storage import LoadPackageInfo, ParsedLoadJobFileName, TJobState
 from dlt.common.typing import StrAny
 from dlt.common.runners import TRunMetrics, Runnable, workermethod
+from dlt.common.runtime import signals
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.runtime.logger import pretty_format_exception
 from dlt.common.exceptions import TerminalValueError
 from dlt.common.schema import Schema
 from dlt.common.schema.typing import VERSION_TABLE_NAME, TTableSchema, TWriteDisposition
-from dlt.common.storages import LoadStorage
+from dlt.common.storages import FileStorage, LoadStorage
+from dlt.common.destination import TLoaderFileFormat
 from dlt.common.destination.reference import DestinationClientDwhConfiguration, FollowupJob, JobClientBase, StagingJobClientBase, DestinationReference, LoadJob, NewLoadJob, TLoadJobState, DestinationClientConfiguration
 
 from dlt.destinations.job_impl import EmptyLoadJob
-from dlt.destinations.exceptions import DestinationTerminalException, DestinationTransientException, LoadJobUnknownTableException
+from dlt.destinations.job_client_impl import SqlJobClientBase
+from dlt.destinations.exceptions import DatabaseUndefinedRelation, DestinationTerminalException, DestinationTransientException, LoadJobUnknownTableException
 
+from dlt.load.client_pool import JobClientPool
+from dlt.load.job_poller import JobPoller
 from dlt.load.configuration import LoaderConfiguration
 from dlt.load.exceptions import LoadClientJobFailed, LoadClientJobRetry, LoadClientUnsupportedWriteDisposition, LoadClientUnsupportedFileFormats
 
 
 class Load(Runnable[ThreadPool]):
+    MIN_POLL_INTERVAL: ClassVar[float] = 0.05
+    """Initial interval between polls of the state of a running job, seconds"""
+    MAX_POLL_INTERVAL: ClassVar[float] = 1.0
+    """Load loop wakes up at least that often when no job made progress, seconds"""
+    MAX_JOB_POLL_INTERVAL: ClassVar[float] = 5.0
+    """Interval between polls of a running job is doubled up to this value, seconds"""
 
     @with_config(spec=LoaderConfiguration, sections=(known_sections.LOAD,))
     def __init__(
@@ -50,8 +62,17 @@ class Load(Runnable[ThreadPool]):
         self.capabilities = destination.capabilities()
         self.staging_destination = staging_destination
         self.pool: ThreadPool = None
+        self.client_pool: JobClientPool = None
+        if config.reuse_connections:
+            self.client_pool = JobClientPool(config.connection_max_lifetime, config.connection_check_after)
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
+        self.job_poller = JobPoller(Load.MIN_POLL_INTERVAL, Load.MAX_JOB_POLL_INTERVAL)
+        # set when a job started in the pool is ready
+        self._jobs_ready = threading.Event()
+        # staging datasets of completed packages being dropped in the pool
+        self._staging_drops: List["AsyncResult[None]"] = []
         self._processed_load_ids: Dict[str, int] = {}
+        self._max_files_per_copy_job: Dict[Tuple[bool, str], int] = {}
 
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
@@ -87,6 +108,26 @@ class Load(Runnable[ThreadPool]):
     def get_staging_destination_client(self, schema: Schema) -> JobClientBase:
         return self.staging_destination.client(schema, self.initial_staging_client_config)
 
+    @contextlib.contextmanager
+    def open_destination_client(self, schema: Schema, load_id: str, staging: bool = False) -> Iterator[JobClientBase]:
+        """Opens a destination or `staging` destination client for `schema` to load package `load_id`. Opened clients are reused if `reuse_connections` is set"""
+        def _create_client() -> JobClientBase:
+            return self.get_staging_destination_client(schema) if staging else self.get_destination_client(schema)
+
+        if self.client_pool is None:
+            with _create_client() as job_client:
+                self._set_staging_load_id(job_client, load_id)
+                yield job_client
+        else:
+            with self.client_pool.borrow((staging, schema.name, schema.version_hash), _create_client) as job_client:
+                # pooled clients are shared by packages
+                self._set_staging_load_id(job_client, load_id)
+                yield job_client
+
+    def _set_staging_load_id(self, job_client: JobClientBase, load_id: str) -> None:
+        if isinstance(job_client, SqlJobClientBase):
+            job_client.sql_client.staging_load_id = load_id if self.config.staging_dataset_per_load else None
+
     def is_staging_destination_job(self, file_path: str) -> bool:
         return self.staging_destination is not None and os.path.splitext(file_path)[1][1:] in self.staging_destination.capabilities().supported_loader_file_formats
 
@@ -105,8 +146,7 @@ class Load(Runnable[ThreadPool]):
         job: LoadJob = None
         try:
             # if we have a staging destination and the file is not a reference, send to staging
-            job_client = self.get_staging_destination_client(schema) if self.is_staging_destination_job(file_path) else self.get_destination_client(schema)
-            with job_client as job_client:
+            with self.open_destination_client(schema, load_id, staging=self.is_staging_destination_job(file_path)) as job_client:
                 job_info = self.load_storage.parse_job_file_name(file_path)
                 if job_info.file_format not in self.load_storage.supported_file_formats:
                     raise LoadClientUnsupportedFileFormats(job_info.file_format, self.capabilities.supported_loader_file_formats, file_path)
@@ -127,24 +167,77 @@ class Load(Runnable[ThreadPool]):
         self.load_storage.start_job(load_id, job.file_name())
         return job
 
-    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
-        # TODO: validate file type, combine files, finalize etc., this is client specific, jsonl for single table
-        # can just be combined, insert_values must be finalized and then combined
-        # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        # TODO: combine files by providing a list of files pertaining to same table into job, so job must be
-        # extended to accept a list
-        load_files = self.load_storage.list_new_jobs(load_id)[:self.config.workers]
-        file_count = len(load_files)
-        if file_count == 0:
-            logger.info(f"No new jobs found in {load_id}")
-            return 0, []
-        logger.info(f"Will load {file_count}, creating jobs")
-        param_chunk = [(id(self), file, load_id, schema) for file in load_files]
-        # exceptions should not be raised, None as job is a temporary failure
-        # other jobs should not be affected
-        jobs: List[LoadJob] = self.pool.starmap(Load.w_spool_job, param_chunk)
-        # remove None jobs and check the rest
-        return file_count, [job for job in jobs if job is not None]
+    @staticmethod
+    @workermethod
+    def w_spool_jobs(self: "Load", file_paths: Sequence[str], load_id: str, schema: Schema) -> List[LoadJob]:
+        """Starts jobs for `file_paths` of a single table. Several files are started together by the destination client, files that were not started are then started one by one"""
+        jobs: List[LoadJob] = []
+        if len(file_paths) > 1:
+            try:
+                with self.open_destination_client(schema, load_id, staging=self.is_staging_destination_job(file_paths[0])) as job_client:
+                    table = self.get_load_table(schema, file_paths[0])
+                    if table["write_disposition"] not in ["append", "replace", "merge"]:
+                        raise LoadClientUnsupportedWriteDisposition(table["name"], table["write_disposition"], file_paths[0])
+                    logger.info(f"Will load {len(file_paths)} files with table name {table['name']} together")
+                    with self.maybe_with_staging_dataset(job_client, table):
+                        # jobs are yielded as soon as files are started so files loaded before a failure are not loaded again
+                        for job in job_client.start_file_loads(table, [self.load_storage.storage.make_full_path(file_path) for file_path in file_paths], load_id):
+                            jobs.append(job)
+            except Exception:
+                logger.exception(f"Could not load {len(file_paths) - len(jobs)} of {len(file_paths)} files together, will load them one by one")
+        for job in jobs:
+            self.load_storage.start_job(load_id, job.file_name())
+        started_files = {job.file_name() for job in jobs}
+        return jobs + [
+            Load.w_spool_job(self, file_path, load_id, schema) for file_path in file_paths if FileStorage.get_file_name_from_file_path(file_path) not in started_files
+        ]
+
+    def start_new_jobs(self, load_id: str, schema: Schema, max_jobs: int, started_files: Set[Tuple[str, str]]) -> List["AsyncResult[List[LoadJob]]"]:
+        """Starts at most `max_jobs` new jobs in the pool without waiting for them to be started.
+
+        Files with table name and file id in `started_files` were already started in the current run (ie. were retried) and are skipped.
+        Keys of the started files are added to `started_files`. If destination (or staging destination) loads many files with a single job, up to
+        `get_max_files_per_copy_job` files of the same table and format are started together and take a single slot.
+        """
+        results: List["AsyncResult[List[LoadJob]]"] = []
+        new_jobs = self.load_storage.list_new_jobs(load_id)
+        for file in new_jobs:
+            if len(results) == max_jobs:
+                break
+            job_info = LoadStorage.parse_job_file_name(file)
+            file_key = (job_info.table_name, job_info.file_id)
+            if file_key in started_files:
+                continue
+            started_files.add(file_key)
+            file_group = [file]
+            max_files = self.get_max_files_per_copy_job(job_info.file_format, self.is_staging_destination_job(file))
+            for other_file in new_jobs:
+                if len(file_group) == max_files:
+                    break
+                other_info = LoadStorage.parse_job_file_name(other_file)
+                other_key = (other_info.table_name, other_info.file_id)
+                if other_info.table_name == job_info.table_name and other_info.file_format == job_info.file_format and other_key not in started_files:
+                    started_files.add(other_key)
+                    file_group.append(other_file)
+            results.append(self.pool.apply_async(
+                Load.w_spool_jobs,
+                (id(self), file_group, load_id, schema),
+                callback=self._set_jobs_ready,
+                error_callback=self._set_jobs_ready
+            ))
+        return results
+
+    def get_max_files_per_copy_job(self, file_format: TLoaderFileFormat, staging: bool) -> int:
+        """Asks the destination (or `staging` destination) client how many files of `file_format` may be started together"""
+        key = (staging, file_format)
+        if key not in self._max_files_per_copy_job:
+            # client is not opened, the limit depends only on the configuration
+            client = self.get_staging_destination_client(Schema("test")) if staging else self.get_destination_client(Schema("test"))
+            self._max_files_per_copy_job[key] = client.get_max_files_per_copy_job(file_format)
+        return self._max_files_per_copy_job[key]
+
+    def _set_jobs_ready(self, _: Any) -> None:
+        self._jobs_ready.set()
 
     def retrieve_jobs(self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None) -> Tuple[int, List[LoadJob]]:
         jobs: List[LoadJob] = []
@@ -206,27 +299,36 @@ class Load(Runnable[ThreadPool]):
             # NOTE: we may move that logic to the interface
             starting_job_file_name = starting_job.file_name()
             if state == "completed" and not self.is_staging_destination_job(starting_job_file_name):
-                client = self.destination.client(schema, self.initial_client_config)
                 top_job_table = get_top_level_table(schema.tables, self.get_load_table(schema, starting_job_file_name)["name"])
                 # if all tables of chain completed, create follow  up jobs
                 if table_chain := self.get_completed_table_chain(load_id, schema, top_job_table, starting_job.job_file_info().job_id()):
-                    if follow_up_jobs := client.create_table_chain_completed_followup_jobs(table_chain):
-                        jobs = jobs + follow_up_jobs
+                    # client is configured for the package so the jobs use its staging dataset
+                    with self.open_destination_client(schema, load_id) as client:
+                        if follow_up_jobs := client.create_table_chain_completed_followup_jobs(table_chain):
+                            jobs = jobs + follow_up_jobs
             jobs = jobs + starting_job.create_followup_jobs(state)
         return jobs
 
     def complete_jobs(self, load_id: str, jobs: List[LoadJob], schema: Schema) -> List[LoadJob]:
         remaining_jobs: List[LoadJob] = []
         logger.info(f"Will complete {len(jobs)} for {load_id}")
+        # poll only the jobs whose backoff elapsed
+        due_jobs = set(map(id, self.job_poller.due_jobs(jobs)))
         for ii in range(len(jobs)):
             job = jobs[ii]
+            if id(job) not in due_jobs:
+                remaining_jobs.append(job)
+                continue
             logger.debug(f"Checking state for job {job.job_id()}")
             state: TLoadJobState = job.state()
             if state == "running":
-                # ask again
+                # ask again after backoff
                 logger.debug(f"job {job.job_id()} still running")
+                self.job_poller.backoff(job)
                 remaining_jobs.append(job)
-            elif state == "failed":
+                continue
+            self.job_poller.forget(job)
+            if state == "failed":
                 # try to get exception message from job
                 failed_message = job.exception()
                 self.load_storage.fail_job(load_id, job.file_name(), failed_message)
@@ -264,11 +366,28 @@ class Load(Runnable[ThreadPool]):
     def complete_package(self, load_id: str, schema: Schema, aborted: bool = False) -> None:
         # do not commit load id for aborted packages
         if not aborted:
-            with self.get_destination_client(schema) as job_client:
+            with self.open_destination_client(schema, load_id) as job_client:
                 job_client.complete_load(load_id)
         self.load_storage.complete_load_package(load_id, aborted)
         logger.info(f"All jobs completed, archiving package {load_id} with aborted set to {aborted}")
         self._processed_load_ids[load_id] = 1
+        if self.config.staging_dataset_per_load:
+            # staging data is not needed anymore, drop it without blocking the next package
+            self._staging_drops.append(self.pool.apply_async(Load.w_drop_staging_dataset, (id(self), load_id, schema)))
+
+    @staticmethod
+    @workermethod
+    def w_drop_staging_dataset(self: "Load", load_id: str, schema: Schema) -> None:
+        try:
+            with self.open_destination_client(schema, load_id) as job_client:
+                if isinstance(job_client, SqlJobClientBase):
+                    with job_client.sql_client.with_staging_dataset(staging=True):
+                        if job_client.sql_client.has_dataset():
+                            logger.info(f"Will drop staging dataset of package {load_id}")
+                            job_client.sql_client.drop_dataset()
+        except Exception:
+            # dataset stays in the destination, not a reason to fail the load
+            logger.exception(f"Could not drop staging dataset of package {load_id}")
 
     def get_table_chain_tables_for_write_disposition(self, load_id: str, schema: Schema, dispositions: List[TWriteDisposition]) -> Set[str]:
         """Get all jobs for tables with given write disposition and resolve the table chain"""
@@ -285,46 +404,73 @@ class Load(Runnable[ThreadPool]):
                 result.add(table["name"])
         return result
 
+    def is_schema_stored(self, job_client: JobClientBase, schema: Schema) -> bool:
+        """Checks if `schema` is stored in the current dataset of `job_client` without inspecting the tables.
+
+        Looks up the version hash of `schema` in the version table of the destination dataset.
+        """
+        # only sql clients store schemas in the destination
+        if not isinstance(job_client, SqlJobClientBase):
+            return False
+        try:
+            return job_client.get_schema_by_hash(schema.stored_version_hash) is not None
+        except DatabaseUndefinedRelation:
+            # dataset or version table was dropped
+            return False
+
     def load_single_package(self, load_id: str, schema: Schema) -> None:
         # initialize analytical storage ie. create dataset required by passed schema
         job_client: JobClientBase
-        with self.get_destination_client(schema) as job_client:
+        with self.open_destination_client(schema, load_id) as job_client:
             expected_update = self.load_storage.begin_schema_update(load_id)
             if expected_update is not None:
-                # update the default dataset
-                logger.info(f"Client for {job_client.config.destination_name} will start initialize storage")
-                job_client.initialize_storage()
-                logger.info(f"Client for {job_client.config.destination_name} will update schema to package schema")
-                all_jobs = self.get_new_jobs_info(load_id, schema)
-                all_tables = set(job.table_name for job in all_jobs)
-                dlt_tables = set(t["name"] for t in schema.dlt_tables())
-                # only update tables that are present in the load package
-                applied_update = job_client.update_storage_schema(only_tables=all_tables | dlt_tables, expected_update=expected_update)
                 truncate_tables = self.get_table_chain_tables_for_write_disposition(load_id, schema, job_client.get_truncate_destination_table_dispositions())
-                job_client.initialize_storage(truncate_tables=truncate_tables)
+                if self.is_schema_stored(job_client, schema):
+                    # schema is already in the destination so tables do not need to be inspected
+                    logger.info(f"Client for {job_client.config.destination_name} found schema {schema.stored_version_hash} in destination, will not update schema")
+                    applied_update = {}
+                    if truncate_tables:
+                        job_client.initialize_storage(truncate_tables=truncate_tables)
+                else:
+                    # update the default dataset
+                    logger.info(f"Client for {job_client.config.destination_name} will start initialize storage")
+                    job_client.initialize_storage()
+                    logger.info(f"Client for {job_client.config.destination_name} will update schema to package schema")
+                    all_jobs = self.get_new_jobs_info(load_id, schema)
+                    all_tables = set(job.table_name for job in all_jobs)
+                    dlt_tables = set(t["name"] for t in schema.dlt_tables())
+                    # only update tables that are present in the load package
+                    applied_update = job_client.update_storage_schema(only_tables=all_tables | dlt_tables, expected_update=expected_update)
+                    job_client.initialize_storage(truncate_tables=truncate_tables)
                 # update the staging dataset if client supports this
                 if isinstance(job_client, StagingJobClientBase):
                     if staging_tables := self.get_table_chain_tables_for_write_disposition(load_id, schema, job_client.get_stage_dispositions()):
                         with job_client.with_staging_dataset():
-                            logger.info(f"Client for {job_client.config.destination_name} will start initialize STAGING storage")
-                            job_client.initialize_storage()
-                            logger.info(f"Client for {job_client.config.destination_name} will UPDATE STAGING SCHEMA to package schema")
-                            job_client.update_storage_schema(only_tables=staging_tables | {VERSION_TABLE_NAME}, expected_update=expected_update)
-                            logger.info(f"Client for {job_client.config.destination_name} will TRUNCATE STAGING TABLES: {staging_tables}")
-                            job_client.initialize_storage(truncate_tables=staging_tables)
+                            if self.config.staging_dataset_per_load:
+                                # new staging dataset is created for each package so there's nothing to truncate
+                                logger.info(f"Client for {job_client.config.destination_name} will CREATE STAGING storage for package {load_id}")
+                                job_client.initialize_storage()
+                                job_client.update_storage_schema(only_tables=staging_tables | {VERSION_TABLE_NAME}, expected_update=expected_update)
+                            else:
+                                if self.is_schema_stored(job_client, schema):
+                                    logger.info(f"Client for {job_client.config.destination_name} found schema {schema.stored_version_hash} in STAGING destination, will not update STAGING SCHEMA")
+                                else:
+                                    logger.info(f"Client for {job_client.config.destination_name} will start initialize STAGING storage")
+                                    job_client.initialize_storage()
+                                    logger.info(f"Client for {job_client.config.destination_name} will UPDATE STAGING SCHEMA to package schema")
+                                    job_client.update_storage_schema(only_tables=staging_tables | {VERSION_TABLE_NAME}, expected_update=expected_update)
+                                logger.info(f"Client for {job_client.config.destination_name} will TRUNCATE STAGING TABLES: {staging_tables}")
+                                job_client.initialize_storage(truncate_tables=staging_tables)
                 self.load_storage.commit_schema_update(load_id, applied_update)
             # spool or retrieve unfinished jobs
             if self.staging_destination:
-                with self.get_staging_destination_client(schema) as staging_client:
+                with self.open_destination_client(schema, load_id, staging=True) as staging_client:
                     jobs_count, jobs = self.retrieve_jobs(job_client, load_id, staging_client)
             else:
                 jobs_count, jobs = self.retrieve_jobs(job_client, load_id)
 
-        if not jobs:
-            # jobs count is a total number of jobs including those that could not be initialized
-            jobs_count, jobs = self.spool_new_jobs(load_id, schema)
         # if there are no existing or new jobs we complete the package
-        if jobs_count == 0:
+        if jobs_count == 0 and not self.load_storage.list_new_jobs(load_id):
             self.complete_package(load_id, schema, False)
             return
         # update counter we only care about the jobs that are scheduled to be loaded
@@ -335,11 +481,32 @@ class Load(Runnable[ThreadPool]):
         self.collector.update("Jobs", no_completed_jobs, total_jobs)
         if no_failed_jobs > 0:
             self.collector.update("Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed")
+        # keep `workers` jobs in flight: a new job is started as soon as another one completes
+        # jobs retried in this run are started again in the next run
+        started_files = set((job.job_file_info().table_name, job.job_file_info().file_id) for job in jobs)
+        starting_jobs: List["AsyncResult[List[LoadJob]]"] = []
         # loop until all jobs are processed
         while True:
             try:
+                self._jobs_ready.clear()
+                # collect jobs that were started by the pool
+                still_starting_jobs: List["AsyncResult[List[LoadJob]]"] = []
+                for result in starting_jobs:
+                    if result.ready():
+                        jobs.extend(job for job in result.get() if job)
+                    else:
+                        still_starting_jobs.append(result)
+                has_progress = len(still_starting_jobs) < len(starting_jobs)
+                starting_jobs = still_starting_jobs
                 remaining_jobs = self.complete_jobs(load_id, jobs, schema)
-                if len(remaining_jobs) == 0:
+                has_progress = has_progress or remaining_jobs != jobs
+                # start new jobs in free slots
+                free_slots = self.config.workers - len(remaining_jobs) - len(starting_jobs)
+                if free_slots > 0:
+                    new_jobs = self.start_new_jobs(load_id, schema, free_slots, started_files)
+                    has_progress = has_progress or len(new_jobs) > 0
+                    starting_jobs.extend(new_jobs)
+                if len(remaining_jobs) == 0 and len(starting_jobs) == 0:
                     # get package status
                     package_info = self.load_storage.get_load_package_info(load_id)
                     # possibly raise on failed jobs
@@ -356,8 +523,12 @@ class Load(Runnable[ThreadPool]):
                     break
                 # process remaining jobs again
                 jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
+                if not has_progress:
+                    # wait until a running job is due to be polled or a started job is ready
+                    next_poll_in = self.job_poller.next_poll_in()
+                    signals.raise_if_signalled()
+                    self._jobs_ready.wait(Load.MAX_POLL_INTERVAL if next_poll_in is None else min(next_poll_in, Load.MAX_POLL_INTERVAL))
+                    signals.raise_if_signalled()
             except LoadClientJobFailed:
                 # the package is completed and skipped
                 self.complete_package(load_id, schema, True)
@@ -372,6 +543,7 @@ class Load(Runnable[ThreadPool]):
         loads = self.load_storage.list_packages()
         logger.info(f"Found {len(loads)} load packages")
         if len(loads) == 0:
+            self.close_clients()
             return TRunMetrics(True, 0)
 
         # load the schema from the package
@@ -383,10 +555,30 @@ class Load(Runnable[ThreadPool]):
         # get top load id and mark as being processed
         # TODO: another place where tracing must be refactored
         self._processed_load_ids[load_id] = None
-        with self.collector(f"Load {schema.name} in {load_id}"):
-            self.load_single_package(load_id, schema)
-
-        return TRunMetrics(False, len(self.load_storage.list_packages()))
+        try:
+            with self.collector(f"Load {schema.name} in {load_id}"):
+                self.load_single_package(load_id, schema)
+        except BaseException:
+            # also close on signals and terminal exceptions
+            self.close_clients()
+            raise
+
+        pending_packages = len(self.load_storage.list_packages())
+        if pending_packages == 0:
+            self.wait_for_staging_drops()
+            self.close_clients()
+        return TRunMetrics(False, pending_packages)
+
+    def wait_for_staging_drops(self) -> None:
+        """Waits until staging datasets of completed packages are dropped"""
+        staging_drops, self._staging_drops = self._staging_drops, []
+        for result in staging_drops:
+            result.wait()
+
+    def close_clients(self) -> None:
+        """Closes destination clients kept open for reuse"""
+        if self.client_pool:
+            self.client_pool.close_all()
 
     def get_load_info(self, pipeline: SupportsPipeline, started_at: datetime.datetime = None) -> LoadInfo:
         # TODO: Load must provide a clear interface to get last loads and metrics
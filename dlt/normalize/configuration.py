@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from dlt.common.configuration import configspec
 from dlt.common.destination import DestinationCapabilitiesContext
@@ -10,6 +10,8 @@ from dlt.common.storages import LoadStorageConfiguration, NormalizeStorageConfig
 class NormalizeConfiguration(PoolRunnerConfiguration):
     pool_type: TPoolType = "process"
     destination_capabilities: DestinationCapabilitiesContext = None  # injectable
+    combine_files_max_bytes: Optional[int] = None
+    """When set, load files of the same table and format smaller than that are combined into files of up to that size"""
     _schema_storage_config: SchemaStorageConfiguration
     _normalize_storage_config: NormalizeStorageConfiguration
     _load_storage_config: LoadStorageConfiguration
@@ -262,6 +262,10 @@ class Normalize(Runnable[ProcessPool]):
         self.load_storage.save_temp_schema(schema, load_id)
         # save schema updates even if empty
         self.load_storage.save_temp_schema_updates(load_id, merge_schema_updates(schema_updates))
+        # fewer, larger files result in fewer load jobs
+        if self.config.combine_files_max_bytes:
+            removed_count = self.load_storage.combine_temp_job_files(load_id, self.config.combine_files_max_bytes)
+            logger.info(f"Combined load files in {load_id}, {removed_count} files less to load")
         # files must be renamed and deleted together so do not attempt that when process is about to be terminated
         signals.raise_if_signalled()
         logger.info("Committing storage, do not kill this process")
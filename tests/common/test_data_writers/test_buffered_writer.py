@@ -1,16 +1,18 @@
 import os
 import pytest
+from dlt.common import json
 from dlt.common.arithmetics import Decimal
 
 from dlt.common.data_writers.buffered import BufferedDataWriter
-from dlt.common.data_writers.exceptions import BufferedDataWriterClosed
+from dlt.common.data_writers.exceptions import BufferedDataWriterClosed, CannotCombineFiles
+from dlt.common.data_writers.writers import DataWriter, InsertValuesWriter
 from dlt.common.destination import TLoaderFileFormat, DestinationCapabilitiesContext
 from dlt.common.schema.utils import new_column
 from dlt.common.storages.file_storage import FileStorage
 
 from dlt.common.typing import DictStrAny
 
-from tests.utils import TEST_STORAGE_ROOT, write_version, autouse_test_storage
+from tests.utils import TEST_STORAGE_ROOT, write_version, autouse_test_storage, preserve_environ
 import datetime  # noqa: 251
 
 
@@ -172,3 +174,76 @@ def test_writer_optional_schema(disable_compression: bool) -> None:
             writer.write_data_item([{"col1": 1}], None)
             writer.write_data_item([{"col1": 1}], None)
 
+
+
+@pytest.mark.parametrize("disable_compression", [True, False], ids=["no_compression", "compression"])
+@pytest.mark.parametrize("_format", ["insert_values", "jsonl", "parquet"])
+def test_combine_files(_format: TLoaderFileFormat, disable_compression: bool) -> None:
+    c1 = new_column("col1", "bigint")
+    c2 = new_column("col2", "text")
+    caps = DestinationCapabilitiesContext.generic_capabilities()
+    file_template = os.path.join(TEST_STORAGE_ROOT, f"{_format}.%s")
+    with BufferedDataWriter(_format, file_template, buffer_max_items=2, file_max_items=3, disable_compression=disable_compression, _caps=caps) as writer:
+        for i in range(10):
+            writer.write_data_item([{"col1": i, "col2": str(i)}], {"col1": c1, "col2": c2})
+    assert len(writer.closed_files) > 1
+
+    dest_path = os.path.join(TEST_STORAGE_ROOT, f"combined.{_format}")
+    DataWriter.class_factory(_format).combine_files(writer.closed_files, dest_path)
+    if _format != "parquet":
+        assert FileStorage.is_gzipped(dest_path) is not disable_compression
+    if _format == "parquet":
+        import pyarrow.parquet as pq
+        assert pq.read_table(dest_path).column("col1").to_pylist() == list(range(10))
+    else:
+        with FileStorage.open_zipsafe_ro(dest_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        lines = content.split("\n")
+        if _format == "jsonl":
+            assert [json.loads(line)["col1"] for line in lines[:-1]] == list(range(10))
+        else:
+            assert lines[0].startswith("INSERT INTO {}")
+            assert lines[1] == "VALUES"
+            assert len(lines) == 12
+            assert all(line.startswith(f"({i},") and line.endswith(",") for i, line in enumerate(lines[2:-1]))
+            assert lines[-1].startswith("(9,") and lines[-1].endswith(");")
+
+
+def test_combine_parquet_files_with_writer_options() -> None:
+    import pyarrow.parquet as pq
+    from unittest.mock import patch
+
+    os.environ["DATA_WRITER__VERSION"] = "1.0"
+    os.environ["DATA_WRITER__DATA_PAGE_SIZE"] = str(64 * 1024)
+    c1 = new_column("col1", "bigint")
+    caps = DestinationCapabilitiesContext.generic_capabilities()
+    file_template = os.path.join(TEST_STORAGE_ROOT, "parquet.%s")
+    with BufferedDataWriter("parquet", file_template, buffer_max_items=2, file_max_items=3, _caps=caps) as writer:
+        for i in range(10):
+            writer.write_data_item([{"col1": i}], {"col1": c1})
+
+    writer_options = []
+    parquet_writer = pq.ParquetWriter
+
+    def _parquet_writer(*args, **kwargs):
+        writer_options.append(kwargs)
+        return parquet_writer(*args, **kwargs)
+
+    dest_path = os.path.join(TEST_STORAGE_ROOT, "combined.parquet")
+    with patch("pyarrow.parquet.ParquetWriter", _parquet_writer):
+        DataWriter.class_factory("parquet").combine_files(writer.closed_files, dest_path)
+    # combined file is written with the same options as the source files
+    assert writer_options == [{"flavor": "spark", "version": "1.0", "data_page_size": 64 * 1024}]
+    assert pq.ParquetFile(dest_path).metadata.format_version == "1.0"
+    assert pq.read_table(dest_path).column("col1").to_pylist() == list(range(10))
+
+
+def test_combine_insert_values_different_columns() -> None:
+    c1 = new_column("col1", "bigint")
+    c2 = new_column("col2", "text")
+    with get_insert_writer(buffer_max_items=1) as writer:
+        writer.write_data_item([{"col1": 1}], {"col1": c1})
+        writer.write_data_item([{"col1": 1, "col2": "2"}], {"col1": c1, "col2": c2})
+    assert len(writer.closed_files) == 2
+    with pytest.raises(CannotCombineFiles):
+        InsertValuesWriter.combine_files(writer.closed_files, os.path.join(TEST_STORAGE_ROOT, "combined.insert_values"))
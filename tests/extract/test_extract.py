@@ -72,3 +72,43 @@ def test_extract_select_tables() -> None:
 
     schema = expect_tables(table_name_with_lambda)
     assert "table_name_with_lambda" not in schema.tables
+
+
+def test_extract_dynamic_table_groups_items() -> None:
+
+    @dlt.resource(table_name=lambda e: e["type"], primary_key=lambda e: e["col"])
+    def events():
+        yield [{"type": "click", "col": "a"}, {"type": "view", "col": "a"}, {"type": "click", "col": "b"}]
+        yield {"type": "view", "col": "c"}
+
+    source = DltSource("events", "module", dlt.Schema("events"), [events()])
+    storage = ExtractorStorage(NormalizeStorageConfiguration())
+    writes = []
+    write_data_item = storage.write_data_item
+
+    def _write_data_item(load_id, schema_name, table_name, item, columns):
+        writes.append((table_name, item))
+        write_data_item(load_id, schema_name, table_name, item, columns)
+
+    storage.write_data_item = _write_data_item
+    extract_id = storage.create_extract_id()
+    schema_update = extract(extract_id, source, storage)
+    # a list is written with a single call per table, a single item is wrapped in a list
+    assert writes == [
+        ("click", [{"type": "click", "col": "a"}, {"type": "click", "col": "b"}]),
+        ("view", [{"type": "view", "col": "a"}]),
+        ("view", [{"type": "view", "col": "c"}]),
+    ]
+    # dynamic hints evaluated for all items
+    assert set(schema_update["click"][0]["columns"]) == {"a", "b"}
+    assert set(schema_update["view"][0]["columns"]) == {"a", "c"}
+
+
+def test_dynamic_table_name_only_hint() -> None:
+    # only table name is dynamic: table schema is evaluated once per table
+    r = dlt.resource([1], name="events", table_name=lambda e: e["type"])
+    assert r._table_has_other_dynamic_hints is False
+    assert r.table_schema({"type": "click"})["resource"] == "events"
+    # other dynamic hints require evaluation for each item
+    r = dlt.resource([1], name="events", table_name=lambda e: e["type"], primary_key=lambda e: e["col"])
+    assert r._table_has_other_dynamic_hints is True
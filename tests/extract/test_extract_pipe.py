@@ -11,7 +11,7 @@ from dlt.common import sleep
 from dlt.common.typing import TDataItems
 from dlt.extract.exceptions import CreatePipeException, ResourceExtractionError
 from dlt.extract.typing import DataItemWithMeta, FilterItem, MapItem, YieldMapItem
-from dlt.extract.pipe import ManagedPipeIterator, Pipe, PipeItem, PipeIterator
+from dlt.extract.pipe import ManagedPipeIterator, Pipe, PipeItem, PipeIterator, PipeStepProfiler
 
 
 def test_next_item_mode() -> None:
@@ -478,6 +478,75 @@ def test_pipe_copy_on_fork() -> None:
     assert doc is elems[0].item
     # second fork copies
     assert elems[0].item is not elems[1].item
+    assert elems[0].item == elems[1].item
+
+    # copy is shallow: containers are copied but nested objects are shared
+    doc = {"e": 1, "l": [1, 2]}
+    parent = Pipe.from_data("data", [[doc]])
+    child1 = Pipe("tr1", [lambda x: x], parent=parent)
+    child2 = Pipe("tr2", [lambda x: x], parent=parent)
+    elems = list(PipeIterator.from_pipes([child1, child2], yield_parents=False, copy_on_fork=True))
+    assert elems[0].item is not elems[1].item
+    assert elems[0].item[0] is elems[1].item[0]
+
+
+def test_pipe_queue_depth() -> None:
+    consumed = []
+
+    def nested_gen(i):
+        yield from [i, i + 100]
+
+    def parent_gen():
+        for i in range(20):
+            consumed.append(i)
+            yield i
+
+    @dlt.defer
+    def slow_tx(item):
+        sleep(0.01)
+        return item
+
+    # nested iterators are drained before parent is advanced
+    parent = Pipe.from_data("data", parent_gen())
+    child = Pipe("tx", [nested_gen], parent=parent)
+    _it = PipeIterator.from_pipes([child], yield_parents=False)
+    assert _it.queue_depth.sources == 1
+    for pi in _it:
+        # parent was not advanced beyond the item currently processed by the transformer
+        assert consumed[-1] == pi.item % 100
+    assert _it.queue_depth.sources == 0
+    # parent gen, fork step and a single nested gen
+    assert _it.queue_depth.peak_sources == 3
+
+    # parent is paused when all future slots are taken
+    consumed.clear()
+    parent = Pipe.from_data("data", parent_gen())
+    child = Pipe("tx", [slow_tx], parent=parent)
+    _it = PipeIterator.from_pipes([child], yield_parents=False, max_parallel_items=4, workers=2)
+    items = [pi.item for pi in _it]
+    assert sorted(items) == list(range(20))
+    assert _it.queue_depth.futures == 0
+    assert 0 < _it.queue_depth.peak_futures <= 4
+
+
+def test_pipe_step_profiler() -> None:
+    parent = Pipe.from_data("data", [1, 2, 3])
+    parent.append_step(lambda item: item * 2)
+    child = Pipe("tx", [lambda item: item + 1], parent=parent)
+
+    _it = PipeIterator.from_pipes([child], yield_parents=False)
+    _it.step_profiler = profiler = PipeStepProfiler()
+    assert [pi.item for pi in _it] == [3, 5, 7]
+    # gen, map step and fork step of the parent pipe
+    assert profiler.calls[("data", 0)] == 3
+    assert profiler.calls[("data", 1)] == 3
+    assert profiler.calls[("data", 2)] == 3
+    # transformer of the child
+    assert profiler.calls[("tx", 0)] == 3
+    assert all(elapsed >= 0 for elapsed in profiler.elapsed.values())
+    assert set(profiler.calls) == set(profiler.elapsed)
+    profiler.clear()
+    assert profiler.calls == {}
 
 
 def test_clone_pipes() -> None:
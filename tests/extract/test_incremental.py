@@ -19,7 +19,8 @@ from dlt.common.json import json
 
 from dlt.extract.source import DltSource
 from dlt.sources.helpers.transform import take_first
-from dlt.extract.incremental import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing
+from dlt.extract.exceptions import ResourceExtractionError
+from dlt.extract.incremental import IncrementalCursorPathMissing, IncrementalPrimaryKeyMissing, IncrementalRangeNotSplittable, split_range
 
 from tests.extract.utils import AssertItems
 
@@ -965,3 +966,141 @@ def test_allow_external_schedulers() -> None:
     r.add_step(dlt.sources.incremental("updated_at"))
     r.incremental.allow_external_schedulers = True
     assert len(list(test_type_2())) == 2
+
+
+@pytest.mark.parametrize("last_value_func", [max, min])
+def test_pages_filtered_as_single_items(last_value_func: Any) -> None:
+    """Pages processed at once must give the same items and state as the same rows yielded one by one"""
+    pages = [
+        # unique and new
+        [{"id": i, "ts": i} for i in range(10, 20)],
+        # overlaps with the previous page and contains duplicated cursor values
+        [{"id": i, "ts": i // 2} for i in range(10, 40)],
+        # descending values
+        [{"id": i, "ts": i} for i in range(60, 40, -1)],
+        # single item page
+        [{"id": 100, "ts": 100}],
+    ]
+
+    @dlt.resource(primary_key="id")
+    def paged(pages, ts=dlt.sources.incremental("ts", last_value_func=last_value_func, end_value=None)):
+        yield from pages
+
+    @dlt.resource(primary_key="id")
+    def single(pages, ts=dlt.sources.incremental("ts", last_value_func=last_value_func, end_value=None)):
+        for page in pages:
+            yield from page
+
+    for end_value in (None, 55 if last_value_func is max else 12):
+        paged_state = {}
+        single_state = {}
+        for _ in range(2):
+            with Container().injectable_context(StateInjectableContext(state=paged_state)):
+                r = paged(pages, ts=dlt.sources.incremental("ts", initial_value=15, last_value_func=last_value_func, end_value=end_value))
+                paged_items = list(r)
+                # state is not written when end value is set
+                paged_incremental = r.state.get("incremental", {}).get("ts", {})
+            with Container().injectable_context(StateInjectableContext(state=single_state)):
+                r = single(pages, ts=dlt.sources.incremental("ts", initial_value=15, last_value_func=last_value_func, end_value=end_value))
+                single_items = list(r)
+                single_incremental = r.state.get("incremental", {}).get("ts", {})
+            assert paged_items == single_items
+            assert paged_incremental.get("last_value") == single_incremental.get("last_value")
+            assert set(paged_incremental.get("unique_hashes", [])) == set(single_incremental.get("unique_hashes", []))
+
+
+def test_page_of_new_items_updates_state_once() -> None:
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental("created_at")):
+        yield [{"id": i, "created_at": i} for i in range(5, 0, -1)]
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data()
+        assert len(list(r)) == 5
+        s = r.state["incremental"]["created_at"]
+        # only the row holding the last value is remembered for deduplication
+        assert s["last_value"] == 5
+        assert s["unique_hashes"] == [digest128(json.dumps(5))]
+
+
+def test_unique_hashes_set_follows_state() -> None:
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental("created_at")):
+        # many rows with the same cursor value
+        yield [{"id": i, "created_at": 1} for i in range(1000)]
+        yield [{"id": i, "created_at": 1} for i in range(500, 1500)]
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = some_data()
+        assert len(list(r)) == 1500
+        assert len(r.state["incremental"]["created_at"]["unique_hashes"]) == 1500
+        # hashes removed from state are not deduplicated
+        r = some_data()
+        r.state["incremental"]["created_at"]["unique_hashes"] = r.state["incremental"]["created_at"]["unique_hashes"][:1000]
+        assert [item["id"] for item in r] == list(range(1000, 1500))
+
+
+def test_split_range() -> None:
+    assert split_range(0, 10, 3) == [(0, 3), (3, 6), (6, 10)]
+    # more partitions than values
+    assert split_range(0, 2, 4) == [(0, 1), (1, 2)]
+    # descending range for min
+    assert split_range(10, 0, 2) == [(10, 5), (5, 0)]
+    assert split_range(0.0, 1.0, 2) == [(0.0, 0.5), (0.5, 1.0)]
+    start = pendulum.datetime(2023, 1, 1)
+    assert split_range(start, start.add(days=2), 2) == [(start, start.add(days=1)), (start.add(days=1), start.add(days=2))]
+    with pytest.raises(TypeError):
+        split_range("a", "z", 2)
+    with pytest.raises(TypeError):
+        split_range(0, 1.0, 2)
+
+
+def test_parallel_ranges() -> None:
+    fetched_ranges = []
+
+    def fetch_range(start: int, end: int):
+        fetched_ranges.append((start, end))
+        # ranges overlap by one value, the overlap is filtered out
+        for page_start in range(start, end + 1, 10):
+            yield [{"id": i, "updated_at": i} for i in range(page_start, min(page_start + 10, end + 1))]
+
+    @dlt.resource(primary_key="id")
+    def backfill(updated_at=dlt.sources.incremental("updated_at", initial_value=0, end_value=100)):
+        yield from updated_at.parallel_ranges(fetch_range, partitions=4, workers=2)
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = backfill()
+        ids = [item["id"] for item in r]
+        assert sorted(ids) == list(range(0, 100))
+        assert sorted(fetched_ranges) == [(0, 25), (25, 50), (50, 75), (75, 100)]
+        # merged state written when all ranges succeeded
+        s = r.state["incremental"]["updated_at"]
+        assert s["last_value"] == 99
+        assert s["unique_hashes"] == [digest128(json.dumps(99))]
+
+
+def test_parallel_ranges_fail() -> None:
+
+    def fetch_range(start: int, end: int):
+        if start == 50:
+            raise ValueError(start)
+        yield [{"id": i, "updated_at": i} for i in range(start, end)]
+
+    @dlt.resource(primary_key="id")
+    def backfill(updated_at=dlt.sources.incremental("updated_at", initial_value=0, end_value=100)):
+        yield from updated_at.parallel_ranges(fetch_range, partitions=2)
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r = backfill()
+        with pytest.raises(ResourceExtractionError) as py_ex:
+            list(r)
+        assert isinstance(py_ex.value.__cause__, ValueError)
+        # nothing written to state
+        assert "incremental" not in r.state
+
+    @dlt.resource
+    def no_end_value(updated_at=dlt.sources.incremental("updated_at", initial_value=0)):
+        yield from updated_at.parallel_ranges(fetch_range, partitions=2)
+
+    with pytest.raises(IncrementalRangeNotSplittable):
+        list(no_end_value())
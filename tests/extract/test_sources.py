@@ -8,7 +8,7 @@ from dlt.common.pipeline import StateInjectableContext, source_state
 from dlt.common.schema import Schema
 from dlt.common.typing import TDataItems
 from dlt.extract.exceptions import InvalidParentResourceDataType, InvalidParentResourceIsAFunction, InvalidTransformerDataTypeGeneratorFunctionRequired, InvalidTransformerGeneratorFunction, ParametrizedResourceUnbound, ResourcesNotFoundError
-from dlt.extract.pipe import Pipe
+from dlt.extract.pipe import Pipe, PipeIterator
 from dlt.extract.typing import FilterItem, MapItem
 from dlt.extract.source import DltResource, DltSource
 
@@ -804,6 +804,28 @@ def test_resource_dict() -> None:
     pass
 
 
+def test_resource_dict_find_by_pipe() -> None:
+    resources = [dlt.resource([i], name=f"r_{i}") for i in range(10)]
+    s = DltSource("source", "module", Schema("source"), resources)
+    for name, resource in s.resources.items():
+        assert s.resources.find_by_pipe(resource._pipe) is resource
+        # clone of the pipe keeps the pipe id
+        assert s.resources.find_by_pipe(resource._pipe._clone()) is resource
+        assert resource.name == name
+
+    # pipes cloned by the iterator map to the resources
+    for pipe in PipeIterator.clone_pipes(s.resources.pipes):
+        assert s.resources.find_by_pipe(pipe)._pipe._pipe_id == pipe._pipe_id
+
+    # replaced pipe is found
+    r_0 = s.resources["r_0"]
+    r_0._pipe = Pipe.from_data("r_0", [1])
+    assert s.resources.find_by_pipe(r_0._pipe) is r_0
+
+    with pytest.raises(KeyError):
+        s.resources.find_by_pipe(Pipe.from_data("unknown", [1]))
+
+
 def test_source_multiple_iterations() -> None:
 
     def some_data():
@@ -1,7 +1,8 @@
 import os
 import base64
 from copy import copy
-from typing import Any, Iterator, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
+from unittest.mock import patch
 import pytest
 
 from dlt.common import json, pendulum, Decimal
@@ -11,11 +12,16 @@ from dlt.common.configuration.resolve import resolve_configuration
 from dlt.common.configuration.specs import GcpServiceAccountCredentials, GcpServiceAccountCredentialsWithoutDefaults, GcpOAuthCredentials, GcpOAuthCredentialsWithoutDefaults
 from dlt.common.configuration.specs import gcp_credentials
 from dlt.common.configuration.specs.exceptions import InvalidGoogleNativeCredentialsType
+from dlt.common.destination.reference import LoadJob
+from dlt.common.schema import Schema
+from dlt.common.schema.typing import TTableSchema
 from dlt.common.storages import FileStorage
+from dlt.common.typing import DictStrAny
 from dlt.common.utils import digest128, uniq_id, custom_environ
 
 from dlt.destinations.bigquery.bigquery import BigQueryClient, BigQueryClientConfiguration
 from dlt.destinations.exceptions import LoadJobNotExistsException, LoadJobTerminalException
+from dlt.destinations.job_impl import EmptyLoadJob
 
 from tests.utils import TEST_STORAGE_ROOT, delete_test_storage, preserve_environ
 from tests.common.utils import json_case_path as common_json_case_path
@@ -314,6 +320,153 @@ def test_loading_errors(client: BigQueryClient, file_storage: FileStorage) -> No
     assert "Invalid BIGNUMERIC value: 578960446186580977117854925043439539266.34992332820282019728792003956564819968 Field: parse_data__metadata__rasa_x_id;" in job.exception()
 
 
+class _FakeWriteClient:
+    """Local fake of the Storage Write API client that keeps Arrow batches of the committed pending streams"""
+
+    def __init__(self, fail_commit: bool = False, raise_on_commit: bool = False) -> None:
+        self.fail_commit = fail_commit
+        self.raise_on_commit = raise_on_commit
+        self.streams: Dict[str, List[Any]] = {}
+        self.committed: Dict[str, List[Any]] = {}
+
+    def __enter__(self) -> "_FakeWriteClient":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    @staticmethod
+    def table_path(project: str, dataset: str, table: str) -> str:
+        return f"projects/{project}/datasets/{dataset}/tables/{table}"
+
+    def create_write_stream(self, parent: str, write_stream: Any) -> Any:
+        from google.cloud.bigquery_storage_v1 import types as write_types
+
+        assert write_stream.type_ == write_types.WriteStream.Type.PENDING
+        name = f"{parent}/streams/{len(self.streams)}"
+        self.streams[name] = []
+        return write_types.WriteStream(name=name, type_=write_stream.type_)
+
+    def append_rows(self, requests: Iterator[Any]) -> Iterator[Any]:
+        import pyarrow
+        from google.cloud.bigquery_storage_v1 import types as write_types
+
+        for request in requests:
+            schema = pyarrow.ipc.read_schema(pyarrow.py_buffer(request.arrow_rows.writer_schema.serialized_schema))
+            batch = pyarrow.ipc.read_record_batch(pyarrow.py_buffer(request.arrow_rows.rows.serialized_record_batch), schema)
+            self.streams[request.write_stream].append(batch)
+            yield write_types.AppendRowsResponse()
+
+    def finalize_write_stream(self, name: str) -> Any:
+        from google.cloud.bigquery_storage_v1 import types as write_types
+
+        return write_types.FinalizeWriteStreamResponse(row_count=sum(batch.num_rows for batch in self.streams[name]))
+
+    def batch_commit_write_streams(self, request: Any) -> Any:
+        from google.cloud.bigquery_storage_v1 import types as write_types
+
+        if self.raise_on_commit:
+            from google.api_core import exceptions as api_core_exceptions
+            raise api_core_exceptions.ServiceUnavailable("connection reset")
+        if self.fail_commit:
+            return write_types.BatchCommitWriteStreamsResponse(stream_errors=[write_types.StorageError(error_message="commit failed")])
+        for name in request.write_streams:
+            self.committed.setdefault(request.parent, []).extend(self.streams.pop(name))
+        return write_types.BatchCommitWriteStreamsResponse()
+
+
+@pytest.fixture
+def write_api_client() -> BigQueryClient:
+    pytest.importorskip("google.cloud.bigquery_storage_v1")
+    # return client without opening connection
+    creds = GcpServiceAccountCredentialsWithoutDefaults()
+    creds.project_id = "test_project"
+    config = BigQueryClientConfiguration(dataset_name="test_" + uniq_id(), credentials=creds, storage_write_max_bytes=1024 * 1024)
+    return BigQueryClient(Schema("event"), config)
+
+
+def _save_jsonl_files(file_storage: FileStorage, table_name: str, rows: List[List[DictStrAny]]) -> List[str]:
+    file_paths: List[str] = []
+    for file_rows in rows:
+        file_name = f"{table_name}.{uniq_id()}.0.jsonl"
+        file_storage.save(file_name, b"".join(json.dumpb(row) + b"\n" for row in file_rows))
+        file_paths.append(file_storage.make_full_path(file_name))
+    return file_paths
+
+
+def test_storage_write_api_groups_files_only_when_enabled(write_api_client: BigQueryClient) -> None:
+    assert write_api_client.get_max_files_per_copy_job("jsonl") == write_api_client.capabilities.max_files_per_copy_job
+    # without Storage Write API each file is started with its own load job
+    write_api_client.config.storage_write_max_bytes = 0
+    assert write_api_client.get_max_files_per_copy_job("jsonl") == 1
+    assert write_api_client.get_max_files_per_copy_job("parquet") == 1
+
+
+def test_storage_write_api_commits_files_together(write_api_client: BigQueryClient, file_storage: FileStorage) -> None:
+    table: TTableSchema = {"name": "event_test_table", "columns": {
+        "id": {"name": "id", "data_type": "bigint", "nullable": False},
+        "created_at": {"name": "created_at", "data_type": "timestamp", "nullable": True},
+        "payload": {"name": "payload", "data_type": "complex", "nullable": True}
+    }}
+    now = pendulum.now()
+    file_paths = _save_jsonl_files(file_storage, table["name"], [
+        [{"id": 1, "created_at": now, "payload": {"a": 1}}, {"id": 2}],
+        [{"id": 3, "created_at": now}]
+    ])
+    write_client = _FakeWriteClient()
+    with patch.object(BigQueryClient, "_create_write_client", return_value=write_client):
+        jobs = list(write_api_client.start_file_loads(table, file_paths, uniq_id()))
+    assert [job.file_name() for job in jobs] == [FileStorage.get_file_name_from_file_path(file_path) for file_path in file_paths]
+    assert all(job.state() == "completed" for job in jobs)
+    # merge and replace jobs follow
+    assert all(isinstance(job, EmptyLoadJob) for job in jobs)
+
+    # all files were committed to the table in a single stream
+    assert write_client.streams == {}
+    table_path = _FakeWriteClient.table_path("test_project", write_api_client.sql_client.dataset_name, table["name"])
+    rows = [row for batch in write_client.committed[table_path] for row in batch.to_pylist()]
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert rows[0]["created_at"] == now
+    assert json.loads(rows[0]["payload"]) == {"a": 1}
+    assert rows[1]["payload"] is None
+
+
+def test_storage_write_api_fallback_to_load_jobs(write_api_client: BigQueryClient, file_storage: FileStorage) -> None:
+    table: TTableSchema = {"name": "event_test_table", "columns": {"id": {"name": "id", "data_type": "bigint", "nullable": False}}}
+    file_paths = _save_jsonl_files(file_storage, table["name"], [[{"id": 1}], [{"id": 2}]])
+
+    def _start_load_job(client: BigQueryClient, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        return EmptyLoadJob.from_file_path(file_path, "running")
+
+    # commit failed so load jobs are started and nothing was written
+    write_client = _FakeWriteClient(fail_commit=True)
+    with patch.object(BigQueryClient, "_create_write_client", return_value=write_client), patch.object(BigQueryClient, "_start_load_job", _start_load_job):
+        jobs = list(write_api_client.start_file_loads(table, file_paths, uniq_id()))
+    assert [job.state() for job in jobs] == ["running", "running"]
+    assert write_client.committed == {}
+
+    # files too large for Storage Write API are loaded with load jobs
+    write_api_client.config.storage_write_max_bytes = 1
+    write_client = _FakeWriteClient()
+    with patch.object(BigQueryClient, "_create_write_client", return_value=write_client), patch.object(BigQueryClient, "_start_load_job", _start_load_job):
+        jobs = list(write_api_client.start_file_loads(table, file_paths, uniq_id()))
+    assert [job.state() for job in jobs] == ["running", "running"]
+    assert write_client.streams == {}
+
+
+def test_storage_write_api_commit_unknown_does_not_reload(write_api_client: BigQueryClient, file_storage: FileStorage) -> None:
+    table: TTableSchema = {"name": "event_test_table", "columns": {"id": {"name": "id", "data_type": "bigint", "nullable": False}}}
+    file_paths = _save_jsonl_files(file_storage, table["name"], [[{"id": 1}], [{"id": 2}]])
+
+    # commit request failed so rows could be committed: jobs fail and no load jobs are started
+    write_client = _FakeWriteClient(raise_on_commit=True)
+    with patch.object(BigQueryClient, "_create_write_client", return_value=write_client), patch.object(BigQueryClient, "_start_load_job") as start_load_job:
+        jobs = list(write_api_client.start_file_loads(table, file_paths, uniq_id()))
+    assert start_load_job.call_count == 0
+    assert [job.state() for job in jobs] == ["failed", "failed"]
+    assert "Outcome of commit" in jobs[0].exception()
+
+
 def prepare_oauth_json() -> Tuple[str, str]:
     # prepare real service.json
     storage = FileStorage("_secrets", makedirs=True)
@@ -1,11 +1,14 @@
 import os
 import pytest
+from unittest.mock import patch
 
 import dlt
 from dlt.common.configuration.resolve import resolve_configuration
 from dlt.common.configuration.utils import get_resolved_traces
 
 from dlt.destinations.duckdb.configuration import DUCK_DB_NAME, DuckDbClientConfiguration, DuckDbCredentials, DEFAULT_DUCK_DB_NAME
+from dlt.destinations.duckdb.duck import DuckDbClient, DuckDbStagingCopyJob
+from dlt.destinations.duckdb.sql_client import DuckDbSqlClient
 
 from tests.load.pipeline.utils import drop_pipeline, assert_table
 from tests.utils import patch_home_dir, autouse_test_storage, preserve_environ, TEST_STORAGE_ROOT
@@ -221,6 +224,104 @@ def test_default_duckdb_dataset_name() -> None:
     assert_table(info.pipeline, "data", data, info=info)
 
 
+def test_duckdb_load_many_parquet_files() -> None:
+    os.environ["DATA_WRITER__FILE_MAX_ITEMS"] = "10"
+    os.environ["DESTINATION__DUCKDB__CREDENTIALS__THREADS"] = "2"
+    os.environ["DESTINATION__DUCKDB__CREDENTIALS__MEMORY_LIMIT"] = "1GB"
+    started_files = []
+    start_file_loads = DuckDbClient.start_file_loads
+
+    def _start_file_loads(client, table, file_paths, load_id):
+        started_files.append(len(file_paths))
+        return start_file_loads(client, table, file_paths, load_id)
+
+    # later rows have more columns
+    data = [{"id": idx} if idx < 50 else {"id": idx, "name": f"item {idx}"} for idx in range(100)]
+    p = dlt.pipeline(pipeline_name="many_parquet_files", destination="duckdb", full_refresh=True)
+    with patch.object(DuckDbClient, "start_file_loads", _start_file_loads):
+        info = p.run(data, table_name="items", loader_file_format="parquet")
+    info.raise_on_failed_jobs()
+    # all files of a table are loaded together
+    assert len(started_files) == 1
+    assert started_files[0] > 1
+    with p.sql_client() as client:
+        assert client.execute_sql("SELECT count(*), count(name) FROM items")[0] == (100, 50)
+        assert client.execute_sql("SELECT current_setting('threads')")[0][0] == 2
+        assert client.execute_sql("SELECT current_setting('memory_limit')")[0][0].startswith("1")
+
+
+def test_duckdb_does_not_group_insert_values_files() -> None:
+    os.environ["DATA_WRITER__FILE_MAX_ITEMS"] = "2"
+    started_groups = []
+    start_file_loads = DuckDbClient.start_file_loads
+
+    def _start_file_loads(client, table, file_paths, load_id):
+        started_groups.append(file_paths)
+        return start_file_loads(client, table, file_paths, load_id)
+
+    # insert_values is the default format, such files are loaded one by one
+    p = dlt.pipeline(pipeline_name="many_insert_values_files", destination="duckdb", full_refresh=True)
+    with patch.object(DuckDbClient, "start_file_loads", _start_file_loads):
+        info = p.run([{"id": idx} for idx in range(10)], table_name="items")
+    info.raise_on_failed_jobs()
+    assert started_groups == []
+    with p.sql_client() as client:
+        assert client.execute_sql("SELECT count(*), count(DISTINCT id) FROM items")[0] == (10, 10)
+
+
+def test_duckdb_load_many_parquet_files_without_insert_by_name() -> None:
+    os.environ["DATA_WRITER__FILE_MAX_ITEMS"] = "10"
+    executed_sql = []
+    execute_sql = DuckDbSqlClient.execute_sql
+
+    def _execute_sql(client, sql, *args, **kwargs):
+        executed_sql.append(sql)
+        return execute_sql(client, sql, *args, **kwargs)
+
+    # older duckdb versions load files one by one
+    p = dlt.pipeline(pipeline_name="many_parquet_files_by_file", destination="duckdb", full_refresh=True)
+    with patch.object(DuckDbClient, "supports_insert_by_name", return_value=False), patch.object(DuckDbSqlClient, "execute_sql", _execute_sql):
+        info = p.run([{"id": idx} for idx in range(100)], table_name="items", loader_file_format="parquet")
+    info.raise_on_failed_jobs()
+    assert not any("BY NAME" in sql for sql in executed_sql)
+    with p.sql_client() as client:
+        assert client.execute_sql("SELECT count(*) FROM items")[0][0] == 100
+
+
 def delete_quack_db() -> None:
     if os.path.isfile(DEFAULT_DUCK_DB_NAME):
         os.remove(DEFAULT_DUCK_DB_NAME)
+
+
+def test_duckdb_staging_optimized_replace_keeps_constraints() -> None:
+    os.environ["DESTINATION__REPLACE_STRATEGY"] = "staging-optimized"
+    os.environ["DESTINATION__DUCKDB__CREATE_INDEXES"] = "true"
+
+    @dlt.resource(write_disposition="replace", columns={"id": {"data_type": "bigint", "nullable": False, "unique": True}})
+    def items(n: int):
+        yield from ({"id": idx, "name": f"item {idx}"} for idx in range(n))
+
+    generated_sql = []
+    generate_sql = DuckDbStagingCopyJob.generate_sql
+
+    def _generate_sql(cls, table_chain, sql_client):
+        sql = generate_sql(table_chain, sql_client)
+        generated_sql.extend(sql)
+        return sql
+
+    p = dlt.pipeline(pipeline_name="replace_constraints", destination="duckdb", full_refresh=True)
+    with patch.object(DuckDbStagingCopyJob, "generate_sql", classmethod(_generate_sql)):
+        p.run(items(3))
+        p.run(items(2))
+    # destination table was kept and replaced in a transaction
+    assert generated_sql[0] == "BEGIN TRANSACTION;"
+    assert not any("CREATE" in sql for sql in generated_sql)
+    assert_table(p, "items", [0, 1])
+    with p.sql_client() as client:
+        rows = client.execute_sql("SELECT is_nullable FROM information_schema.columns WHERE table_schema = %s AND table_name = 'items' AND column_name = 'id'", p.dataset_name)
+        assert rows == [("NO",)]
+        constraints = client.execute_sql("SELECT constraint_type FROM duckdb_constraints() WHERE schema_name = %s AND table_name = 'items'", p.dataset_name)
+        assert ("UNIQUE",) in constraints
+        # the unique constraint is enforced
+        with pytest.raises(Exception):
+            client.execute_sql(f"INSERT INTO {client.make_qualified_table_name('items')} (id, name, _dlt_load_id, _dlt_id) VALUES (0, 'dup', '1', 'x');")
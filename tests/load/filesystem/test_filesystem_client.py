@@ -1,12 +1,22 @@
+import asyncio
+import os
 import posixpath
-from typing import Sequence, Tuple, List
+import shutil
+from typing import Any, Dict, Sequence, Tuple, List
+from unittest.mock import patch
 
 import pytest
-from dlt.common.utils import digest128
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dlt.common.schema import Schema
+from dlt.common.utils import digest128, uniq_id
+from dlt.common.configuration.exceptions import ConfigurationValueError
 from dlt.common.storages import LoadStorage, FileStorage
 from dlt.common.destination.reference import LoadJob
 
 from dlt.destinations.filesystem.filesystem import FilesystemClient, LoadFilesystemJob, FilesystemClientConfiguration
+from dlt.destinations.filesystem.filesystem_client import put_files
 from dlt.load import Load
 from dlt.destinations.job_impl import EmptyLoadJob
 
@@ -36,6 +46,18 @@ def test_filesystem_configuration() -> None:
     assert FilesystemClientConfiguration(bucket_url="s3://cool").fingerprint() == digest128("s3://cool")
 
 
+@pytest.mark.parametrize('layout', (
+    "{table_name}/{load_id}.{ext}",
+    "{load_id}/{table_name}.{file_id}.{ext}",
+    "{table_name}/{partition}/{file_id}.{ext}"
+))
+def test_filesystem_configuration_wrong_layout(layout: str) -> None:
+    config = FilesystemClientConfiguration(bucket_url="_storage")
+    config.layout = layout
+    with pytest.raises(ConfigurationValueError):
+        config.on_resolved()
+
+
 @pytest.mark.parametrize('write_disposition', ('replace', 'append', 'merge'))
 def test_successful_load(write_disposition: str, all_buckets_env: str, filesystem_client: FilesystemClient) -> None:
     """Test load is successful with an empty destination dataset"""
@@ -102,6 +124,144 @@ def test_append_write_disposition(all_buckets_env: str, filesystem_client: Files
     assert list(sorted(client.fs_client.ls(root_path, detail=False))) == expected_files
 
 
+def test_upload_many_files(all_buckets_env: str, filesystem_client: FilesystemClient) -> None:
+    client = filesystem_client
+    load = setup_loader(client.config.dataset_name)
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    # add more files of the event_user table
+    new_jobs_path = load.load_storage.storage.make_full_path(load.load_storage._get_job_folder_path(load_id, LoadStorage.NEW_JOBS_FOLDER))
+    for file_id in ["a" * 32, "b" * 32, "c" * 32]:
+        shutil.copy(os.path.join(new_jobs_path, NORMALIZED_FILES[0]), os.path.join(new_jobs_path, f"event_user.{file_id}.0.jsonl"))
+    client.schema = schema
+    client.initialize_storage()
+
+    files = [f for f in load.load_storage.list_new_jobs(load_id) if LoadStorage.parse_job_file_name(f).table_name == "event_user"]
+    assert len(files) == 4
+    jobs = Load.w_spool_jobs(load, files, load_id, schema)
+    assert len(jobs) == 4
+    for job in jobs:
+        assert isinstance(job, LoadFilesystemJob)
+        assert job.state() == "completed"
+        assert client.fs_client.isfile(posixpath.join(client.dataset_path, job.destination_file_name))
+
+
+def test_put_files_multipart_s3(tmp_path) -> None:
+    s3fs = pytest.importorskip("s3fs")
+    fs_client = s3fs.S3FileSystem(key="key", secret="secret")
+    # 5 parts of 8 bytes, last one shorter
+    local_path = tmp_path / "large.parquet"
+    local_path.write_bytes(bytes(range(37)))
+    small_path = tmp_path / "small.jsonl"
+    small_path.write_bytes(b"{}")
+    calls: List[Tuple[str, Dict[str, Any]]] = []
+    in_flight = [0, 0]
+
+    async def _call_s3(method: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        calls.append((method, kwargs))
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        if method == "create_multipart_upload":
+            return {"UploadId": "upload_id"}
+        if method == "upload_part":
+            return {"ETag": f"etag_{kwargs['PartNumber']}"}
+        return {}
+
+    with patch.object(fs_client, "_call_s3", _call_s3):
+        put_files(fs_client, [str(local_path), str(small_path)], ["s3://bucket/large.parquet", "s3://bucket/small.jsonl"], 2, 8)
+
+    parts = {kwargs["PartNumber"]: kwargs["Body"] for method, kwargs in calls if method == "upload_part"}
+    assert b"".join(parts[n] for n in sorted(parts)) == bytes(range(37))
+    assert len(parts) == 5
+    completed = [kwargs for method, kwargs in calls if method == "complete_multipart_upload"]
+    assert completed[0]["MultipartUpload"]["Parts"] == [{"PartNumber": n, "ETag": f"etag_{n}"} for n in range(1, 6)]
+    assert [kwargs["Key"] for method, kwargs in calls if method == "put_object"] == ["small.jsonl"]
+    # concurrency limit was kept
+    assert in_flight[1] == 2
+
+
+def test_partitioned_layout(all_buckets_env: str) -> None:
+    os.environ["DESTINATION__FILESYSTEM__LAYOUT"] = "{table_name}/load_date={load_date}/{load_id}.{file_id}.{ext}"
+    client = get_client_instance(Schema("test_schema"), "test_" + uniq_id())
+    try:
+        jobs, root_path, load_id = perform_load(client, NORMALIZED_FILES, write_disposition="replace")
+        load_date = LoadFilesystemJob.make_load_date(load_id)
+        for job in jobs:
+            table_name = LoadStorage.parse_job_file_name(job.file_name()).table_name
+            assert job.destination_file_name.startswith(f"{table_name}/load_date={load_date}/{load_id}.")
+            assert client.fs_client.isfile(posixpath.join(root_path, job.destination_file_name))
+
+        # replace lists and truncates only the folder of the replaced table
+        _, _, load_id2 = perform_load(client, [NORMALIZED_FILES[0]], write_disposition="replace")
+        assert set(client.list_table_files(["event_user"])) == {
+            posixpath.join(root_path, LoadFilesystemJob.make_destination_filename(NORMALIZED_FILES[0], client.schema.name, load_id2, client.config.layout))
+        }
+        assert len(client.list_table_files(["event_loop_interrupted"])) == 1
+    finally:
+        client.fs_client.rm(client.dataset_path, recursive=True)
+
+
+def test_compact_table_files(all_buckets_env: str) -> None:
+    os.environ["DESTINATION__FILESYSTEM__LAYOUT"] = "{table_name}/{load_id}.{file_id}.{ext}"
+    os.environ["DESTINATION__FILESYSTEM__COMPACTION_MIN_FILES"] = "3"
+    client = get_client_instance(Schema("test_schema"), "test_" + uniq_id())
+    try:
+        client.initialize_storage()
+        # three small files, last one with an additional column
+        for idx in range(3):
+            table = pa.table({"id": [idx * 2, idx * 2 + 1]} if idx < 2 else {"id": [4, 5], "name": ["a", "b"]})
+            client.fs_client.makedirs(posixpath.join(client.dataset_path, "items"), exist_ok=True)
+            with client.fs_client.open(posixpath.join(client.dataset_path, "items", f"{idx}.{uniq_id()}.parquet"), "wb") as f:
+                pq.write_table(table, f)
+        # too few files to compact
+        client.fs_client.makedirs(posixpath.join(client.dataset_path, "other"), exist_ok=True)
+        for idx in range(2):
+            with client.fs_client.open(posixpath.join(client.dataset_path, "other", f"{idx}.{uniq_id()}.parquet"), "wb") as f:
+                pq.write_table(pa.table({"id": [idx]}), f)
+
+        client.compact_table_files(["items", "other"])
+
+        items_files = list(client.list_table_files(["items"]))
+        assert len(items_files) == 1
+        assert posixpath.basename(items_files[0]).startswith("0.")
+        with client.fs_client.open(items_files[0], "rb") as f:
+            merged = pq.read_table(f)
+        assert sorted(merged.column("id").to_pylist()) == list(range(6))
+        assert merged.column("name").to_pylist().count(None) == 4
+        assert len(client.list_table_files(["other"])) == 2
+    finally:
+        client.fs_client.rm(client.dataset_path, recursive=True)
+
+
+def test_compact_load_files(all_buckets_env: str) -> None:
+    os.environ["DESTINATION__FILESYSTEM__LAYOUT"] = "{table_name}/{load_id}.{file_id}.{ext}"
+    os.environ["DESTINATION__FILESYSTEM__COMPACTION_MIN_FILES"] = "2"
+    client = get_client_instance(Schema("test_schema"), "test_" + uniq_id())
+    try:
+        client.initialize_storage()
+        # both tables have enough small files but only "items" got files in the completed load
+        for table_name, load_ids in [("items", ["1000", "2000"]), ("other", ["1000", "1500"])]:
+            client.fs_client.makedirs(posixpath.join(client.dataset_path, table_name), exist_ok=True)
+            for idx, load_id in enumerate(load_ids):
+                with client.fs_client.open(posixpath.join(client.dataset_path, table_name, f"{load_id}.{uniq_id()}.parquet"), "wb") as f:
+                    pq.write_table(pa.table({"id": [idx]}), f)
+
+        with patch.object(client.fs_client, "find", wraps=client.fs_client.find) as find:
+            client.compact_table_files(["items", "other"], "2000")
+        # only the folders of the load were listed
+        assert find.call_count == 0
+
+        items_files = list(client.list_table_files(["items"]))
+        assert len(items_files) == 1
+        assert posixpath.basename(items_files[0]).startswith("1000.")
+        with client.fs_client.open(items_files[0], "rb") as f:
+            assert sorted(pq.read_table(f).column("id").to_pylist()) == [0, 1]
+        assert len(client.list_table_files(["other"])) == 2
+    finally:
+        client.fs_client.rm(client.dataset_path, recursive=True)
+
+
 def perform_load(
     client: FilesystemClient, cases: Sequence[str], write_disposition: str='append'
 ) -> Tuple[List[LoadJob], str, str]:
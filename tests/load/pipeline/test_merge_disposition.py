@@ -2,6 +2,7 @@ from copy import copy
 import itertools
 import random
 from typing import List
+from unittest.mock import patch
 import pytest
 import yaml
 
@@ -56,6 +57,29 @@ def test_merge_on_keys_in_schema(destination_name: str) -> None:
     assert eth_2_counts == eth_3_counts
 
 
+@pytest.mark.parametrize('destination_name', ALL_DESTINATIONS)
+def test_merge_with_in_subquery_deletes(destination_name: str) -> None:
+    p = dlt.pipeline(destination=destination_name, dataset_name="eth_2", full_refresh=True)
+
+    with open("tests/common/cases/schemas/eth/ethereum_schema_v5.yml", "r", encoding="utf-8") as f:
+        schema = dlt.Schema.from_dict(yaml.safe_load(f))
+
+    with open("tests/normalize/cases/ethereum.blocks.9c1d9b504ea240a482b007788d5cd61c_2.json", "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    info = p.run(data, table_name="blocks", write_disposition="merge", schema=schema)
+    assert_load_info(info)
+    eth_1_counts = load_table_counts(p, *[t["name"] for t in p.default_schema.data_tables()])
+    # merge child tables deleting with IN subqueries instead of DELETE ... USING
+    with p.sql_client() as client:
+        capabilities = type(client).capabilities
+    with patch.object(capabilities, "supports_delete_using", False):
+        info = p.run(data, table_name="blocks", write_disposition="merge", schema=schema)
+    assert_load_info(info)
+    eth_2_counts = load_table_counts(p, *[t["name"] for t in p.default_schema.data_tables()])
+    assert eth_1_counts == eth_2_counts
+
+
 @pytest.mark.parametrize('destination_name', ALL_DESTINATIONS)
 def test_merge_on_ad_hoc_primary_key(destination_name: str) -> None:
     p = dlt.pipeline(destination=destination_name, dataset_name="github_1", full_refresh=True)
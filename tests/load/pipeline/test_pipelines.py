@@ -2,6 +2,7 @@ from copy import deepcopy
 import gzip
 import os
 from typing import Any, Callable, Iterator, Tuple
+from unittest.mock import patch
 import pytest
 
 import dlt
@@ -12,6 +13,8 @@ from dlt.common.schema.schema import Schema
 from dlt.common.schema.typing import VERSION_TABLE_NAME
 from dlt.common.typing import TDataItem
 from dlt.common.utils import uniq_id
+from dlt.destinations.job_client_impl import SqlJobClientBase
+from dlt.destinations.sql_client import SqlClientBase
 from dlt.extract.exceptions import ResourceNameMissing
 from dlt.extract.source import DltSource
 from dlt.pipeline.exceptions import CannotRestorePipelineException, PipelineConfigMissing, PipelineStepFailed
@@ -346,6 +349,72 @@ def test_dataset_name_change(destination_name: str) -> None:
             # delete_dataset(client, ds_3_name)  # will be deleted by the fixture
 
 
+@pytest.mark.parametrize('destination_name', ALL_DESTINATIONS)
+def test_skip_schema_update_if_schema_stored(destination_name: str) -> None:
+
+    @dlt.resource(write_disposition="merge", primary_key="id")
+    def items():
+        yield [{"id": idx, "name": f"item {idx}"} for idx in range(3)]
+
+    updated_datasets = []
+    update_storage_schema = SqlJobClientBase.update_storage_schema
+
+    def _update_storage_schema(self: SqlJobClientBase, *args: Any, **kwargs: Any) -> Any:
+        updated_datasets.append(self.sql_client.dataset_name)
+        return update_storage_schema(self, *args, **kwargs)
+
+    p = dlt.pipeline(destination=destination_name, dataset_name="schema_cache" + uniq_id(), full_refresh=False)
+    with patch.object(SqlJobClientBase, "update_storage_schema", _update_storage_schema):
+        assert_load_info(p.run(items()))
+        # main and staging dataset were updated
+        assert len(updated_datasets) == 2
+        updated_datasets.clear()
+        # schema did not change so it is found in destination with a single lookup
+        assert_load_info(p.run(items()))
+        assert updated_datasets == []
+        assert load_table_counts(p, "items") == {"items": 3}
+
+        # dataset dropped behind the loader back
+        with p.sql_client() as client:
+            delete_dataset(client, p.dataset_name)
+        assert_load_info(p.run(items()))
+        assert len(updated_datasets) == 1
+        assert load_table_counts(p, "items") == {"items": 3}
+
+
+@pytest.mark.parametrize('destination_name', ALL_DESTINATIONS)
+def test_staging_dataset_per_load(destination_name: str) -> None:
+    os.environ["LOAD__STAGING_DATASET_PER_LOAD"] = "true"
+
+    @dlt.resource(write_disposition="merge", primary_key="id")
+    def items(start: int):
+        yield [{"id": idx, "name": f"item {idx}", "tags": [idx, idx + 1]} for idx in range(start, start + 3)]
+
+    staging_datasets = []
+    update_storage_schema = SqlJobClientBase.update_storage_schema
+
+    def _update_storage_schema(self: SqlJobClientBase, *args: Any, **kwargs: Any) -> Any:
+        if self.sql_client.dataset_name != p.dataset_name:
+            staging_datasets.append(self.sql_client.dataset_name)
+        return update_storage_schema(self, *args, **kwargs)
+
+    p = dlt.pipeline(destination=destination_name, dataset_name="staging_per_load" + uniq_id(), full_refresh=False)
+    with patch.object(SqlJobClientBase, "update_storage_schema", _update_storage_schema):
+        info = p.run(items(0))
+        assert_load_info(info)
+        assert_load_info(p.run(items(1)))
+    assert load_table_counts(p, "items", "items__tags") == {"items": 4, "items__tags": 8}
+    # each package got its own staging dataset
+    assert len(staging_datasets) == 2
+    assert staging_datasets[0] == SqlClientBase.make_staging_dataset_name(p.dataset_name, info.loads_ids[0])
+    assert staging_datasets[0] != staging_datasets[1]
+    # and the staging datasets were dropped
+    with p.sql_client() as client:
+        for staging_dataset in staging_datasets:
+            with client.with_alternative_dataset_name(staging_dataset):
+                assert not client.has_dataset()
+
+
 # do not remove - it allows us to filter tests by destination
 @pytest.mark.parametrize('destination_name', ALL_DESTINATIONS_SUBSET(["postgres"]))
 def test_pipeline_explicit_destination_credentials(destination_name: str) -> None:
@@ -1,6 +1,7 @@
 import base64
+import contextlib
 import os
-from typing import Iterator
+from typing import Any, Dict, Iterator, List
 import pytest
 from unittest.mock import patch
 
@@ -10,10 +11,13 @@ from dlt.common.schema.typing import VERSION_TABLE_NAME
 from dlt.common.storages import FileStorage
 from dlt.common.storages.schema_storage import SchemaStorage
 from dlt.common.utils import uniq_id
+from dlt.common.schema import Schema
+from dlt.common.configuration.specs import AwsCredentialsWithoutDefaults
 
 from dlt.destinations.exceptions import DatabaseTerminalException
-from dlt.destinations.redshift.configuration import RedshiftCredentials
-from dlt.destinations.redshift.redshift import RedshiftClient, psycopg2
+from dlt.destinations.job_impl import EmptyLoadJob
+from dlt.destinations.redshift.configuration import RedshiftClientConfiguration, RedshiftCredentials
+from dlt.destinations.redshift.redshift import RedshiftClient, RedshiftSqlClient, psycopg2
 
 from tests.common.utils import COMMON_TEST_CASES_PATH
 from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage, skipifpypy
@@ -31,6 +35,64 @@ def client() -> Iterator[RedshiftClient]:
     yield from yield_client_with_storage("redshift")
 
 
+class _FakeBucketFs:
+    """Keeps manifests written to the bucket in memory"""
+
+    def __init__(self, fail_rm: bool = False) -> None:
+        self.fail_rm = fail_rm
+        self.files: Dict[str, str] = {}
+        self.written: Dict[str, str] = {}
+
+    def size(self, path: str) -> int:
+        return 1024
+
+    def write_text(self, path: str, value: str) -> None:
+        self.files[path] = self.written[path] = value
+
+    def rm(self, path: str) -> None:
+        if self.fail_rm:
+            raise PermissionError(path)
+        del self.files[path]
+
+
+def test_copy_many_files_with_manifest(tmp_path: Any) -> None:
+    config = RedshiftClientConfiguration(dataset_name="test_" + uniq_id(), credentials=RedshiftCredentials())
+    config.staging_credentials = AwsCredentialsWithoutDefaults()
+    config.staging_credentials.aws_access_key_id = "key"
+    config.staging_credentials.aws_secret_access_key = "secret"
+    client = RedshiftClient(Schema("event"), config)
+    file_paths: List[str] = []
+    for idx in range(3):
+        file_path = tmp_path / f"event_test_table.{uniq_id()}.0.reference"
+        file_path.write_text(f"s3://bucket/dataset/event_test_table/{idx}.parquet", encoding="utf-8")
+        file_paths.append(str(file_path))
+    statements: List[str] = []
+
+    @contextlib.contextmanager
+    def _begin_transaction(sql_client: RedshiftSqlClient) -> Iterator[RedshiftSqlClient]:
+        yield sql_client
+
+    def _execute_sql(sql_client: RedshiftSqlClient, sql: str, *args: Any, **kwargs: Any) -> None:
+        statements.append(sql)
+
+    for fail_rm in [False, True]:
+        statements.clear()
+        fs = _FakeBucketFs(fail_rm=fail_rm)
+        with patch("dlt.destinations.redshift.redshift.url_to_fs", return_value=(fs, "bucket")), \
+                patch.object(RedshiftSqlClient, "begin_transaction", _begin_transaction), patch.object(RedshiftSqlClient, "execute_sql", _execute_sql):
+            # manifest that cannot be removed does not fail the loaded files
+            jobs = list(client.start_file_loads({"name": "event_test_table", "columns": {}}, file_paths, uniq_id()))
+        assert len(statements) == 1
+        assert all(isinstance(job, EmptyLoadJob) and job.state() == "completed" for job in jobs)
+        manifest_path, manifest = next(iter(fs.written.items()))
+        assert manifest_path.startswith("s3://bucket/dataset/event_test_table/event_test_table.")
+        assert [entry["url"] for entry in json.loads(manifest)["entries"]] == [f"s3://bucket/dataset/event_test_table/{idx}.parquet" for idx in range(3)]
+        assert f"FROM '{manifest_path}'" in statements[0]
+        assert "MANIFEST" in statements[0]
+        # manifest removed unless removal failed
+        assert (manifest_path in fs.files) is fail_rm
+
+
 def test_postgres_and_redshift_credentials_defaults() -> None:
     red_cred = RedshiftCredentials()
     assert red_cred.port == 5439
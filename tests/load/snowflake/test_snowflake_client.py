@@ -0,0 +1,65 @@
+import contextlib
+from typing import Iterator, List
+from unittest.mock import patch
+
+import pytest
+
+from dlt.common.utils import uniq_id
+from dlt.common.schema import Schema
+from dlt.common.configuration.specs import AwsCredentialsWithoutDefaults
+from dlt.destinations.job_impl import EmptyLoadJob
+from dlt.destinations.snowflake.snowflake import SnowflakeClient, SnowflakeStagingCopyJob
+from dlt.destinations.snowflake.sql_client import SnowflakeSqlClient
+from dlt.destinations.snowflake.configuration import SnowflakeClientConfiguration, SnowflakeCredentials
+
+
+@pytest.fixture
+def snowflake_client() -> SnowflakeClient:
+    # return client without opening connection
+    creds = SnowflakeCredentials()
+    config = SnowflakeClientConfiguration(dataset_name="test_" + uniq_id(), credentials=creds)
+    config.staging_credentials = AwsCredentialsWithoutDefaults()
+    config.staging_credentials.aws_access_key_id = "key"
+    config.staging_credentials.aws_secret_access_key = "secret"
+    return SnowflakeClient(Schema("event"), config)
+
+
+def test_copy_many_files_with_single_statement(snowflake_client: SnowflakeClient, tmp_path) -> None:
+    file_paths: List[str] = []
+    for idx, ext in enumerate(["parquet", "parquet", "parquet", "jsonl"]):
+        file_path = tmp_path / f"event_test_table.{uniq_id()}.0.reference"
+        file_path.write_text(f"s3://bucket/dataset/event_test_table/{idx}.{ext}", encoding="utf-8")
+        file_paths.append(str(file_path))
+    statements: List[str] = []
+
+    @contextlib.contextmanager
+    def _begin_transaction(sql_client: SnowflakeSqlClient) -> Iterator[SnowflakeSqlClient]:
+        yield sql_client
+
+    def _execute_sql(sql_client: SnowflakeSqlClient, sql: str, *args, **kwargs) -> None:
+        statements.append(sql)
+
+    with patch.object(SnowflakeSqlClient, "begin_transaction", _begin_transaction), patch.object(SnowflakeSqlClient, "execute_sql", _execute_sql):
+        jobs = list(snowflake_client.start_file_loads({"name": "event_test_table", "columns": {}}, file_paths, uniq_id()))
+
+    # parquet files loaded together, jsonl file separately
+    assert len(statements) == 2
+    assert {job.file_name() for job in jobs} == {file_path.split("/")[-1] for file_path in file_paths}
+    assert all(job.state() == "completed" for job in jobs)
+    assert sum(isinstance(job, EmptyLoadJob) for job in jobs) == 3
+    copy_many = next(sql for sql in statements if "FILES" in sql)
+    assert "FROM 's3://bucket/'" in copy_many
+    assert "FILES = ('dataset/event_test_table/0.parquet', 'dataset/event_test_table/1.parquet', 'dataset/event_test_table/2.parquet')" in copy_many
+    assert "TYPE = 'PARQUET'" in copy_many
+    copy_single = next(sql for sql in statements if "FILES" not in sql)
+    assert "FROM 's3://bucket/dataset/event_test_table/3.jsonl'" in copy_single
+
+
+def test_staging_copy_job_swaps_tables(snowflake_client: SnowflakeClient) -> None:
+    sql = SnowflakeStagingCopyJob.generate_sql([{"name": "event_test_table", "columns": {}}], snowflake_client.sql_client)
+    table_name = snowflake_client.sql_client.make_qualified_table_name("event_test_table")
+    with snowflake_client.sql_client.with_staging_dataset(staging=True):
+        staging_table_name = snowflake_client.sql_client.make_qualified_table_name("event_test_table")
+    assert sql[0] == f"ALTER TABLE {table_name} SWAP WITH {staging_table_name};"
+    # old data is removed from the staging table
+    assert staging_table_name in sql[1]
@@ -6,14 +6,16 @@ from typing import List, Sequence, Tuple
 import pytest
 from unittest.mock import patch
 
-from dlt.common.exceptions import TerminalException, TerminalValueError
+from dlt.common.exceptions import DestinationTerminalException, TerminalException, TerminalValueError
 from dlt.common.schema import Schema
 from dlt.common.storages import FileStorage, LoadStorage
 from dlt.common.storages.load_storage import JobWithUnsupportedWriterException
 from dlt.common.utils import uniq_id
-from dlt.common.destination.reference import DestinationReference, LoadJob
+from dlt.common.destination.reference import DestinationReference, LoadJob, PolledJob
 
 from dlt.load import Load
+from dlt.load.client_pool import JobClientPool
+from dlt.load.job_poller import JobPoller
 from dlt.destinations.job_impl import EmptyLoadJob
 
 from dlt.destinations import dummy
@@ -186,12 +188,13 @@ def test_spool_job_retry_spool_new() -> None:
         load.load_storage,
         NORMALIZED_FILES
     )
-    # call higher level function that returns jobs and counts
+    # call higher level function that starts jobs in the pool
     with ThreadPool() as pool:
         load.pool = pool
-        jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-        assert jobs_count == 2
+        results = load.start_new_jobs(load_id, schema, load.config.workers, set())
+        jobs = [job for result in results for job in result.get()]
         assert len(jobs) == 2
+        assert all(job.state() == "retry" for job in jobs)
 
 
 def test_spool_job_retry_started() -> None:
@@ -253,8 +256,8 @@ def test_try_retrieve_job() -> None:
         NORMALIZED_FILES
     )
     load.pool = ThreadPool()
-    jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-    assert jobs_count == 2
+    results = load.start_new_jobs(load_id, schema, load.config.workers, set())
+    assert len([job for result in results for job in result.get()]) == 2
     # now jobs are known
     with load.destination.client(schema, load.initial_client_config) as c:
         job_count, jobs = load.retrieve_jobs(c, load_id)
@@ -314,6 +317,228 @@ def test_retry_on_new_loop() -> None:
             assert LoadStorage.parse_job_file_name(fn).retry_count == 2
 
 
+def test_continuous_spool() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load.config.workers = 2
+    load_id, schema = prepare_load_package(
+        load.load_storage,
+        NORMALIZED_FILES
+    )
+    new_jobs_path = load.load_storage._get_job_folder_path(load_id, LoadStorage.NEW_JOBS_FOLDER)
+    for i in range(10):
+        load.load_storage.storage.save(os.path.join(new_jobs_path, f"event_user.{uniq_id()}.0.jsonl"), "{}")
+    started_counts: List[int] = []
+    start_file_load = dummy_impl.DummyClient.start_file_load
+
+    def _start_file_load(client, table, file_path, load_id_):
+        started_counts.append(len(load.load_storage.list_started_jobs(load_id)))
+        return start_file_load(client, table, file_path, load_id_)
+
+    with patch.object(dummy_impl.DummyClient, "start_file_load", _start_file_load):
+        with ThreadPool() as pool:
+            # all jobs are completed in a single run
+            load.run(pool)
+            assert len(load.load_storage.list_new_jobs(load_id)) == 0
+            assert len(load.load_storage.list_started_jobs(load_id)) == 0
+            assert len(load.load_storage.get_load_package_info(load_id).jobs["completed_jobs"]) == 12
+    # never more than workers jobs in flight
+    assert len(started_counts) == 12
+    assert max(started_counts) < load.config.workers
+
+
+def test_reuse_clients() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    opened: List[dummy_impl.DummyClient] = []
+    closed: List[dummy_impl.DummyClient] = []
+
+    def _enter(client):
+        opened.append(client)
+        return client
+
+    def _exit(client, exc_type, exc_val, exc_tb):
+        closed.append(client)
+
+    with patch.object(dummy_impl.DummyClient, "__enter__", _enter), patch.object(dummy_impl.DummyClient, "__exit__", _exit):
+        for _ in range(2):
+            load_id, _ = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+        # packages share the schema so clients are reused across jobs and packages
+        run_all(load)
+        assert len(opened) <= 3
+        assert len(load.load_storage.list_completed_packages()) == 2
+        # all clients closed when there are no more packages
+        assert set(map(id, opened)) == set(map(id, closed))
+
+    # do not reuse
+    opened.clear()
+    closed.clear()
+    load.client_pool = None
+    with patch.object(dummy_impl.DummyClient, "__enter__", _enter), patch.object(dummy_impl.DummyClient, "__exit__", _exit):
+        prepare_load_package(load.load_storage, NORMALIZED_FILES)
+        run_all(load)
+        # schema update, two jobs, two completed table chains, retrieve jobs in the next run, complete load
+        assert len(opened) == 7
+
+
+def test_spool_jobs_many_files_per_copy() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, _ = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    # add more files of the event_user table
+    new_jobs_path = load.load_storage._get_job_folder_path(load_id, LoadStorage.NEW_JOBS_FOLDER)
+    for file_id in ["a" * 32, "b" * 32, "c" * 32]:
+        shutil.copy(
+            load.load_storage.storage.make_full_path(os.path.join(new_jobs_path, NORMALIZED_FILES[0])),
+            load.load_storage.storage.make_full_path(os.path.join(new_jobs_path, f"event_user.{file_id}.0.jsonl"))
+        )
+    started_groups: List[Sequence[str]] = []
+    start_file_loads = dummy_impl.DummyClient.start_file_loads
+
+    def _start_file_loads(client, table, file_paths, load_id):
+        started_groups.append(file_paths)
+        return start_file_loads(client, table, file_paths, load_id)
+
+    with patch.object(dummy_impl.DummyClient, "start_file_loads", _start_file_loads), patch.object(dummy_impl.DummyClient, "get_max_files_per_copy_job", return_value=3):
+        run_all(load)
+    # three of four event_user files are started together, remaining files are started one by one
+    assert len(started_groups) == 1
+    assert len(started_groups[0]) == 3
+    assert all(os.path.basename(file_path).startswith("event_user.") for file_path in started_groups[0])
+    assert load.load_storage.storage.has_folder(load.load_storage.get_completed_package_path(load_id))
+    completed_jobs = load.load_storage.storage.list_folder_files(
+        load.load_storage._get_job_folder_completed_path(load_id, "completed_jobs")
+    )
+    assert len(completed_jobs) == 5
+
+
+def test_spool_jobs_falls_back_only_for_files_not_started() -> None:
+    load = setup_loader()
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    new_jobs_path = load.load_storage._get_job_folder_path(load_id, LoadStorage.NEW_JOBS_FOLDER)
+    file_names = [NORMALIZED_FILES[0]]
+    for file_id in ["a" * 32, "b" * 32]:
+        file_names.append(f"event_user.{file_id}.0.jsonl")
+        shutil.copy(
+            load.load_storage.storage.make_full_path(os.path.join(new_jobs_path, NORMALIZED_FILES[0])),
+            load.load_storage.storage.make_full_path(os.path.join(new_jobs_path, file_names[-1]))
+        )
+    started_files: List[str] = []
+    start_file_load = dummy_impl.DummyClient.start_file_load
+
+    def _start_file_load(client, table, file_path, load_id):
+        started_files.append(os.path.basename(file_path))
+        if os.path.basename(file_path) == file_names[1]:
+            raise DestinationTerminalException("bad file")
+        return start_file_load(client, table, file_path, load_id)
+
+    # the default start_file_loads starts files one by one so the first file is loaded when the second one fails
+    with patch.object(dummy_impl.DummyClient, "start_file_load", _start_file_load):
+        jobs = Load.w_spool_jobs(load, [os.path.join(new_jobs_path, file_name) for file_name in file_names], load_id, schema)
+    assert started_files == [file_names[0], file_names[1], file_names[1], file_names[2]]
+    assert [job.file_name() for job in jobs] == [file_names[0], file_names[1], file_names[2]]
+    assert [job.state() for job in jobs] == ["running", "failed", "running"]
+
+
+def test_client_pool_lifetime_and_health() -> None:
+    pool = JobClientPool(max_lifetime=0.2, check_after=0.0)
+    client = dummy_impl.DummyClient(Schema("event"), DummyClientConfiguration())
+    created: List[int] = []
+
+    def _create_client():
+        created.append(1)
+        return client
+
+    with pool.borrow("key", _create_client) as c:
+        assert c is client
+    with pool.borrow("key", _create_client):
+        pass
+    # reused
+    assert len(created) == 1
+    # clients under other keys are not shared
+    with pool.borrow("other", _create_client):
+        pass
+    assert len(created) == 2
+    # exceeds max lifetime
+    sleep(0.3)
+    with pool.borrow("key", _create_client):
+        pass
+    assert len(created) == 3
+    # client that raised is not returned to the pool
+    with pytest.raises(ValueError):
+        with pool.borrow("key", _create_client):
+            raise ValueError()
+    with pool.borrow("key", _create_client):
+        pass
+    assert len(created) == 4
+    # unhealthy clients are replaced
+    with patch.object(JobClientPool, "_is_healthy", return_value=False):
+        with pool.borrow("key", _create_client):
+            pass
+    assert len(created) == 5
+    pool.close_all()
+    assert pool._idle == {}
+
+
+def test_client_pool_closes_clients_returned_after_close_all() -> None:
+    pool = JobClientPool(max_lifetime=60, check_after=60)
+    created: List[dummy_impl.DummyClient] = []
+
+    def _create_client():
+        created.append(dummy_impl.DummyClient(Schema("event"), DummyClientConfiguration()))
+        return created[-1]
+
+    with patch.object(JobClientPool, "_close", wraps=JobClientPool._close) as close:
+        with pool.borrow("key", _create_client) as c:
+            pool.close_all()
+            assert close.call_count == 0
+        # borrowed client is closed when returned and not kept as idle
+        close.assert_called_once_with(c)
+        assert pool._idle == {}
+        # pool can be used again after it was closed
+        with pool.borrow("key", _create_client):
+            pass
+        with pool.borrow("key", _create_client):
+            pass
+        assert len(created) == 2
+        assert close.call_count == 1
+        pool.close_all()
+        assert close.call_count == 2
+
+
+def test_job_poller_backoff() -> None:
+    polled_batches: List[int] = []
+
+    class _PolledJob(LoadJob, PolledJob):
+        @classmethod
+        def poll_states(cls, jobs: Sequence[LoadJob]) -> None:
+            polled_batches.append(len(jobs))
+
+        def state(self) -> str:
+            return "running"
+
+        def exception(self) -> str:
+            raise NotImplementedError()
+
+    jobs = [_PolledJob(f"event_user.{uniq_id()}.0.jsonl") for _ in range(3)]
+    poller = JobPoller(min_interval=0.1, max_interval=0.2)
+    # new jobs are due and are polled in single batch
+    assert poller.due_jobs(jobs) == jobs
+    assert polled_batches == [3]
+    assert poller.next_poll_in() is None
+    for job in jobs[:2]:
+        poller.backoff(job)
+    assert 0.0 < poller.next_poll_in() <= 0.1
+    assert poller.due_jobs(jobs) == jobs[2:]
+    sleep(0.1)
+    assert poller.due_jobs(jobs) == jobs
+    # interval is doubled up to max interval
+    poller.backoff(jobs[0])
+    assert poller._schedule[jobs[0].file_name()][1] == 0.2
+    poller.backoff(jobs[0])
+    assert poller._schedule[jobs[0].file_name()][1] == 0.2
+    poller.forget(jobs[0])
+    poller.forget(jobs[1])
+    assert poller.next_poll_in() is None
+
+
 def test_retry_exceptions() -> None:
     load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
     prepare_load_package(
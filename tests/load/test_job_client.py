@@ -12,11 +12,13 @@ from dlt.common.schema import Schema
 from dlt.common.schema.typing import LOADS_TABLE_NAME, VERSION_TABLE_NAME
 from dlt.common.schema.utils import new_table, new_column
 from dlt.common.storages import FileStorage
+from dlt.common.storages.load_storage import ParsedLoadJobFileName
 from dlt.common.schema import TTableSchemaColumns
 from dlt.common.utils import uniq_id
 from dlt.destinations.exceptions import DatabaseException, DatabaseTerminalException, DatabaseUndefinedRelation
 
 from dlt.destinations.job_client_impl import SqlJobClientBase
+from dlt.destinations.sql_jobs import SqlMergeJob
 
 from tests.utils import TEST_STORAGE_ROOT, ALL_DESTINATIONS, autouse_test_storage
 from tests.common.utils import load_json_case
@@ -204,6 +206,82 @@ def test_schema_update_create_table_redshift(client: SqlJobClientBase) -> None:
     assert exists is True
 
 
+@pytest.mark.parametrize('client', ALL_CLIENTS, indirect=True)
+def test_get_storage_tables(client: SqlJobClientBase) -> None:
+    schema = client.schema
+    table_names = [f"event_test_table_{idx}" for idx in range(5)]
+    for table_name in table_names:
+        schema.update_schema(new_table(table_name, columns=[schema._infer_column("sender_id", "982398490809324")]))
+    schema.bump_version()
+    client.update_storage_schema()
+
+    # query in chunks smaller than the number of tables
+    with patch.object(client, "STORAGE_TABLES_QUERY_CHUNK", 2):
+        storage_tables = client.get_storage_tables(table_names + ["not_exists", VERSION_TABLE_NAME])
+    assert set(storage_tables.keys()) == set(table_names + [VERSION_TABLE_NAME])
+    for table_name, storage_table in storage_tables.items():
+        exists, single_table = client.get_storage_table(table_name)
+        assert exists is True
+        assert storage_table == single_table
+    assert "sender_id" in storage_tables[table_names[0]]
+    assert client.get_storage_tables([]) == {}
+
+
+@pytest.mark.parametrize('replace_strategy', ["insert-from-staging", "staging-optimized"])
+@pytest.mark.parametrize('client', ALL_CLIENTS, indirect=True)
+def test_replace_table_chain_jobs(client: SqlJobClientBase, replace_strategy: str) -> None:
+    sender_id = client.schema._infer_column("sender_id", "982398490809324")
+    table_chain = [
+        new_table("event_test_table", write_disposition="replace", columns=[sender_id]),
+        new_table("event_test_table__child", parent_table_name="event_test_table", columns=[sender_id])
+    ]
+    client.config.replace_strategy = replace_strategy
+    jobs = client.create_table_chain_completed_followup_jobs(table_chain)
+    job_tables = [ParsedLoadJobFileName.parse(job.file_name()).table_name for job in jobs]
+    if client.capabilities.supports_atomic_sql_jobs:
+        # whole chain is replaced in a single job
+        assert job_tables == ["event_test_table"]
+    else:
+        # tables are replaced in separate jobs that may run in parallel
+        assert job_tables == ["event_test_table", "event_test_table__child"]
+    assert all(job.state() == "running" for job in jobs)
+
+
+@pytest.mark.parametrize('client', ALL_CLIENTS, indirect=True)
+def test_merge_job_is_idempotent(client: SqlJobClientBase) -> None:
+    schema = client.schema
+    schema.update_schema(new_table("event_test_table", write_disposition="merge", columns=[
+        {"name": "id", "data_type": "bigint", "nullable": False, "primary_key": True},
+        {"name": "value", "data_type": "text", "nullable": True}
+    ]))
+    schema.bump_version()
+    client.update_storage_schema()
+    with client.with_staging_dataset():
+        client.initialize_storage()
+        client.update_storage_schema()
+    sql_client = client.sql_client
+    table_name = sql_client.make_qualified_table_name("event_test_table")
+    with sql_client.with_staging_dataset(staging=True):
+        staging_table_name = sql_client.make_qualified_table_name("event_test_table")
+    sql_client.execute_sql(f"INSERT INTO {table_name}(id, value) VALUES (1, 'a');")
+    sql_client.execute_sql(f"INSERT INTO {staging_table_name}(id, value) VALUES (2, 'b');")
+    table = schema.get_table("event_test_table")
+
+    # delete is generated even if no keys overlap so the job may be executed again
+    sql = SqlMergeJob.generate_sql([table], sql_client)
+    assert any(stmt.startswith("DELETE") for stmt in sql)
+    assert "_dlt_dedup_rn" in sql[-1]
+    sql_client.execute_sql("\n".join(sql))
+    sql_client.execute_sql("\n".join(sql))
+    rows = sql_client.execute_sql(f"SELECT id, value FROM {table_name} ORDER BY id;")
+    assert [tuple(row) for row in rows] == [(1, "a"), (2, "b")]
+
+    # deduplication is disabled explicitly, unique hint has no effect
+    table["columns"]["id"]["unique"] = True
+    assert "_dlt_dedup_rn" in SqlMergeJob.generate_sql([table], sql_client)[-1]
+    assert "_dlt_dedup_rn" not in SqlMergeJob.generate_sql([table], sql_client, deduplicate=False)[-1]
+
+
 @pytest.mark.parametrize('client', ALL_CLIENTS_SUBSET(["bigquery_client"]), indirect=True)
 def test_schema_update_create_table_bigquery(client: SqlJobClientBase) -> None:
     # infer typical rasa event schema
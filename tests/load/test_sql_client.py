@@ -11,7 +11,7 @@ from dlt.common.storages import FileStorage
 from dlt.common.utils import derives_from_class_of_name, uniq_id
 from dlt.destinations.exceptions import DatabaseException, DatabaseTerminalException, DatabaseTransientException, DatabaseUndefinedRelation
 
-from dlt.destinations.sql_client import DBApiCursor, SqlClientBase
+from dlt.destinations.sql_client import DBApiCursor, DBApiCursorImpl, SqlClientBase
 from dlt.destinations.job_client_impl import SqlJobClientBase
 
 from tests.utils import TEST_STORAGE_ROOT, autouse_test_storage
@@ -217,6 +217,75 @@ def test_execute_df(client: SqlJobClientBase) -> None:
     assert df_3 is None
 
 
+@pytest.mark.parametrize('client', ALL_CLIENTS, indirect=True)
+def test_execute_arrow(client: SqlJobClientBase) -> None:
+    chunk_size = 50
+    total_records = 120
+
+    uniq_suffix = uniq_id()
+    client.update_storage_schema()
+    client.sql_client.execute_sql(f"CREATE TABLE tmp_{uniq_suffix} (col INT);")
+    insert_query = ",".join([f"({idx})" for idx in range(0, total_records)])
+    client.sql_client.execute_sql(f"INSERT INTO tmp_{uniq_suffix} VALUES {insert_query};")
+    with client.sql_client.execute_query(f"SELECT * FROM tmp_{uniq_suffix} ORDER BY col ASC") as curr:
+        table = curr.arrow()
+        # snowflake has all cols uppercase
+        assert [name.lower() for name in table.column_names] == ["col"]
+        assert table.column(0).to_pylist() == list(range(0, total_records))
+    # get chunked
+    with client.sql_client.execute_query(f"SELECT * FROM tmp_{uniq_suffix} ORDER BY col ASC") as curr:
+        tables = [curr.arrow(chunk_size=chunk_size) for _ in range(4)]
+    assert [t.num_rows for t in tables[:3]] == [50, 50, 20]
+    assert tables[3] is None
+    assert [v for t in tables[:3] for v in t.column(0).to_pylist()] == list(range(0, total_records))
+    # iterate
+    with client.sql_client.execute_query(f"SELECT * FROM tmp_{uniq_suffix} ORDER BY col ASC") as curr:
+        assert [t.num_rows for t in curr.iter_arrow(chunk_size)] == [50, 50, 20]
+    # no rows
+    with client.sql_client.execute_query(f"SELECT * FROM tmp_{uniq_suffix} WHERE col < 0") as curr:
+        assert curr.arrow().num_rows == 0
+    with client.sql_client.execute_query(f"SELECT * FROM tmp_{uniq_suffix} WHERE col < 0") as curr:
+        assert curr.arrow(chunk_size=chunk_size) is None
+
+
+def test_generic_cursor_arrow_and_df() -> None:
+    import sqlite3
+
+    def _cursor(query: str) -> DBApiCursorImpl:
+        native_cursor = sqlite3.connect(":memory:").cursor()
+        native_cursor.execute(query)
+        return DBApiCursorImpl(native_cursor)  # type: ignore[arg-type]
+
+    query = "SELECT NULL AS id, '{\"a\": 1}' AS doc UNION ALL SELECT NULL, NULL UNION ALL SELECT 1, 'x' UNION ALL SELECT 2, 'y'"
+    # first chunk has only nulls in id, types are taken from the first chunk that has values
+    curr = _cursor(query)
+    tables = list(curr.iter_arrow(2))
+    assert str(tables[0].schema.field("id").type) == "null"
+    assert str(tables[1].schema.field("id").type) == "int64"
+    # the schema of the previous chunk is kept
+    curr = _cursor("SELECT 1 AS id UNION ALL SELECT NULL")
+    assert [str(t.schema.field("id").type) for t in curr.iter_arrow(1)] == ["int64", "int64"]
+    # explicit schema is passed to conversion in chunked mode
+    import pyarrow
+    curr = _cursor("SELECT 1 AS id")
+    assert curr.arrow(chunk_size=10, schema=pyarrow.schema([("id", pyarrow.float64())])).schema.field("id").type == pyarrow.float64()
+
+    # values with different types in one column are converted into json strings
+    from dlt.common.libs.pyarrow import rows_to_arrow_table
+    table = rows_to_arrow_table([({"a": 1},), ({"a": "x"},)], ["doc"])
+    assert table.column(0).to_pylist() == ['{"a":1}', '{"a":"x"}']
+
+    # data frames of generic cursors do not need pyarrow
+    curr = _cursor(query)
+    df = curr.df()
+    assert list(df.columns) == ["id", "doc"]
+    assert len(df) == 4
+    curr = _cursor(query)
+    assert len(curr.df(chunk_size=3)) == 3
+    assert len(curr.df(chunk_size=3)) == 1
+    assert curr.df(chunk_size=3) is None
+
+
 @pytest.mark.parametrize('client', ALL_CLIENTS, indirect=True)
 def test_database_exceptions(client: SqlJobClientBase) -> None:
     client.update_storage_schema()
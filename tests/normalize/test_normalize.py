@@ -1,3 +1,4 @@
+import os
 import pytest
 from fnmatch import fnmatch
 from typing import Dict, Iterator, List, Sequence, Tuple
@@ -17,7 +18,7 @@ from dlt.extract.extract import ExtractorStorage
 from dlt.normalize import Normalize
 
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_TYPES
-from tests.utils import TEST_DICT_CONFIG_PROVIDER, assert_no_dict_key_starts_with, clean_test_storage, init_test_logging
+from tests.utils import TEST_DICT_CONFIG_PROVIDER, assert_no_dict_key_starts_with, clean_test_storage, init_test_logging, preserve_environ
 from tests.normalize.utils import json_case_path, INSERT_CAPS, JSONL_CAPS, DEFAULT_CAPS, ALL_CAPABILITIES
 
 
@@ -323,6 +324,29 @@ def test_normalize_twice_with_flatten(caps: DestinationCapabilitiesContext, raw_
     assert_schema(schema)
 
 
+@pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
+def test_combine_load_files(caps: DestinationCapabilitiesContext, raw_normalize: Normalize) -> None:
+    # write many small load files
+    os.environ["DATA_WRITER__FILE_MAX_ITEMS"] = "10"
+    load_id = extract_and_normalize_cases(raw_normalize, ["github.issues.load_page_5_duck"])
+    _, table_files = expect_load_package(raw_normalize.load_storage, load_id, ["issues", "issues__labels", "issues__assignees"])
+    assert len(table_files["issues"]) > 1
+    _, expected_lines = get_line_from_file(raw_normalize.load_storage, table_files["issues"], 0)
+
+    raw_normalize.config.combine_files_max_bytes = 100 * 1024 * 1024
+    load_id = extract_and_normalize_cases(raw_normalize, ["github.issues.load_page_5_duck"])
+    _, table_files = expect_load_package(raw_normalize.load_storage, load_id, ["issues", "issues__labels", "issues__assignees"], full_schema_update=False)
+    # all files of a table were combined
+    assert len(table_files["issues"]) == 1
+    assert len(table_files["issues__labels"]) == 1
+    _, lines = get_line_from_file(raw_normalize.load_storage, table_files["issues"], 0)
+    if caps.preferred_loader_file_format == "insert_values":
+        # single header instead of one per file
+        assert lines == 102
+    else:
+        assert lines == expected_lines == 100
+
+
 def test_group_worker_files() -> None:
 
     files = ["f%03d" % idx for idx in range(0, 100)]